@@ -0,0 +1,55 @@
+"""Expression indexes for case-insensitive maintainer name matching (Postgres only).
+
+``Maintainer.match_by_name`` filters ``user__username__iexact`` or an
+annotated full name ``__iexact``; on Postgres both compile to
+``UPPER(expr) = UPPER(%s)``, which neither the unique username btree nor a
+sequential scan serves well.  These indexes cover exactly those expressions.
+They're built from the same Django expressions the query uses (see
+``accounts.models.user_full_name_expression``) so the generated SQL matches.
+
+``auth_user`` belongs to ``django.contrib.auth``, so the indexes are added with
+the schema editor rather than ``Meta.indexes``.  SQLite's ``iexact`` compiles to
+``LIKE``, which can't use them, so both directions are no-ops there.
+"""
+
+from django.db import migrations, models
+from django.db.models import Value
+from django.db.models.functions import Concat, Trim, Upper
+
+USERNAME_INDEX = "auth_user_upper_username_idx"
+FULL_NAME_INDEX = "auth_user_upper_full_name_idx"
+
+
+def _indexes():
+    return [
+        models.Index(Upper("username"), name=USERNAME_INDEX),
+        models.Index(
+            Upper(Trim(Concat("first_name", Value(" "), "last_name"))),
+            name=FULL_NAME_INDEX,
+        ),
+    ]
+
+
+def forward(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    User = apps.get_model("auth", "User")
+    for index in _indexes():
+        schema_editor.add_index(User, index)
+
+
+def reverse(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    User = apps.get_model("auth", "User")
+    for index in _indexes():
+        schema_editor.remove_index(User, index)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("accounts", "0013_alter_maintainer_bio"),
+        ("auth", "0012_alter_user_first_name_max_length"),
+    ]
+
+    operations = [migrations.RunPython(forward, reverse)]
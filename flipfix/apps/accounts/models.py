@@ -7,6 +7,8 @@ from uuid import uuid4
 
 from django.conf import settings
 from django.db import models
+from django.db.models import Q, Value
+from django.db.models.functions import Concat, Trim
 from simple_history.models import HistoricalRecords
 
 from flipfix.apps.core.models import AbstractMedia, TimeStampedMixin
@@ -28,6 +30,36 @@ RESERVED_USERNAMES = frozenset(
 )
 
 
+def user_full_name_expression(prefix: str = "") -> Trim:
+    """SQL mirror of ``User.get_full_name()``: ``"first last"``, stripped.
+
+    Migration 0014 indexes ``UPPER()`` of this exact expression; change both
+    together or the index stops matching.
+    """
+    return Trim(Concat(f"{prefix}first_name", Value(" "), f"{prefix}last_name"))
+
+
+def user_account_fields(prefix: str = "") -> tuple[str, ...]:
+    """User columns that name display never reads, for ``.defer()``.
+
+    Queries that select_related a user only to show who did something pass
+    these to ``.defer()``, leaving the pk, username and first/last name.
+    ``prefix`` is the relation path to the user, e.g. ``"reported_by_user__"``.
+    """
+    return tuple(
+        f"{prefix}{name}"
+        for name in (
+            "password",
+            "last_login",
+            "is_superuser",
+            "email",
+            "is_staff",
+            "is_active",
+            "date_joined",
+        )
+    )
+
+
 class MaintainerQuerySet(models.QuerySet):
     """Custom queryset for Maintainer model."""
 
@@ -92,15 +124,17 @@ class Maintainer(TimeStampedMixin):
         Returns:
             Matching Maintainer or None if not found.
         """
-        normalized = name.lower().strip()
+        normalized = name.strip()
         if not normalized:
             return None
-        for maintainer in cls.objects.select_related("user"):
-            username = maintainer.user.username.lower()
-            full_name = (maintainer.user.get_full_name() or "").lower()
-            if normalized in {username, full_name}:
-                return maintainer
-        return None
+        # Both branches are backed by UPPER() expression indexes on auth_user
+        # (Postgres only, migration 0014), since iexact compiles to UPPER() = UPPER().
+        return (
+            cls.objects.select_related("user")
+            .annotate(full_name=user_full_name_expression("user__"))
+            .filter(Q(user__username__iexact=normalized) | Q(full_name__iexact=normalized))
+            .first()
+        )
 
 
 def generate_invitation_token() -> str:
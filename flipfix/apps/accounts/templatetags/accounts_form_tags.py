@@ -75,7 +75,7 @@ def maintainer_chip_input_field(
     Usage:
         {% maintainer_chip_input_field %}
         {% maintainer_chip_input_field label="Maintainers" %}
-        {% maintainer_chip_input_field initial_maintainers=entry.maintainers.all %}
+        {% maintainer_chip_input_field initial_maintainers=entry.maintainers_list %}
         {% maintainer_chip_input_field initial_freetext=entry.maintainer_names %}
         {% maintainer_chip_input_field errors=maintainer_errors %}
 
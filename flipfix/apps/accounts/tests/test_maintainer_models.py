@@ -25,3 +25,42 @@ class MaintainerModelTests(TestCase):
 
         maintainer.refresh_from_db()
         self.assertTrue(maintainer.is_shared_account)
+
+
+@tag("models")
+class MaintainerMatchByNameTests(TestCase):
+    """Tests for Maintainer.match_by_name()."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = create_maintainer_user(username="jdoe", first_name="Jane", last_name="Doe")
+        cls.maintainer = Maintainer.objects.get(user=cls.user)
+        create_maintainer_user(username="other", first_name="Other", last_name="Person")
+
+    def test_matches_username_case_insensitively(self):
+        """Username lookups ignore case and surrounding whitespace."""
+        self.assertEqual(Maintainer.match_by_name("  JDOE "), self.maintainer)
+
+    def test_matches_full_name_case_insensitively(self):
+        """Full name lookups ignore case."""
+        self.assertEqual(Maintainer.match_by_name("jane doe"), self.maintainer)
+
+    def test_matches_first_name_only_user(self):
+        """A user with no last name matches on first name alone, like get_full_name()."""
+        user = create_maintainer_user(username="solo", first_name="Cher", last_name="")
+        self.assertEqual(Maintainer.match_by_name("cher"), Maintainer.objects.get(user=user))
+
+    def test_partial_name_does_not_match(self):
+        """First or last name alone does not match a full-named user."""
+        self.assertIsNone(Maintainer.match_by_name("Jane"))
+
+    def test_blank_name_returns_none(self):
+        """Blank input short-circuits without a query."""
+        with self.assertNumQueries(0):
+            self.assertIsNone(Maintainer.match_by_name("   "))
+
+    def test_single_query(self):
+        """Matching runs as one query regardless of maintainer count."""
+        with self.assertNumQueries(1):
+            maintainer = Maintainer.match_by_name("Jane Doe")
+            self.assertEqual(maintainer.user.username, "jdoe")
@@ -109,13 +109,13 @@ class PasswordChangeViewTests(TestCase):
     # Test password for password change tests (intentionally hardcoded)
     TEST_OLD_PASSWORD = "oldpass123"  # noqa: S105
 
-    def setUp(self):
-        """Set up test data."""
-        self.user = create_user(
-            username="testuser", email="test@example.com", password=self.TEST_OLD_PASSWORD
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = create_user(
+            username="testuser", email="test@example.com", password=cls.TEST_OLD_PASSWORD
         )
-        self.password_change_url = reverse("password_change")
-        self.password_change_done_url = reverse("password_change_done")
+        cls.password_change_url = reverse("password_change")
+        cls.password_change_done_url = reverse("password_change_done")
 
     def test_password_change_requires_login(self):
         """Password change page should require login."""
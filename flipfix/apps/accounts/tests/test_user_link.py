@@ -80,9 +80,10 @@ class UserLinkHappyPathTests(TestCase):
 class UserLinkAutocompleteTests(SuppressRequestLogsMixin, TestDataMixin, TestCase):
     """Autocomplete API behavior for ``type=user``."""
 
-    def setUp(self):
-        super().setUp()
-        self.url = reverse("api-link-targets")
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.url = reverse("api-link-targets")
 
     def test_returns_directory_visible_user(self):
         self.client.force_login(self.maintainer_user)
@@ -318,6 +318,19 @@ class OwnerDocument(TimeStampedMixin):
         return Path(self.file.name).suffix.lower() == ".pdf"
 
 
+def machine_detail_text_fields(prefix: str = "") -> tuple[str, ...]:
+    """Long-form machine text that only detail pages render, for ``.defer()``.
+
+    List queries that select_related a machine and its model pass these to
+    ``.defer()`` to keep rows narrow.  ``prefix`` is the relation path to the
+    machine, e.g. ``"machine__"``.
+    """
+    return tuple(
+        f"{prefix}{name}"
+        for name in ("acquisition_notes", "model__educational_text", "model__sources_notes")
+    )
+
+
 class MachineInstanceQuerySet(models.QuerySet):
     """Custom queryset for MachineInstance with common filters."""
 
@@ -18,6 +18,7 @@ from flipfix.apps.catalog.views_inline import MachineInlineUpdateView
 from flipfix.apps.core.test_utils import (
     AccessControlTestCase,
     TestDataMixin,
+    create_log_entries,
     create_log_entry,
     create_machine,
     create_machine_model,
@@ -124,14 +125,17 @@ class MachineFeedFilterTests(TestDataMixin, TestCase):
 class MachineFeedSearchTests(TestDataMixin, TestCase):
     """Tests for machine feed search across all entry types."""
 
-    def setUp(self):
-        super().setUp()
-        self.feed_url = reverse("maintainer-machine-detail", kwargs={"slug": self.machine.slug})
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.feed_url = reverse("maintainer-machine-detail", kwargs={"slug": cls.machine.slug})
 
     def test_search_finds_log_by_text(self):
         """Search should find log entries by text content."""
-        create_log_entry(machine=self.machine, text="Replaced flipper coil")
-        create_log_entry(machine=self.machine, text="Adjusted targets")
+        create_log_entries(
+            {"machine": self.machine, "text": "Replaced flipper coil"},
+            {"machine": self.machine, "text": "Adjusted targets"},
+        )
 
         self.client.force_login(self.maintainer_user)
         response = self.client.get(self.feed_url, {"q": "flipper"})
@@ -155,8 +159,9 @@ class MachineFeedSearchTests(TestDataMixin, TestCase):
     def test_search_finds_log_by_maintainer_fk(self):
         """Search should find log entries by FK maintainer name."""
         maintainer = Maintainer.objects.get(user=self.maintainer_user)
-        log = create_log_entry(machine=self.machine, text="Fixed the flipper")
-        log.maintainers.add(maintainer)
+        create_log_entries(
+            {"machine": self.machine, "text": "Fixed the flipper", "maintainers": [maintainer]}
+        )
 
         self.client.force_login(self.maintainer_user)
         response = self.client.get(self.feed_url, {"q": self.maintainer_user.first_name})
@@ -253,9 +258,10 @@ class MachineFeedSearchTests(TestDataMixin, TestCase):
 class MachineFeedFilteredSearchTests(TestDataMixin, TestCase):
     """Tests for search within a specific filter (e.g., ?f=logs&q=...)."""
 
-    def setUp(self):
-        super().setUp()
-        self.feed_url = reverse("maintainer-machine-detail", kwargs={"slug": self.machine.slug})
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.feed_url = reverse("maintainer-machine-detail", kwargs={"slug": cls.machine.slug})
 
     def test_logs_filter_search_includes_problem_report_description(self):
         """Logs filter search should match attached problem report description."""
@@ -326,9 +332,10 @@ class MachineFeedFilteredSearchTests(TestDataMixin, TestCase):
 class MachineFeedBreadcrumbTests(TestDataMixin, TestCase):
     """Tests for feed breadcrumb and title rendering."""
 
-    def setUp(self):
-        super().setUp()
-        self.feed_url = reverse("maintainer-machine-detail", kwargs={"slug": self.machine.slug})
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.feed_url = reverse("maintainer-machine-detail", kwargs={"slug": cls.machine.slug})
 
     def test_all_filter_has_no_breadcrumb_suffix(self):
         """Default (all) filter should not add a breadcrumb suffix."""
@@ -407,12 +414,11 @@ class RenderLatestLogEntryQueryTests(TestDataMixin, TestCase):
 
         With proper optimization, we expect:
         - 1 query for log entry + problem_report (select_related)
-        - 1 query for maintainers (prefetch_related)
-        - 1 query for maintainers' users (prefetch_related maintainers__user)
+        - 1 query for maintainers + users (prefetch_maintainers)
         - 1 query for media (prefetch_related)
         """
-        # 4 queries: log+problem_report, maintainers, users, media
-        with self.assertNumQueries(4):
+        # 3 queries: log+problem_report, maintainers+users, media
+        with self.assertNumQueries(3):
             html = self.view._render_latest_log_entry(self.machine, self.request)
 
         # Verify the HTML contains expected content
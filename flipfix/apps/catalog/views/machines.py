@@ -17,7 +17,6 @@ from django.db.models import (
 from django.db.models.functions import Lower
 from django.http import JsonResponse
 from django.shortcuts import get_object_or_404, redirect
-from django.template.loader import render_to_string
 from django.template.response import TemplateResponse
 from django.urls import reverse
 from django.utils.html import format_html
@@ -31,9 +30,15 @@ from flipfix.apps.catalog.forms import (
     MachineInstanceForm,
     MachineModelForm,
 )
-from flipfix.apps.catalog.models import Location, MachineInstance, MachineModel
+from flipfix.apps.catalog.models import (
+    Location,
+    MachineInstance,
+    MachineModel,
+    machine_detail_text_fields,
+)
 from flipfix.apps.core.feed import FEED_CONFIGS, PageCursor, get_feed_page
 from flipfix.apps.core.forms import SearchForm
+from flipfix.apps.core.rendering import render_scroll_page
 from flipfix.apps.core.url_utils import build_filter_url
 from flipfix.apps.maintenance.models import LogEntry, MaintenanceTaskType, ProblemReport
 
@@ -49,6 +54,7 @@ class MachineListView(ListView):
     def get_queryset(self):
         qs = (
             MachineInstance.objects.visible()
+            .defer(*machine_detail_text_fields())
             .annotate(
                 # Count open problem reports
                 open_report_count=Count(
@@ -331,19 +337,11 @@ class MachineFeedPartialView(View):
         )
 
         # Render each entry using the activity_entry dispatcher template
-        items_html = "".join(
-            render_to_string(
-                "maintenance/partials/activity_entry.html", {"entry": entry}, request=request
-            )
-            for entry in page_items
-        )
-
-        return JsonResponse(
-            {
-                "items": items_html,
-                "has_next": has_next,
-                "next_page": page_num + 1 if has_next else None,
-            }
+        return render_scroll_page(
+            "maintenance/partials/activity_entry.html",
+            ({"entry": entry} for entry in page_items),
+            request,
+            next_page=page_num + 1 if has_next else None,
         )
 
 
@@ -100,7 +100,8 @@ class MachineInlineUpdateView(View):
         log_entry = (
             LogEntry.objects.filter(machine=machine)
             .select_related("problem_report")
-            .prefetch_related("maintainers__user", "media")
+            .prefetch_maintainers()
+            .prefetch_related("media")
             .order_by("-occurred_at")
             .first()
         )
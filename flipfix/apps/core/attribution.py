@@ -11,7 +11,7 @@ Two patterns:
 
 from dataclasses import dataclass
 
-from django.http import HttpRequest
+from django.http import Http404, HttpRequest
 
 from flipfix.apps.accounts.models import Maintainer
 
@@ -24,6 +24,19 @@ class AttributionResult:
     freetext_name: str
 
 
+def get_current_maintainer(request: HttpRequest) -> Maintainer:
+    """Return the logged-in user's maintainer profile, or raise Http404.
+
+    Reads the ``user.maintainer`` reverse one-to-one, which Django caches on
+    the user instance — so a view that already touched it (e.g. via
+    ``SharedAccountMixin.is_shared_account``) pays no extra query.
+    """
+    maintainer = getattr(request.user, "maintainer", None)
+    if maintainer is None:
+        raise Http404("No maintainer profile for the current user.")
+    return maintainer
+
+
 def resolve_maintainer_for_create(
     request: HttpRequest,
     current_maintainer: Maintainer,
@@ -110,8 +123,16 @@ def resolve_maintainer_for_edit(
 
 
 def _lookup_maintainer(username: str) -> Maintainer | None:
-    """Look up non-shared maintainer by username (case-insensitive)."""
-    return Maintainer.objects.filter(
-        user__username__iexact=username,
-        is_shared_account=False,
-    ).first()
+    """Look up non-shared maintainer by username (case-insensitive).
+
+    The filter already joins ``auth_user``, so selecting the user is free and
+    spares callers a query when they read ``maintainer.user`` or its name.
+    """
+    return (
+        Maintainer.objects.select_related("user")
+        .filter(
+            user__username__iexact=username,
+            is_shared_account=False,
+        )
+        .first()
+    )
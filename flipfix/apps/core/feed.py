@@ -234,59 +234,79 @@ def get_feed_page(
     # Fetch one extra to detect if more pages exist (countless pagination pattern)
     fetch_limit = offset + page_size + 1
 
-    all_entries: list[Any] = []
+    # Paginate over narrow (occurred_at, entry_type, pk) keys so deep pages
+    # never build or prefetch the full rows of every page before them; only
+    # the requested page is hydrated.
+    keys: list[tuple[Any, str, Any]] = []
 
     for entry_type in entry_types:
         source = _feed_source_registry.get(entry_type)
         if source:
-            all_entries.extend(_fetch_entries(source, machine, search_query, fetch_limit, order_by))
+            keys.extend(
+                (occurred_at, entry_type, pk)
+                for pk, occurred_at in _fetch_keys(
+                    source, machine, search_query, fetch_limit, order_by
+                )
+            )
 
-    if len(entry_types) == 1:
-        # Single source: DB ordering is already correct; re-sorting by
-        # occurred_at would destroy any status/priority bucketing.
-        combined = all_entries
-    else:
+    if len(entry_types) != 1:
         # Merge sort by occurred_at descending (all entry types share this
         # field, and the invariant guarantees per-source order matches).
-        combined = sorted(
-            all_entries,
-            key=lambda x: x.occurred_at,
-            reverse=True,
-        )
+        # Single source: DB ordering is already correct; re-sorting by
+        # occurred_at would destroy any status/priority bucketing.
+        keys.sort(key=lambda key: key[0], reverse=True)
 
     # Slice to requested page
-    page_items = combined[offset : offset + page_size]
-    has_next = len(combined) > offset + page_size
+    page_keys = keys[offset : offset + page_size]
+    has_next = len(keys) > offset + page_size
 
-    return page_items, has_next
+    return _hydrate_entries(page_keys, machine), has_next
 
 
-def _fetch_entries(
+def _fetch_keys(
     source: FeedEntrySource,
     machine: MachineInstance | None,
     search_query: str | None,
     limit: int,
     order_by: tuple[str, ...],
-) -> list[Any]:
-    """Fetch entries for a single source, scoped to machine or global."""
+) -> list[tuple[Any, Any]]:
+    """Fetch ordered (pk, occurred_at) pairs for one source, scoped to machine or global."""
     queryset = source.get_base_queryset()
 
     if machine:
         queryset = queryset.filter(**{source.machine_filter_field: machine})
         if search_query:
             queryset = queryset.search_for_machine(search_query)  # type: ignore[attr-defined]
-    else:
-        queryset = queryset.select_related(*source.global_select_related)
-        if search_query:
-            queryset = queryset.search(search_query)  # type: ignore[attr-defined]
+    elif search_query:
+        queryset = queryset.search(search_query)  # type: ignore[attr-defined]
 
     queryset = queryset.order_by(*order_by)
-    entries = list(queryset[:limit])
+    return list(queryset.values_list("pk", "occurred_at")[:limit])
 
-    # Tag entries with metadata from their source for template rendering
-    for entry in entries:
-        entry.entry_type = source.entry_type  # type: ignore[attr-defined]
-        entry.machine_template = source.machine_template  # type: ignore[attr-defined]
-        entry.global_template = source.global_template  # type: ignore[attr-defined]
 
-    return entries
+def _hydrate_entries(
+    page_keys: list[tuple[Any, str, Any]],
+    machine: MachineInstance | None,
+) -> list[Any]:
+    """Load full rows (with each source's prefetches) for one page of keys, in key order."""
+    pks_by_type: dict[str, list[Any]] = {}
+    for _, entry_type, pk in page_keys:
+        pks_by_type.setdefault(entry_type, []).append(pk)
+
+    loaded: dict[tuple[str, Any], Any] = {}
+    for entry_type, pks in pks_by_type.items():
+        source = _feed_source_registry[entry_type]
+        queryset = source.get_base_queryset()
+        if not machine:
+            queryset = queryset.select_related(*source.global_select_related)
+        for pk, entry in queryset.in_bulk(pks).items():
+            # Tag entries with metadata from their source for template rendering
+            entry.entry_type = source.entry_type
+            entry.machine_template = source.machine_template
+            entry.global_template = source.global_template
+            loaded[(entry_type, pk)] = entry
+
+    # A row deleted between the key and hydrate queries is simply skipped.
+    return [
+        loaded[(entry_type, pk)] for _, entry_type, pk in page_keys if (entry_type, pk) in loaded
+    ]
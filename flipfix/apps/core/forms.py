@@ -7,7 +7,6 @@ from django import forms
 from django.core.files.uploadedfile import UploadedFile
 from django.urls import reverse_lazy
 from django.utils import timezone
-from PIL import Image, UnidentifiedImageError
 
 from flipfix.apps.core.markdown_links import (
     convert_authoring_to_storage,
@@ -180,6 +179,37 @@ class SiteSettingsForm(StyledFormMixin, forms.ModelForm):
         return content
 
 
+# Leading bytes of photo formats accepted without a full PIL verify.
+# Passed as one tuple to bytes.startswith(), which checks each prefix in C.
+_IMAGE_SIGNATURES = (
+    b"\xff\xd8\xff",  # JPEG
+    b"\x89PNG\r\n\x1a\n",  # PNG
+    b"GIF87a",
+    b"GIF89a",
+)
+# ISO-BMFF major brands (bytes 8-12, after the "ftyp" box type) for HEIF/AVIF
+_HEIF_BRANDS = frozenset({b"heic", b"heix", b"heim", b"heis", b"mif1", b"msf1", b"avif", b"avis"})
+
+
+def _has_image_signature(media: UploadedFile) -> bool:
+    """Return True if the file starts with a known photo format signature.
+
+    Reads only the first 32 bytes and rewinds the file afterwards.
+    """
+    try:
+        media.seek(0)
+        head = media.read(32)
+        media.seek(0)
+    except (OSError, AttributeError):
+        return False
+
+    return (
+        head.startswith(_IMAGE_SIGNATURES)
+        or (head.startswith(b"RIFF") and head[8:12] == b"WEBP")
+        or (head[4:8] == b"ftyp" and head[8:12] in _HEIF_BRANDS)
+    )
+
+
 def validate_media_files(files: list[UploadedFile]) -> list[UploadedFile]:
     """Validate uploaded media files (photos or videos).
 
@@ -217,14 +247,16 @@ def validate_media_files(files: list[UploadedFile]) -> list[UploadedFile]:
         ):
             raise forms.ValidationError("Upload a valid image or video.")
 
-        # Verify image can be opened by PIL
-        try:
-            media.seek(0)
-        except (OSError, AttributeError):
-            pass
+        from PIL import Image, UnidentifiedImageError
 
+        # Recognized image headers get a header-only parse, skipping the full
+        # verify() (which for HEIC means a libheif decode); everything else is
+        # verified by PIL.
+        has_signature = _has_image_signature(media)
         try:
-            Image.open(media).verify()
+            image = Image.open(media)
+            if not has_signature:
+                image.verify()
         except (UnidentifiedImageError, OSError) as err:
             raise forms.ValidationError("Upload a valid image or video.") from err
         finally:
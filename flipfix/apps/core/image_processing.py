@@ -14,18 +14,16 @@ focused purely on image transformation logic.
 from __future__ import annotations
 
 import logging
-from io import BytesIO
+import tempfile
+from functools import lru_cache
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
 
-from django.core.files.uploadedfile import InMemoryUploadedFile
-from PIL import Image, ImageOps, UnidentifiedImageError
+from django.conf import settings
+from django.core.files.uploadedfile import UploadedFile
+from PIL import ExifTags, Image, ImageOps, UnidentifiedImageError
 
 from flipfix.apps.core.media import BROWSER_QUIRK_EXTENSIONS, WEB_NATIVE_FORMATS
 
-if TYPE_CHECKING:
-    from django.core.files.uploadedfile import UploadedFile
-
 logger = logging.getLogger(__name__)
 
 # ---------------------------------------------------------------------------
@@ -37,6 +35,18 @@ MAX_IMAGE_DIMENSION = 2400
 THUMB_IMAGE_DIMENSION = 800
 """Maximum dimension (width or height) for thumbnail images."""
 
+RESIZE_REDUCING_GAP = 2.0
+"""Pillow ``reducing_gap`` for downscaling; keeps the fast box pre-reduce visually lossless."""
+
+SPOOL_MAX_SIZE = 512 * 1024
+"""Encoded output above this many bytes spills from memory to a temp file."""
+
+JPEG_DRAFT_FACTOR = 4
+"""Let the JPEG decoder pre-scale sources more than this many times the target size."""
+
+DRAFT_SCALE_MARGIN = 2.0
+"""Draft-decode to at least this many times the target size, leaving headroom for the resize."""
+
 
 # ---------------------------------------------------------------------------
 # Internal helpers
@@ -53,6 +63,25 @@ def _with_extension(name: str, ext: str) -> str:
 # ---------------------------------------------------------------------------
 
 
+@lru_cache(maxsize=1)
+def register_heif_support() -> bool:
+    """Register the pillow-heif opener so Pillow can read HEIC/HEIF files.
+
+    Runs once per process; later calls return the cached result.
+
+    Returns:
+        True if HEIF support is available.
+    """
+    try:
+        from pillow_heif import register_heif_opener
+
+        register_heif_opener()
+    except Exception:
+        logger.warning("HEIF support unavailable; HEIC decode may fail.", exc_info=True)
+        return False
+    return True
+
+
 def resize_image_file(
     uploaded_file: UploadedFile,
     max_dimension: int | None = MAX_IMAGE_DIMENSION,
@@ -108,23 +137,42 @@ def resize_image_file(
     # Capture format before transpose (exif_transpose returns a copy that loses format attr)
     original_format = (image.format or "").upper()
 
-    transposed = ImageOps.exif_transpose(image)
-    needs_transpose = transposed is not None and transposed is not image
-    if transposed is None:
-        transposed = image
-    image = transposed
+    # Image.open only parses the header, so everything up to the early return
+    # below is decided without decoding any pixels.
     is_heif = original_format in {"HEIC", "HEIF"}
+    orientation = image.getexif().get(ExifTags.Base.Orientation, 1)
+    needs_transpose = orientation != 1
     needs_resize = max_dimension is not None and max(image.size) > max_dimension
     needs_format_conversion = is_heif or original_format not in WEB_NATIVE_FORMATS
+    # Browser quirks can label a web-native image with a generic content type.
+    needs_relabel = (
+        not needs_format_conversion
+        and content_type != WEB_NATIVE_FORMATS[original_format].content_type
+    )
 
     # Skip re-encoding if no transformation needed
-    if not needs_resize and not needs_format_conversion and not needs_transpose:
+    if not (needs_resize or needs_format_conversion or needs_transpose or needs_relabel):
         try:
             uploaded_file.seek(0)
         except (OSError, AttributeError):
             pass
         return uploaded_file
 
+    # Shrink on load before anything decodes the full-resolution pixels (must
+    # run before exif_transpose): JPEG scales in the IDCT, and pillow-heif
+    # decodes an embedded HEIF thumbnail instead when one is large enough.
+    if needs_resize and max_dimension:
+        scale = DRAFT_SCALE_MARGIN * max_dimension / max(image.size)
+        draft_size = (round(image.width * scale), round(image.height * scale))
+        if original_format == "JPEG" and max(image.size) > JPEG_DRAFT_FACTOR * max_dimension:
+            image.draft("RGB", draft_size)
+        elif is_heif:
+            image.draft(None, draft_size)
+
+    # exif_transpose always returns a full copy, so only pay for it when rotating.
+    if needs_transpose:
+        image = ImageOps.exif_transpose(image)
+
     # Determine output format: preserve web-native formats, convert others to JPEG.
     # Special case: PNG with transparency stays PNG regardless.
     if original_format == "PNG" and image.mode in {"RGBA", "LA"}:
@@ -142,7 +190,13 @@ def resize_image_file(
         image = image.convert("RGB")
 
     if needs_resize and max_dimension:
-        image = ImageOps.contain(image, (max_dimension, max_dimension), Image.Resampling.LANCZOS)
+        # reducing_gap lets Pillow shrink by an integer factor with a cheap box
+        # reduce before the BICUBIC pass, which roughly halves thumbnail time.
+        image.thumbnail(
+            (max_dimension, max_dimension),
+            Image.Resampling.BICUBIC,
+            reducing_gap=RESIZE_REDUCING_GAP,
+        )
 
     logger.debug(
         "resize_image_file: name=%s format=%s heif=%s resized=%s size=%s target_format=%s",
@@ -154,21 +208,11 @@ def resize_image_file(
         target_format,
     )
 
-    buffer = BytesIO()
-    save_kwargs: dict[str, Any] = {"format": target_format}
-    if fmt_info.quality is not None:
-        save_kwargs["quality"] = fmt_info.quality
-    if fmt_info.optimize:
-        save_kwargs["optimize"] = True
-    image.save(buffer, **save_kwargs)
+    buffer = tempfile.SpooledTemporaryFile(
+        max_size=SPOOL_MAX_SIZE, dir=settings.FILE_UPLOAD_TEMP_DIR
+    )
+    image.save(buffer, format=target_format, **fmt_info.save_kwargs)
     size = buffer.tell()
     buffer.seek(0)
 
-    return InMemoryUploadedFile(
-        buffer,
-        getattr(uploaded_file, "field_name", None),
-        filename,
-        content_type_out,
-        size,
-        None,
-    )
+    return UploadedFile(buffer, filename, content_type_out, size)
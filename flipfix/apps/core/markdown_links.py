@@ -26,10 +26,12 @@ from collections.abc import Callable, Sequence
 from dataclasses import dataclass, field
 from typing import Any
 
+from django.apps import apps
 from django.core.exceptions import ValidationError
 from django.db import models, transaction
 from django.db.models import Q
 from django.db.models.expressions import Combinable
+from django.urls import reverse
 
 # ---------------------------------------------------------------------------
 # LinkType dataclass
@@ -99,16 +101,12 @@ class LinkType:
 
     def get_model(self) -> type[Any]:
         """Resolve the model class lazily via Django's app registry."""
-        from django.apps import apps
-
         return apps.get_model(self.model_path)
 
     def resolve_url(self, obj: Any) -> str:
         """Resolve the URL for a linked object."""
         if self.get_url:
             return self.get_url(obj)
-        from django.urls import reverse
-
         kwarg_value = getattr(obj, self.url_field)
         return reverse(self.url_name, kwargs={self.url_kwarg: kwarg_value})
 
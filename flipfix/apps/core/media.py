@@ -9,8 +9,12 @@ Single source of truth for supported media extensions used by:
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from dataclasses import dataclass
+from functools import cached_property
 from pathlib import Path
+from types import MappingProxyType
+from typing import Any
 
 from django.core.files.uploadedfile import UploadedFile
 
@@ -22,14 +26,25 @@ class ImageFormat:
     content_type: str
     extension: str
     quality: int | None = None  # Lossy formats only; None = lossless
-    optimize: bool = False  # Pillow optimize flag (JPEG/PNG only)
+    subsampling: int | None = None  # JPEG chroma subsampling (2 = 4:2:0)
+    compress_level: int | None = None  # PNG zlib level (1 = fastest)
+
+    @cached_property
+    def save_kwargs(self) -> Mapping[str, Any]:
+        """Pillow ``Image.save()`` keyword arguments, built once per format."""
+        options = {
+            "quality": self.quality,
+            "subsampling": self.subsampling,
+            "compress_level": self.compress_level,
+        }
+        return MappingProxyType({key: value for key, value in options.items() if value is not None})
 
 
 # Image formats browsers can display natively.  These are preserved on resize, not converted to JPEG.
 # Keyed by Pillow's image.format string (always uppercase).
 WEB_NATIVE_FORMATS: dict[str, ImageFormat] = {
-    "JPEG": ImageFormat(content_type="image/jpeg", extension="jpg", quality=85, optimize=True),
-    "PNG": ImageFormat(content_type="image/png", extension="png", optimize=True),
+    "JPEG": ImageFormat(content_type="image/jpeg", extension="jpg", quality=82, subsampling=2),
+    "PNG": ImageFormat(content_type="image/png", extension="png", compress_level=1),
     "WEBP": ImageFormat(content_type="image/webp", extension="webp", quality=80),
     "AVIF": ImageFormat(content_type="image/avif", extension="avif", quality=63),
 }
@@ -12,6 +12,7 @@ from typing import Any
 
 from django.core.files.uploadedfile import UploadedFile
 from django.db import transaction
+from simple_history.utils import bulk_create_with_history
 
 from flipfix.apps.core.media import is_video_file
 from flipfix.apps.core.transcoding import enqueue_transcode
@@ -29,24 +30,31 @@ def attach_media_files(
     (e.g. ``LogEntryMedia``).  The type is ``Any`` because django-stubs
     does not expose ``.objects`` on abstract model types.
 
+    Rows and their history records are inserted in one batch each rather
+    than one ``save()`` per file, so photo processing is applied up front.
+
     Must be called inside a transaction (e.g. a view decorated with
     ``@transaction.atomic``) so that ``on_commit`` callbacks fire correctly.
     """
-    created: list[Any] = []
+    pending: list[Any] = []
     for media_file in media_files:
         is_video = is_video_file(media_file)
-
-        media = media_model.objects.create(
+        media = media_model(
             **{media_model.parent_field_name: parent},
             media_type=media_model.MediaType.VIDEO if is_video else media_model.MediaType.PHOTO,
             file=media_file,
             transcode_status=media_model.TranscodeStatus.PENDING if is_video else "",
         )
+        media.process_photo_upload()
+        pending.append(media)
 
-        if is_video:
+    if not pending:
+        return []
+    created = bulk_create_with_history(pending, media_model)
+
+    for media in created:
+        if media.media_type == media_model.MediaType.VIDEO:
             transaction.on_commit(
                 partial(enqueue_transcode, media_id=media.id, model_name=media_model.__name__)
             )
-
-        created.append(media)
     return created
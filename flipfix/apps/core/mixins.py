@@ -7,13 +7,13 @@ from typing import TYPE_CHECKING, Any, cast
 
 from django.conf import settings
 from django.core.exceptions import ValidationError
-from django.core.paginator import Paginator
 from django.db import transaction
-from django.http import JsonResponse
-from django.template.loader import render_to_string
+from django.http import HttpResponse, JsonResponse
 
 from flipfix.apps.core.markdown_links import save_inline_markdown_field
 from flipfix.apps.core.media_upload import attach_media_files
+from flipfix.apps.core.pagination import CountlessPaginator
+from flipfix.apps.core.rendering import render_scroll_page
 
 if TYPE_CHECKING:
     from django.core.files.uploadedfile import UploadedFile
@@ -179,14 +179,16 @@ class MediaUploadMixin:
             filter_kwargs = {"id": media_id, parent_field_name: parent}
             media = media_model.objects.get(**filter_kwargs)
 
-            # Delete associated files
+            # Delete associated files. save=False throughout: the row is
+            # deleted next, so saving the cleared field would only cost an
+            # UPDATE plus a spurious "changed" history record.
             if media.transcoded_file:
                 media.transcoded_file.delete(save=False)
             if media.poster_file:
                 media.poster_file.delete(save=False)
             if media.thumbnail_file:
                 media.thumbnail_file.delete(save=False)
-            media.file.delete()
+            media.file.delete(save=False)
             media.delete()
 
             return JsonResponse({"success": True})
@@ -277,13 +279,13 @@ class InlineTextEditMixin:
 
 class InfiniteScrollMixin:
     """
-    Mixin for views that return paginated JSON for infinite scroll.
+    Mixin for views that return paginated HTML fragments for infinite scroll.
 
     Provides a standard get() implementation that:
     1. Calls get_queryset() to get items
-    2. Paginates using page_size and page_param
+    2. Paginates using page_size and page_param (no COUNT query)
     3. Renders each item using item_template
-    4. Returns JSON with items HTML, has_next, and next_page
+    4. Returns the items' HTML, with the next page number in X-Next-Page
 
     Subclasses must set:
         - item_template: Template path for rendering each item
@@ -310,21 +312,15 @@ class InfiniteScrollMixin:
         """Return template context for a single item."""
         return {"entry": item}
 
-    def get(self, request: HttpRequest, *args: Any, **kwargs: Any) -> JsonResponse:
-        """Handle GET request, returning paginated JSON."""
+    def get(self, request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponse:
+        """Handle GET request, returning one page of rendered items."""
         queryset = self.get_queryset()
-        paginator = Paginator(queryset, self.page_size)
+        paginator = CountlessPaginator(queryset, self.page_size)
         page_obj = paginator.get_page(request.GET.get(self.page_param))
 
-        items_html = "".join(
-            render_to_string(self.item_template, self.get_item_context(item), request=request)
-            for item in page_obj.object_list
-        )
-
-        return JsonResponse(
-            {
-                "items": items_html,
-                "has_next": page_obj.has_next(),
-                "next_page": page_obj.next_page_number() if page_obj.has_next() else None,
-            }
+        return render_scroll_page(
+            self.item_template,
+            (self.get_item_context(item) for item in page_obj.object_list),
+            request,
+            next_page=page_obj.next_page_number() if page_obj.has_next() else None,
         )
@@ -57,18 +57,22 @@ class SearchableQuerySetMixin:
         """Normalize a search query: coerce None and strip whitespace."""
         return (query or "").strip()
 
-    def _apply_search(self, query: str, q: Q) -> models.QuerySet:
+    def _apply_search(self, query: str, q: Q, *, distinct: bool = True) -> models.QuerySet:
         """Apply standard search normalization and filtering.
 
         Returns self unchanged for empty/blank queries. Otherwise
-        filters by *q* and returns distinct results.
+        filters by *q* and returns distinct results.  Pass
+        ``distinct=False`` when *q* spans no multi-valued joins (e.g. it
+        reaches child rows through ``Exists``), so the database can skip
+        de-duplicating.
 
         Callers must pass the already-cleaned query (via ``_clean_query``)
         so that the Q objects use the stripped value.
         """
         if not query:
             return self  # type: ignore[return-value]
-        return self.filter(q).distinct()  # type: ignore[attr-defined]
+        filtered = self.filter(q)  # type: ignore[attr-defined]
+        return filtered.distinct() if distinct else filtered
 
 
 # ---------------------------------------------------------------------------
@@ -163,6 +167,15 @@ class AbstractMedia(TimeStampedMixin):
 
     def save(self, *args, **kwargs):
         """Process photo uploads: generate thumbnail and resize for web."""
+        self.process_photo_upload()
+        super().save(*args, **kwargs)
+
+    def process_photo_upload(self) -> None:
+        """Generate a thumbnail and resize a freshly uploaded photo for web.
+
+        Called by ``save()``; bulk inserts (which skip ``save()``) must call it
+        themselves.  No-op for videos and for files already in storage.
+        """
         if self.media_type == self.MediaType.PHOTO and self.file:
             from django.core.files.uploadedfile import UploadedFile as DjangoUploadedFile
 
@@ -186,7 +199,6 @@ class AbstractMedia(TimeStampedMixin):
                     self.file = resize_image_file(original)
                 except Exception:  # pragma: no cover
                     logger.warning("Could not resize uploaded photo %s", self.file, exc_info=True)
-        super().save(*args, **kwargs)
 
     def get_admin_history_url(self) -> str:
         """Return URL to this media's Django admin change history."""
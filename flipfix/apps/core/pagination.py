@@ -0,0 +1,54 @@
+"""Pagination helpers for the core app."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from django.core.paginator import InvalidPage, Page, Paginator
+
+
+class CountlessPage(Page):
+    """Page whose ``has_next`` comes from an over-fetched row, not a COUNT."""
+
+    def __init__(self, object_list: Any, number: int, paginator: Paginator, has_next: bool):
+        super().__init__(object_list, number, paginator)
+        self._has_next = has_next
+
+    def has_next(self) -> bool:
+        return self._has_next
+
+
+class CountlessPaginator(Paginator):
+    """Paginator that never issues ``SELECT COUNT(*)``.
+
+    Fetches one row past the page to detect whether another page exists
+    ("countless pagination", as in core/feed.py). For infinite-scroll lists
+    that only render ``has_next`` / ``next_page_number`` — anything that
+    reads ``count`` or ``num_pages`` still triggers the COUNT.
+
+    ``get_page`` falls back to page 1 for invalid numbers; a page past the
+    end is simply empty rather than clamped to the last page.
+    """
+
+    def validate_number(self, number: Any) -> int:
+        try:
+            number = int(number)
+        except (TypeError, ValueError):
+            raise InvalidPage("That page number is not an integer") from None
+        if number < 1:
+            raise InvalidPage("That page number is less than 1")
+        return number
+
+    def page(self, number: Any) -> CountlessPage:
+        number = self.validate_number(number)
+        bottom = (number - 1) * self.per_page
+        rows = list(self.object_list[bottom : bottom + self.per_page + 1])
+        return CountlessPage(
+            rows[: self.per_page], number, self, has_next=len(rows) > self.per_page
+        )
+
+    def get_page(self, number: Any) -> CountlessPage:
+        try:
+            return self.page(number)
+        except InvalidPage:
+            return self.page(1)
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import base64
+from functools import lru_cache
 from io import BytesIO
 from pathlib import Path
 
@@ -20,13 +21,20 @@ QR_LOGO_SIZE_RATIO = 0.28  # Logo takes 28% of QR width (within 30% error correc
 QR_LOGO_SIZE_RATIO_BULK = 0.25  # Slightly smaller for bulk
 QR_LOGO_PADDING = 4
 
+# Cached base64 PNGs: one per (url, box_size). A few KB each, bounded well
+# above the number of machines times the hosts they're viewed from.
+QR_BASE64_CACHE_SIZE = 512
+
 # Path to logo image
 LOGO_PATH = Path(settings.BASE_DIR) / "flipfix/static/core/images/logo_white.png"
 
 
+@lru_cache(maxsize=1)
 def _load_and_invert_logo() -> Image.Image | None:
     """Load the logo image and invert white to black for QR overlay.
 
+    Cached per process; callers must not mutate the returned image.
+
     Returns:
         Inverted RGBA logo image, or None if logo doesn't exist.
     """
@@ -107,9 +115,13 @@ def generate_qr_code(url: str, box_size: int = QR_BOX_SIZE_SINGLE) -> Image.Imag
     return qr_img
 
 
+@lru_cache(maxsize=QR_BASE64_CACHE_SIZE)
 def generate_qr_code_base64(url: str, box_size: int = QR_BOX_SIZE_SINGLE) -> str:
     """Generate a QR code and return as base64-encoded PNG string.
 
+    The output is a pure function of its arguments, so results are cached
+    per process and repeat views skip the QR build and PNG encode.
+
     Args:
         url: URL to encode in the QR code.
         box_size: Size of each box in the QR code grid.
@@ -119,5 +131,8 @@ def generate_qr_code_base64(url: str, box_size: int = QR_BOX_SIZE_SINGLE) -> str
     """
     qr_img = generate_qr_code(url, box_size)
     buffer = BytesIO()
-    qr_img.save(buffer, format="PNG")
-    return base64.b64encode(buffer.getvalue()).decode()
+    # QR modules and the inverted logo are all grey, so a single-channel PNG
+    # is lossless and about a third smaller and faster to encode than RGB.
+    qr_img.convert("L").save(buffer, format="PNG")
+    # getbuffer() hands b64encode a view of the PNG rather than a bytes copy.
+    return base64.b64encode(buffer.getbuffer()).decode("ascii")
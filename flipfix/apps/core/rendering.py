@@ -0,0 +1,70 @@
+"""Template rendering helpers for the core app."""
+
+from __future__ import annotations
+
+from itertools import chain
+from typing import TYPE_CHECKING, Any
+
+from django.http import HttpResponse
+from django.template import Context, Engine, RequestContext
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from django.http import HttpRequest
+
+# Response header carrying the next page number for infinite_scroll.js;
+# absent on the last page.
+NEXT_PAGE_HEADER = "X-Next-Page"
+
+# Marks a response as an infinite-scroll fragment, so infinite_scroll.js can
+# tell it apart from a full HTML page (e.g. the login page after a redirect).
+SCROLL_PAGE_HEADER = "X-Scroll-Page"
+
+
+def render_each(
+    template_name: str,
+    item_contexts: Iterable[dict[str, Any]],
+    request: HttpRequest | None = None,
+) -> str:
+    """Render a template once per item context and concatenate the results.
+
+    Equivalent to ``"".join(render_to_string(template_name, ctx, request) ...)``,
+    but the template is looked up once and every item shares one context, so
+    context processors run once per call rather than once per item.  Each
+    item's variables are pushed for its render and popped afterwards, so
+    nothing leaks between items.  With no items (the last infinite-scroll
+    page) it returns before touching the template engine.
+    """
+    items = iter(item_contexts)
+    first = next(items, None)
+    if first is None:
+        return ""
+    template = Engine.get_default().get_template(template_name)
+    context = RequestContext(request) if request is not None else Context()
+    parts = []
+    with context.bind_template(template):
+        for item_context in chain((first,), items):
+            with context.push(item_context):
+                parts.append(template.render(context))
+    return "".join(parts)
+
+
+def render_scroll_page(
+    template_name: str,
+    item_contexts: Iterable[dict[str, Any]],
+    request: HttpRequest,
+    next_page: int | None,
+) -> HttpResponse:
+    """Render one infinite-scroll page as a bare HTML fragment.
+
+    The items go out as ``text/html`` rather than wrapped in a JSON string,
+    so the markup isn't escaped on the way out and parsed again by the
+    client.  Pagination travels in the ``X-Next-Page`` header, and every
+    page carries an ``X-Scroll-Page`` marker.
+    """
+    response = HttpResponse(render_each(template_name, item_contexts, request))
+    response[SCROLL_PAGE_HEADER] = "1"
+    if next_page is not None:
+        response[NEXT_PAGE_HEADER] = str(next_page)
+    return response
@@ -14,14 +14,20 @@ Usage:
 
 from __future__ import annotations
 
+import hashlib
 import secrets
 import shutil
 import tempfile
 import uuid
-from typing import TYPE_CHECKING, cast
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, cast
 
+from django.apps import apps
 from django.contrib.auth import get_user_model
+from django.contrib.contenttypes.models import ContentType
+from django.db import connections
 from django.test import TestCase, override_settings
+from django.test.runner import DiscoverRunner
 from django.utils.text import slugify
 
 from flipfix.apps.accounts.models import Maintainer
@@ -364,6 +370,41 @@ def create_log_entry(
     )
 
 
+def create_log_entries(*specs: dict[str, Any]) -> list[LogEntry]:
+    """Create several test LogEntry rows with one bulk INSERT.
+
+    Bypasses save(), so no post_save signals or history rows. Use
+    create_log_entry() when the test depends on either.
+
+    Args:
+        *specs: Field values for each entry. ``machine`` is required;
+            ``text`` is auto-generated if omitted. An optional
+            ``maintainers`` list is linked with one more bulk INSERT.
+
+    Returns:
+        Created LogEntry instances, in spec order
+    """
+    entries = []
+    maintainers_by_entry = []
+    for spec in specs:
+        fields = dict(spec)
+        maintainers_by_entry.append(fields.pop("maintainers", ()))
+        fields.setdefault("text", f"Test log entry {_unique_suffix()}")
+        entries.append(LogEntry(**fields))
+    LogEntry.objects.bulk_create(entries)
+
+    through = LogEntry.maintainers.through
+    through.objects.bulk_create(
+        [
+            through(logentry_id=entry.pk, maintainer_id=maintainer.pk)
+            for entry, maintainers in zip(entries, maintainers_by_entry, strict=True)
+            for maintainer in maintainers
+        ],
+        ignore_conflicts=True,
+    )
+    return entries
+
+
 def create_shared_terminal(
     username: str | None = None,
     first_name: str = "Workshop",
@@ -573,6 +614,50 @@ def grant_capability_to_group(
 # =============================================================================
 
 
+def _migrations_digest() -> str:
+    """Return a short hash of every installed app's migration files."""
+    digest = hashlib.sha256()
+    for app_config in apps.get_app_configs():
+        for path in sorted(Path(app_config.path).glob("migrations/*.py")):
+            digest.update(path.read_bytes())
+    return digest.hexdigest()[:16]
+
+
+class FlipfixTestRunner(DiscoverRunner):
+    """Test runner for the project's test settings.
+
+    - Fills the ContentType cache once per run. The cache otherwise fills
+      lazily, one query per model, in whichever tests first touch each
+      model's content type. Warming it right after the test databases are
+      created means forked ``--parallel`` workers inherit it.
+    - With ``--keepdb`` and a single process (e.g. ``make test-module``),
+      the in-memory SQLite test database is swapped for a file named after
+      a hash of the migrations, so later runs skip migrating until a
+      migration changes. Multi-process runs stay in memory, where per-test
+      writes are cheaper than the one-off migrate.
+    """
+
+    def setup_databases(self, **kwargs):
+        if self.keepdb and self.parallel <= 1:
+            self._use_migration_keyed_sqlite_files()
+        old_config = super().setup_databases(**kwargs)
+        ContentType.objects.get_for_models(*apps.get_models())
+        return old_config
+
+    @staticmethod
+    def _use_migration_keyed_sqlite_files():
+        digest = _migrations_digest()
+        for alias in connections:
+            settings_dict = connections[alias].settings_dict
+            if settings_dict["ENGINE"] != "django.db.backends.sqlite3":
+                continue
+            if settings_dict["TEST"].get("NAME"):
+                continue
+            settings_dict["TEST"]["NAME"] = str(
+                Path(tempfile.gettempdir()) / f"flipfix-test-{alias}-{digest}.sqlite3"
+            )
+
+
 class SuppressRequestLogsMixin:
     """Mixin to suppress Django request logging during tests.
 
@@ -655,6 +740,9 @@ class TestDataMixin:
         - self.regular_user: A User without special permissions
         - self.superuser: A superuser (admin)
 
+    The rows are created once per class in ``setUpTestData``; Django rolls back
+    each test's changes and hands every test its own copy of the instances.
+
     Usage:
         class MyTestCase(TestDataMixin, TestCase):
             def setUp(self):
@@ -662,18 +750,19 @@ class TestDataMixin:
                 # Now use self.machine, self.maintainer_user, etc.
     """
 
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         """Set up common test data."""
-        super().setUp()
-        self.machine_model = create_machine_model(name="Test Machine")
-        self.machine = create_machine(
-            model=self.machine_model,
+        super().setUpTestData()
+        cls.machine_model = create_machine_model(name="Test Machine")
+        cls.machine = create_machine(
+            model=cls.machine_model,
             slug="test-machine",
         )
-        self.maintainer_user = create_maintainer_user()
-        self.maintainer = Maintainer.objects.get(user=self.maintainer_user)
-        self.regular_user = create_user()
-        self.superuser = create_superuser()
+        cls.maintainer_user = create_maintainer_user()
+        cls.maintainer = Maintainer.objects.get(user=cls.maintainer_user)
+        cls.regular_user = create_user()
+        cls.superuser = create_superuser()
 
 
 class SharedAccountTestMixin:
@@ -698,15 +787,16 @@ class SharedAccountTestMixin:
     proper MRO (Method Resolution Order).
     """
 
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         """Set up shared account test data."""
-        super().setUp()
+        super().setUpTestData()
         # Create a shared terminal account (e.g., a workshop kiosk)
-        self.shared_user = create_maintainer_user(username="terminal")
-        self.shared_maintainer = Maintainer.objects.get(user=self.shared_user)
-        self.shared_maintainer.is_shared_account = True
-        self.shared_maintainer.save()
+        cls.shared_user = create_maintainer_user(username="terminal")
+        cls.shared_maintainer = Maintainer.objects.get(user=cls.shared_user)
+        cls.shared_maintainer.is_shared_account = True
+        cls.shared_maintainer.save()
 
         # Second maintainer - the person using the terminal who identifies themselves
-        self.identifying_user = create_maintainer_user(username="identifying-user")
-        self.identifying_maintainer = Maintainer.objects.get(user=self.identifying_user)
+        cls.identifying_user = create_maintainer_user(username="identifying-user")
+        cls.identifying_maintainer = Maintainer.objects.get(user=cls.identifying_user)
@@ -0,0 +1,56 @@
+"""Tests for core user attribution helpers."""
+
+from django import forms
+from django.http import Http404
+from django.test import RequestFactory, TestCase, tag
+
+from flipfix.apps.accounts.models import Maintainer
+from flipfix.apps.core.attribution import get_current_maintainer, resolve_maintainer_for_edit
+from flipfix.apps.core.test_utils import create_maintainer_user, create_user
+
+
+class _NameForm(forms.Form):
+    name = forms.CharField(required=False)
+
+
+@tag("unit")
+class GetCurrentMaintainerTests(TestCase):
+    """Tests for get_current_maintainer()."""
+
+    def setUp(self):
+        self.request = RequestFactory().get("/")
+
+    def test_returns_cached_profile_without_requerying(self):
+        """A maintainer already loaded via user.maintainer costs no query."""
+        user = create_maintainer_user()
+        self.request.user = user
+        expected = user.maintainer
+
+        with self.assertNumQueries(0):
+            self.assertEqual(get_current_maintainer(self.request), expected)
+
+    def test_raises_404_without_profile(self):
+        """Users with no maintainer profile get a 404."""
+        user = create_user()
+        Maintainer.objects.filter(user=user).delete()
+        self.request.user = user
+
+        with self.assertRaises(Http404):
+            get_current_maintainer(self.request)
+
+
+@tag("unit")
+class ResolveMaintainerForEditTests(TestCase):
+    """Tests for resolve_maintainer_for_edit()."""
+
+    def test_username_match_loads_user_in_same_query(self):
+        """The matched maintainer's user comes back with it, not in a second query."""
+        create_maintainer_user(username="partsmaster", first_name="Pat", last_name="Parts")
+        request = RequestFactory().post("/", {"name_username": "PartsMaster"})
+        form = _NameForm(data={})
+        form.is_valid()
+
+        with self.assertNumQueries(1):
+            result = resolve_maintainer_for_edit(request, form, "name_username", "name")
+            self.assertEqual(result.maintainer.user.username, "partsmaster")
+            self.assertEqual(str(result.maintainer), "Pat Parts")
@@ -1,9 +1,14 @@
 """Tests for form utilities."""
 
+from io import BytesIO
+from unittest.mock import patch
+
 from django import forms
-from django.test import TestCase, tag
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import SimpleTestCase, TestCase, tag
+from PIL import Image
 
-from flipfix.apps.core.forms import MarkdownTextarea, StyledFormMixin
+from flipfix.apps.core.forms import MarkdownTextarea, StyledFormMixin, validate_media_files
 
 
 @tag("forms")
@@ -141,3 +146,66 @@ class MarkdownTextareaTests(TestCase):
         classes = form.fields["content"].widget.attrs.get("class", "")
         self.assertIn("form-input", classes)
         self.assertIn("form-textarea", classes)
+
+
+@tag("forms")
+class ValidateMediaFilesTests(SimpleTestCase):
+    """Tests for validate_media_files image header sniffing."""
+
+    def _image_upload(self, name, fmt, content_type):
+        buffer = BytesIO()
+        Image.new("RGB", (4, 4), "red").save(buffer, format=fmt)
+        return SimpleUploadedFile(name, buffer.getvalue(), content_type=content_type)
+
+    def test_known_signature_skips_pil_verify(self):
+        """Files with a recognized header get a header parse but no full PIL verify."""
+        uploads = [
+            self._image_upload("photo.jpg", "JPEG", "image/jpeg"),
+            self._image_upload("photo.png", "PNG", "image/png"),
+            self._image_upload("photo.gif", "GIF", "image/gif"),
+            self._image_upload("photo.webp", "WEBP", "image/webp"),
+        ]
+        for upload in uploads:
+            with (
+                self.subTest(name=upload.name),
+                patch("PIL.ImageFile.ImageFile.verify") as mock_verify,
+            ):
+                self.assertEqual(validate_media_files([upload]), [upload])
+                mock_verify.assert_not_called()
+                self.assertEqual(upload.tell(), 0)
+
+    def test_known_signature_with_unreadable_header_rejected(self):
+        """A recognized magic number followed by garbage is still rejected."""
+        headers = {
+            "photo.jpg": b"\xff\xd8\xff\xe0" + b"\x00" * 28,
+            "photo.png": b"\x89PNG\r\n\x1a\n" + b"\x00" * 24,
+            "photo.gif": b"GIF89a" + b"\x00" * 26,
+        }
+        for name, header in headers.items():
+            with self.subTest(name=name):
+                upload = SimpleUploadedFile(name, header, content_type="image/jpeg")
+                with self.assertRaisesMessage(
+                    forms.ValidationError, "Upload a valid image or video."
+                ):
+                    validate_media_files([upload])
+                self.assertEqual(upload.tell(), 0)
+
+    def test_unrecognized_header_falls_back_to_pil(self):
+        """Formats without a sniffed signature are still verified by PIL."""
+        upload = self._image_upload("photo.bmp", "BMP", "image/bmp")
+        self.assertEqual(validate_media_files([upload]), [upload])
+        self.assertEqual(upload.tell(), 0)
+
+    def test_non_heif_ftyp_brand_not_sniffed_as_image(self):
+        """An MP4 ftyp box isn't mistaken for HEIF and still goes through PIL."""
+        upload = SimpleUploadedFile(
+            "photo.heic", b"\x00\x00\x00\x18ftypmp42" + b"\x00" * 20, content_type="image/heic"
+        )
+        with self.assertRaisesMessage(forms.ValidationError, "Upload a valid image or video."):
+            validate_media_files([upload])
+
+    def test_garbage_image_rejected(self):
+        """Files with no known header that PIL can't open are rejected."""
+        upload = SimpleUploadedFile("photo.jpg", b"not an image", content_type="image/jpeg")
+        with self.assertRaisesMessage(forms.ValidationError, "Upload a valid image or video."):
+            validate_media_files([upload])
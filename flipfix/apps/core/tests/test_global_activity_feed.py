@@ -6,7 +6,9 @@ for maintainers.
 
 from datetime import timedelta
 
+from django.db import connection
 from django.test import TestCase, tag
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.utils import timezone
 
@@ -138,9 +140,10 @@ class GlobalFeedSearchTests(TestDataMixin, TestCase):
 class GlobalFeedStatsTests(TestDataMixin, TestCase):
     """Tests for global feed sidebar statistics."""
 
-    def setUp(self):
-        super().setUp()
-        self.home_url = reverse("home")
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.home_url = reverse("home")
 
     def test_stats_show_open_problems_count(self):
         """Stats should show count of open problem reports."""
@@ -194,31 +197,34 @@ class GlobalFeedPartialViewTests(TestDataMixin, TestCase):
             response = self.client.get(self.partial_url)
         self.assertEqual(response.status_code, 403)
 
-    def test_partial_returns_json(self):
-        """Partial view should return JSON response."""
+    def test_partial_returns_html_fragment(self):
+        """Partial view returns the rendered items as HTML, not wrapped in JSON."""
         self.client.force_login(self.maintainer_user)
         response = self.client.get(self.partial_url)
 
         self.assertEqual(response.status_code, 200)
-        self.assertEqual(response["Content-Type"], "application/json")
+        self.assertEqual(response["Content-Type"], "text/html; charset=utf-8")
+
+    def test_partial_marks_response_as_scroll_page(self):
+        """Partial view sets the X-Scroll-Page marker infinite_scroll.js checks for."""
+        self.client.force_login(self.maintainer_user)
+        response = self.client.get(self.partial_url)
+
+        self.assertEqual(response["X-Scroll-Page"], "1")
 
     def test_partial_returns_items_html(self):
-        """Partial view should return rendered HTML in items field."""
+        """Partial view body is the rendered entries."""
         self.client.force_login(self.maintainer_user)
         response = self.client.get(self.partial_url)
 
-        data = response.json()
-        self.assertIn("items", data)
-        self.assertIn("Log entry", data["items"])
+        self.assertContains(response, "Log entry")
 
-    def test_partial_returns_pagination_info(self):
-        """Partial view should return has_next and next_page fields."""
+    def test_partial_omits_next_page_on_last_page(self):
+        """X-Next-Page is absent when there is no further page."""
         self.client.force_login(self.maintainer_user)
         response = self.client.get(self.partial_url)
 
-        data = response.json()
-        self.assertIn("has_next", data)
-        self.assertIn("next_page", data)
+        self.assertNotIn("X-Next-Page", response)
 
     def test_partial_respects_page_param(self):
         """Partial view should respect the page query parameter."""
@@ -226,9 +232,9 @@ class GlobalFeedPartialViewTests(TestDataMixin, TestCase):
         response = self.client.get(self.partial_url, {"page": 2})
 
         self.assertEqual(response.status_code, 200)
-        data = response.json()
-        # Page 2 with default page size should work
-        self.assertIsInstance(data["items"], str)
+        # Page 2 is past the end of the setup data: empty, with no next page
+        self.assertNotContains(response, "Log entry")
+        self.assertNotIn("X-Next-Page", response)
 
 
 @tag("views")
@@ -273,3 +279,37 @@ class GlobalFeedOrderingTests(TestDataMixin, TestCase):
                 (type(old_log).__name__, old_log.pk),
             ],
         )
+
+    def test_deep_page_hydrates_only_its_own_entries(self):
+        """Deep pages load full rows for the requested page only.
+
+        Earlier pages are skipped via narrow key queries, so the log entry
+        media prefetch is keyed on this page's entries alone.
+        """
+        now = timezone.now()
+        entries = [
+            create_log_entry(
+                machine=self.machine, text=f"log {i}", occurred_at=now - timedelta(hours=i)
+            )
+            for i in range(5)
+        ]
+
+        with CaptureQueriesContext(connection) as ctx:
+            page, has_next = get_feed_page(page_num=2, page_size=2)
+
+        self.assertEqual([e.pk for e in page], [entries[2].pk, entries[3].pk])
+        self.assertTrue(has_next)
+        media_queries = [q["sql"] for q in ctx.captured_queries if "logentrymedia" in q["sql"]]
+        self.assertEqual(len(media_queries), 1)
+        self.assertIn(f"IN ({entries[2].pk}, {entries[3].pk})", media_queries[0])
+
+    def test_problem_report_reporter_loads_name_columns_only(self):
+        """Feed reports join their reporter for the name, not the account columns."""
+        reporter = create_user(username="reporter", first_name="Rita", last_name="Reporter")
+        create_problem_report(machine=self.machine, reported_by_user=reporter)
+
+        (report,) = get_feed_page(page_num=1)[0]
+
+        self.assertIn("password", report.reported_by_user.get_deferred_fields())
+        with self.assertNumQueries(0):
+            self.assertEqual(report.reporter_display, "Rita Reporter")
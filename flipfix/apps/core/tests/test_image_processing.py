@@ -1,14 +1,18 @@
 """Tests for image processing utilities."""
 
+import sys
 from io import BytesIO
+from unittest.mock import ANY, Mock, patch
 
-from django.core.files.uploadedfile import SimpleUploadedFile
-from django.test import TestCase, tag
-from PIL import Image
+from django.core.files.uploadedfile import SimpleUploadedFile, UploadedFile
+from django.test import SimpleTestCase, TestCase, tag
+from PIL import ExifTags, Image
+from PIL.JpegImagePlugin import JpegImageFile, get_sampling
 
 from flipfix.apps.core.image_processing import (
     MAX_IMAGE_DIMENSION,
     THUMB_IMAGE_DIMENSION,
+    register_heif_support,
     resize_image_file,
 )
 
@@ -72,6 +76,56 @@ class ResizeImageFileTests(TestCase):
         img = Image.open(result)
         self.assertLessEqual(max(img.size), MAX_IMAGE_DIMENSION)
 
+    def test_jpeg_output_is_baseline_420(self):
+        """Re-encoded JPEGs use 4:2:0 chroma subsampling and baseline encoding."""
+        image_data = create_test_image(3000, 2000, format="JPEG")
+        uploaded = SimpleUploadedFile("large.jpg", image_data, content_type="image/jpeg")
+
+        result = resize_image_file(uploaded)
+
+        result.seek(0)
+        img = Image.open(result)
+        self.assertEqual(get_sampling(img), 2)
+        self.assertNotIn("progressive", img.info)
+
+    def test_small_jpeg_without_orientation_is_not_decoded(self):
+        """Small upright JPEGs are returned as-is without decoding pixel data."""
+        image_data = create_test_image(640, 480, format="JPEG")
+        uploaded = SimpleUploadedFile("small.jpg", image_data, content_type="image/jpeg")
+
+        with patch.object(JpegImageFile, "load", autospec=True) as load:
+            result = resize_image_file(uploaded)
+
+        self.assertIs(result, uploaded)
+        load.assert_not_called()
+
+    def test_upright_image_resized_without_transpose_copy(self):
+        """Images without an EXIF rotation skip exif_transpose when resizing."""
+        image_data = create_test_image(3000, 2000, format="JPEG")
+        uploaded = SimpleUploadedFile("large.jpg", image_data, content_type="image/jpeg")
+
+        with patch("flipfix.apps.core.image_processing.ImageOps.exif_transpose") as transpose:
+            result = resize_image_file(uploaded)
+
+        transpose.assert_not_called()
+        result.seek(0)
+        self.assertEqual(Image.open(result).size, (MAX_IMAGE_DIMENSION, 1600))
+
+    def test_small_jpeg_with_orientation_is_transposed(self):
+        """An EXIF orientation tag forces a re-encode with the rotation applied."""
+        image = Image.new("RGB", (640, 480), color="red")
+        exif = Image.Exif()
+        exif[ExifTags.Base.Orientation] = 6
+        buffer = BytesIO()
+        image.save(buffer, format="JPEG", exif=exif)
+        uploaded = SimpleUploadedFile("rotated.jpg", buffer.getvalue(), content_type="image/jpeg")
+
+        result = resize_image_file(uploaded)
+
+        self.assertIsNot(result, uploaded)
+        result.seek(0)
+        self.assertEqual(Image.open(result).size, (480, 640))
+
     def test_custom_max_dimension(self):
         """Custom max_dimension is respected."""
         image_data = create_test_image(1000, 800, format="JPEG")
@@ -94,6 +148,20 @@ class ResizeImageFileTests(TestCase):
         img = Image.open(result)
         self.assertLessEqual(max(img.size), THUMB_IMAGE_DIMENSION)
 
+    def test_very_large_jpeg_decoded_in_draft_mode(self):
+        """JPEGs far above the target size still come out at the exact target size."""
+        image_data = create_test_image(2000, 1500, format="JPEG")
+        uploaded = SimpleUploadedFile("huge.jpg", image_data, content_type="image/jpeg")
+
+        with patch.object(
+            JpegImageFile, "draft", autospec=True, side_effect=JpegImageFile.draft
+        ) as draft:
+            result = resize_image_file(uploaded, max_dimension=400)
+
+        draft.assert_any_call(ANY, "RGB", (800, 600))
+        result.seek(0)
+        self.assertEqual(Image.open(result).size, (400, 300))
+
     def test_png_with_transparency_stays_png(self):
         """PNG images with alpha channel remain PNG (not converted to JPEG)."""
         rgba_image = create_test_image(3000, 2000, format="PNG", mode="RGBA")
@@ -181,6 +249,19 @@ class ResizeImageFileTests(TestCase):
         result = resize_image_file(uploaded)
         self.assertIs(result, uploaded)
 
+    def test_large_heif_requests_embedded_thumbnail(self):
+        """HEIF sources ask the decoder for an embedded thumbnail before resizing."""
+        image = Image.new("RGB", (4000, 3000), color="red")
+        image.format = "HEIF"
+        image.draft = Mock(return_value=None)
+        uploaded = SimpleUploadedFile("photo.heic", b"heic", content_type="image/heic")
+
+        with patch("flipfix.apps.core.image_processing.Image.open", return_value=image):
+            result = resize_image_file(uploaded, max_dimension=THUMB_IMAGE_DIMENSION)
+
+        image.draft.assert_any_call(None, (1600, 1200))
+        self.assertEqual(result.content_type, "image/jpeg")
+
     def test_max_dimension_none_skips_resize_but_converts_format(self):
         """Passing max_dimension=None skips resizing but still converts format."""
         # BMP should be converted to JPEG even without resizing
@@ -209,15 +290,63 @@ class ResizeImageFileTests(TestCase):
         result_ratio = width / height
         self.assertAlmostEqual(original_ratio, result_ratio, places=1)
 
-    def test_result_is_inmemoryuploadedfile(self):
-        """Processed files are returned as InMemoryUploadedFile."""
+    def test_result_is_uploadedfile(self):
+        """Processed files are returned as UploadedFile with a size."""
         large_image = create_test_image(3000, 2000, format="JPEG")
         uploaded = SimpleUploadedFile("large.jpg", large_image, content_type="image/jpeg")
 
         result = resize_image_file(uploaded)
 
-        from django.core.files.uploadedfile import InMemoryUploadedFile
-
-        self.assertIsInstance(result, InMemoryUploadedFile)
+        self.assertIsInstance(result, UploadedFile)
         self.assertIsNotNone(result.size)
         self.assertGreater(result.size, 0)
+
+    def test_large_output_spills_to_disk(self):
+        """Encoded output above SPOOL_MAX_SIZE is buffered in a temp file, not memory."""
+        image_data = create_test_image(1000, 800, format="PNG")
+        uploaded = SimpleUploadedFile("big.png", image_data, content_type="image/png")
+
+        with patch("flipfix.apps.core.image_processing.SPOOL_MAX_SIZE", 1024):
+            result = resize_image_file(uploaded, max_dimension=500)
+
+        # An in-memory spool has no name; one that spilled to disk is named by
+        # its temp file. (fileno() would force the rollover, so don't probe it.)
+        self.assertIsNotNone(result.file.name)
+        result.seek(0)
+        self.assertEqual(Image.open(result).size, (500, 400))
+
+    def test_small_output_stays_in_memory(self):
+        """Encoded output under SPOOL_MAX_SIZE is never written to a temp file."""
+        image_data = create_test_image(1000, 800, format="PNG")
+        uploaded = SimpleUploadedFile("small.png", image_data, content_type="image/png")
+
+        result = resize_image_file(uploaded, max_dimension=500)
+
+        self.assertIsNone(result.file.name)
+
+
+@tag("unit")
+class RegisterHeifSupportTests(SimpleTestCase):
+    """Tests for the register_heif_support function."""
+
+    def setUp(self):
+        register_heif_support.cache_clear()
+        self.addCleanup(register_heif_support.cache_clear)
+
+    def test_registers_opener_once_per_process(self):
+        """Repeated calls reuse the first registration."""
+        pillow_heif = Mock()
+        with patch.dict(sys.modules, {"pillow_heif": pillow_heif}):
+            self.assertTrue(register_heif_support())
+            self.assertTrue(register_heif_support())
+        pillow_heif.register_heif_opener.assert_called_once()
+
+    def test_returns_false_when_registration_fails(self):
+        """A failing opener reports HEIF as unavailable instead of raising."""
+        pillow_heif = Mock()
+        pillow_heif.register_heif_opener.side_effect = RuntimeError("no libheif")
+        with (
+            patch.dict(sys.modules, {"pillow_heif": pillow_heif}),
+            self.assertLogs("flipfix.apps.core.image_processing", level="WARNING"),
+        ):
+            self.assertFalse(register_heif_support())
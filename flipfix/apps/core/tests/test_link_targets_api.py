@@ -3,10 +3,11 @@
 from django.test import TestCase, tag
 from django.urls import reverse
 
-from flipfix.apps.catalog.models import MachineInstance, MachineModel
+from flipfix.apps.catalog.models import MachineModel
 from flipfix.apps.core.test_utils import (
     SuppressRequestLogsMixin,
     TestDataMixin,
+    create_machine,
 )
 from flipfix.apps.maintenance.models import LogEntry, ProblemReport
 from flipfix.apps.parts.models import PartRequest, PartRequestUpdate
@@ -17,9 +18,10 @@ from flipfix.apps.wiki.models import WikiPage, WikiPageTag
 class LinkTypesAPITests(SuppressRequestLogsMixin, TestDataMixin, TestCase):
     """Tests for LinkTypesView API endpoint."""
 
-    def setUp(self):
-        super().setUp()
-        self.url = reverse("api-link-types")
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.url = reverse("api-link-types")
 
     def test_requires_login(self):
         """Unauthenticated users are redirected to login."""
@@ -67,9 +69,10 @@ class LinkTypesAPITests(SuppressRequestLogsMixin, TestDataMixin, TestCase):
 class LinkTargetsAPITests(SuppressRequestLogsMixin, TestDataMixin, TestCase):
     """Tests for LinkTargetsView API endpoint."""
 
-    def setUp(self):
-        super().setUp()
-        self.url = reverse("api-link-targets")
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.url = reverse("api-link-targets")
 
     def test_requires_login(self):
         """Unauthenticated users are redirected to login."""
@@ -146,7 +149,7 @@ class LinkTargetsAPITests(SuppressRequestLogsMixin, TestDataMixin, TestCase):
 
         # Create a second machine to test filtering
         model2 = MachineModel.objects.create(name="Different Model", slug="different")
-        MachineInstance.objects.create(name="Different Machine", slug="different", model=model2)
+        create_machine(name="Different Machine", slug="different", model=model2)
 
         response = self.client.get(self.url + f"?type=machine&q={self.machine.name}")
 
@@ -208,7 +211,7 @@ class LinkTargetsAPITests(SuppressRequestLogsMixin, TestDataMixin, TestCase):
         model = MachineModel.objects.create(
             name="Test Model", slug="test-model", manufacturer="Williams", year=1980
         )
-        MachineInstance.objects.create(name="Test Instance", slug="test-instance", model=model)
+        create_machine(name="Test Instance", slug="test-instance", model=model)
 
         response = self.client.get(self.url + "?type=machine&q=test-instance")
 
@@ -5,7 +5,11 @@ from unittest.mock import patch
 from django.core.files.uploadedfile import SimpleUploadedFile
 from django.test import TestCase, tag
 
-from flipfix.apps.core.media import ALLOWED_MEDIA_EXTENSIONS, ALLOWED_PHOTO_EXTENSIONS
+from flipfix.apps.core.media import (
+    ALLOWED_MEDIA_EXTENSIONS,
+    ALLOWED_PHOTO_EXTENSIONS,
+    WEB_NATIVE_FORMATS,
+)
 from flipfix.apps.core.media_upload import attach_media_files
 from flipfix.apps.core.test_utils import (
     TemporaryMediaMixin,
@@ -31,9 +35,17 @@ class MediaExtensionConfigTests(TestCase):
         """AVIF is in the allowed media extensions set."""
         self.assertIn(".avif", ALLOWED_MEDIA_EXTENSIONS)
 
+    def test_image_format_save_kwargs_omit_unset_options(self):
+        """save_kwargs only carries the options a format sets, and is built once."""
+        jpeg = WEB_NATIVE_FORMATS["JPEG"]
+
+        self.assertEqual(dict(jpeg.save_kwargs), {"quality": 82, "subsampling": 2})
+        self.assertEqual(dict(WEB_NATIVE_FORMATS["PNG"].save_kwargs), {"compress_level": 1})
+        self.assertIs(jpeg.save_kwargs, jpeg.save_kwargs)
+
 
 @tag("models")
-class AttachMediaFilesTests(TestDataMixin, TestCase):
+class AttachMediaFilesTests(TemporaryMediaMixin, TestDataMixin, TestCase):
     """Tests for the attach_media_files utility."""
 
     def setUp(self):
@@ -111,6 +123,25 @@ class AttachMediaFilesTests(TestDataMixin, TestCase):
         self.assertEqual(result, [])
         self.assertEqual(LogEntryMedia.objects.count(), 0)
 
+    @patch("flipfix.apps.core.media_upload.enqueue_transcode")
+    def test_multiple_files_insert_in_one_batch(self, mock_enqueue):
+        """Several uploads cost one INSERT for the rows and one for their history."""
+        videos = [
+            SimpleUploadedFile(f"clip{i}.mp4", b"fake video", content_type="video/mp4")
+            for i in range(3)
+        ]
+
+        with self.captureOnCommitCallbacks(execute=True), self.assertNumQueries(2):
+            result = attach_media_files(
+                media_files=videos, parent=self.log_entry, media_model=LogEntryMedia
+            )
+
+        self.assertEqual(
+            LogEntryMedia.history.filter(history_type="+").count(),
+            len(result),
+        )
+        self.assertEqual(mock_enqueue.call_count, 3)
+
     @patch("flipfix.apps.core.media_upload.enqueue_transcode")
     def test_detects_video_by_extension(self, mock_enqueue):
         """Detects video files by extension even without video content type."""
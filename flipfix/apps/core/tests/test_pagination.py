@@ -0,0 +1,51 @@
+"""Tests for core pagination helpers."""
+
+from django.test import TestCase, tag
+
+from flipfix.apps.core.pagination import CountlessPaginator
+from flipfix.apps.core.test_utils import TestDataMixin, create_log_entries
+from flipfix.apps.maintenance.models import LogEntry
+
+
+@tag("views")
+class CountlessPaginatorTests(TestDataMixin, TestCase):
+    """Tests for CountlessPaginator."""
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        create_log_entries(*({"machine": cls.machine, "text": f"Entry {i}"} for i in range(5)))
+        cls.queryset = LogEntry.objects.order_by("pk")
+
+    def test_page_runs_single_query_without_count(self):
+        """A page is one sliced SELECT; no COUNT(*) is issued."""
+        with self.assertNumQueries(1):
+            page = CountlessPaginator(self.queryset, 2).get_page("2")
+            self.assertEqual(len(page.object_list), 2)
+            self.assertTrue(page.has_next())
+            self.assertEqual(page.next_page_number(), 3)
+
+    def test_last_page_has_no_next(self):
+        """The final partial page reports no next page."""
+        page = CountlessPaginator(self.queryset, 2).get_page(3)
+        self.assertEqual(len(page.object_list), 1)
+        self.assertFalse(page.has_next())
+
+    def test_exact_multiple_has_no_next(self):
+        """A full final page is not followed by an empty one."""
+        page = CountlessPaginator(self.queryset, 5).get_page(1)
+        self.assertEqual(len(page.object_list), 5)
+        self.assertFalse(page.has_next())
+
+    def test_invalid_number_falls_back_to_first_page(self):
+        """Non-integer and non-positive page numbers return page 1."""
+        for number in ("abc", None, "0", "-1"):
+            with self.subTest(number=number):
+                page = CountlessPaginator(self.queryset, 2).get_page(number)
+                self.assertEqual(page.number, 1)
+
+    def test_page_past_end_is_empty(self):
+        """A page beyond the data is empty rather than clamped to the last page."""
+        page = CountlessPaginator(self.queryset, 2).get_page(10)
+        self.assertEqual(list(page.object_list), [])
+        self.assertFalse(page.has_next())
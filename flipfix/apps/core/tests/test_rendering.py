@@ -0,0 +1,81 @@
+"""Tests for core template rendering helpers."""
+
+from collections import Counter
+from unittest.mock import patch
+
+from django.template.loader import render_to_string
+from django.test import RequestFactory, SimpleTestCase, override_settings, tag
+
+from flipfix.apps.core.rendering import render_each
+
+ITEM_TEMPLATES = {
+    "item.html": "[{{ entry }}{% if extra %}+{{ extra }}{% endif %}:{{ request.path }}]",
+}
+
+
+# How many times _counting_processor has run; tests reset it with patch.dict.
+_processor_calls: Counter[str] = Counter()
+
+
+def _counting_processor(request):
+    _processor_calls["calls"] += 1
+    return {}
+
+
+@tag("unit")
+@override_settings(
+    TEMPLATES=[
+        {
+            "BACKEND": "django.template.backends.django.DjangoTemplates",
+            "OPTIONS": {
+                "loaders": [("django.template.loaders.locmem.Loader", ITEM_TEMPLATES)],
+                "context_processors": [
+                    "django.template.context_processors.request",
+                    f"{__name__}._counting_processor",
+                ],
+            },
+        }
+    ]
+)
+class RenderEachTests(SimpleTestCase):
+    """Tests for render_each()."""
+
+    def setUp(self):
+        self.request = RequestFactory().get("/feed/")
+
+    def test_matches_joined_render_to_string(self):
+        """Output is identical to rendering each item separately."""
+        contexts = [{"entry": "a"}, {"entry": "b", "extra": "x"}]
+
+        expected = "".join(
+            render_to_string("item.html", ctx, request=self.request) for ctx in contexts
+        )
+
+        self.assertEqual(render_each("item.html", contexts, self.request), expected)
+        self.assertEqual(expected, "[a:/feed/][b+x:/feed/]")
+
+    def test_item_variables_do_not_leak(self):
+        """A variable set for one item is gone for the next."""
+        html = render_each("item.html", [{"entry": "a", "extra": "x"}, {"entry": "b"}])
+
+        self.assertEqual(html, "[a+x:][b:]")
+
+    def test_context_processors_run_once(self):
+        """Context processors run once per call, not once per item."""
+        with patch.dict(_processor_calls, clear=True):
+            render_each("item.html", [{"entry": i} for i in range(5)], self.request)
+            self.assertEqual(_processor_calls["calls"], 1)
+
+    def test_empty_items_render_empty_string(self):
+        """No items produce an empty string."""
+        self.assertEqual(render_each("item.html", [], self.request), "")
+
+    def test_empty_items_skip_template_engine(self):
+        """An empty page loads no template and runs no context processors."""
+        with (
+            patch.dict(_processor_calls, clear=True),
+            patch("flipfix.apps.core.rendering.Engine.get_default") as get_default,
+        ):
+            self.assertEqual(render_each("item.html", iter([]), self.request), "")
+            self.assertEqual(_processor_calls["calls"], 0)
+        get_default.assert_not_called()
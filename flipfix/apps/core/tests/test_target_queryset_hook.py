@@ -29,6 +29,7 @@ from flipfix.apps.core.models import RecordReference
 from flipfix.apps.core.test_utils import (
     SuppressRequestLogsMixin,
     TestDataMixin,
+    create_machine,
 )
 from flipfix.apps.maintenance.models import LogEntry
 
@@ -88,12 +89,12 @@ class TargetQuerysetHookTests(SuppressRequestLogsMixin, TestDataMixin, TestCase)
         super().setUp()
         suffix = uuid.uuid4().hex[:8]
         self.model = MachineModel.objects.create(name=f"Model {suffix}", slug=f"model-{suffix}")
-        self.in_scope = MachineInstance.objects.create(
+        self.in_scope = create_machine(
             model=self.model,
             name=f"In Scope {suffix}",
             slug=f"{IN_SCOPE_PREFIX}{suffix}",
         )
-        self.out_of_scope = MachineInstance.objects.create(
+        self.out_of_scope = create_machine(
             model=self.model,
             name=f"Out Of Scope {suffix}",
             slug=f"other-{suffix}",
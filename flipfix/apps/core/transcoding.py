@@ -2,17 +2,20 @@
 
 from __future__ import annotations
 
-import json
 import logging
 import os
+import re
+import shlex
 import subprocess
 import tempfile
 import time
+from functools import lru_cache
 from pathlib import Path
 
 import requests
 from decouple import config
 from django_q.tasks import async_task
+from requests_toolbelt import MultipartEncoder
 
 from flipfix.apps.core.models import get_media_model
 from flipfix.logging import bind_log_context, current_log_context, reset_log_context
@@ -27,15 +30,29 @@ class TransferError(Exception):
 # Worker service settings for HTTP transfer
 DJANGO_WEB_SERVICE_URL = config("DJANGO_WEB_SERVICE_URL", default=None)
 TRANSCODING_UPLOAD_TOKEN = config("TRANSCODING_UPLOAD_TOKEN", default=None)
+TRANSFER_CHUNK_SIZE = 1024 * 1024  # Bytes per read when streaming files to/from the web service
 
 # FFmpeg encoding settings
 MAX_VIDEO_DIMENSION = 2400  # Maximum width/height to prevent huge output files
 # Allowlist of trusted binaries for subprocess calls
 TRUSTED_BINARIES = frozenset({"ffmpeg", "ffprobe"})
 VIDEO_CRF_QUALITY = "23"  # CRF quality (18-28 range, lower = better quality)
-VIDEO_PRESET = "medium"  # Encoding speed preset (slower = better compression)
+VIDEO_PRESET = "veryfast"  # libx264 speed preset (slower = better compression)
 AUDIO_BITRATE = "128k"  # Audio bitrate
 POSTER_WIDTH = 320  # Thumbnail width in pixels
+POSTER_JPEG_QSCALE = "5"  # ffmpeg JPEG qscale (2-31, lower = better); ~quality 80
+
+# H.264 encoders in order of preference, with their rate-control arguments.
+# Hardware encoders are only used if a test encode succeeds on this host.
+H264_ENCODER_ARGS: dict[str, list[str]] = {
+    # -b:v 0 lifts NVENC's default bitrate target so -cq alone sets quality
+    "h264_nvenc": ["-preset", "p4", "-rc", "vbr", "-cq", VIDEO_CRF_QUALITY, "-b:v", "0"],
+    "libx264": ["-crf", VIDEO_CRF_QUALITY, "-preset", VIDEO_PRESET],
+}
+SOFTWARE_H264_ENCODER = "libx264"
+
+# ffmpeg prints e.g. "Duration: 00:01:23.45, start: ..." for each input
+_DURATION_RE = re.compile(r"Duration: (\d+):(\d{2}):(\d{2}(?:\.\d+)?)")
 
 
 def _get_transcoding_config(
@@ -94,17 +111,17 @@ def transcode_video_job(
     log_context: dict | None = None,
     *,
     download=None,
-    probe=None,
     run_ffmpeg=None,
     upload=None,
+    detect_encoder=None,
 ) -> None:
     """Transcode video to H.264/AAC MP4, extract poster, upload to web service."""
     token = bind_log_context(**log_context) if log_context else None
 
     download_fn = download or _download_source_file
-    probe_fn = probe or _probe_duration_seconds
     run_ffmpeg_fn = run_ffmpeg or _run_ffmpeg
     upload_fn = upload or _upload_transcoded_files
+    detect_encoder_fn = detect_encoder or detect_h264_encoder
 
     try:
         media_model = get_media_model(model_name)
@@ -140,55 +157,19 @@ def transcode_video_job(
         tmp_source = download_fn(media_id, model_name, web_service_url, upload_token)
         input_path = Path(tmp_source)
 
-        duration_seconds = probe_fn(input_path)
-        if duration_seconds is not None:
-            media.duration = duration_seconds
-            media.save(update_fields=["duration", "updated_at"])
-
         tmp_video = tempfile.NamedTemporaryFile(suffix=".mp4", delete=False)
-        run_ffmpeg_fn(
-            [
-                "ffmpeg",
-                "-i",
-                str(input_path),
-                "-vf",
-                f"scale=min(iw\\,{MAX_VIDEO_DIMENSION}):min(ih\\,{MAX_VIDEO_DIMENSION}):force_original_aspect_ratio=decrease",
-                "-c:v",
-                "libx264",
-                "-pix_fmt",
-                "yuv420p",
-                "-profile:v",
-                "main",
-                "-crf",
-                VIDEO_CRF_QUALITY,
-                "-preset",
-                VIDEO_PRESET,
-                "-c:a",
-                "aac",
-                "-b:a",
-                AUDIO_BITRATE,
-                "-movflags",
-                "+faststart",
-                "-y",
-                tmp_video.name,
-            ]
-        )
-
         tmp_poster = tempfile.NamedTemporaryFile(suffix=".jpg", delete=False)
-        run_ffmpeg_fn(
-            [
-                "ffmpeg",
-                "-i",
-                str(input_path),
-                "-vf",
-                f"thumbnail,scale={POSTER_WIDTH}:-2",
-                "-frames:v",
-                "1",
-                "-y",
-                tmp_poster.name,
-            ]
+        stderr = run_ffmpeg_fn(
+            _build_ffmpeg_command(
+                input_path, tmp_video.name, tmp_poster.name, encoder=detect_encoder_fn()
+            )
         )
 
+        duration_seconds = _parse_duration_seconds(stderr or "")
+        if duration_seconds is not None:
+            media.duration = duration_seconds
+            media.save(update_fields=["duration", "updated_at"])
+
         # Upload transcoded files to web service via HTTP
         upload_fn(
             media_id,
@@ -299,7 +280,7 @@ def _download_source_file(
                 # Stream to temp file
                 tmp = tempfile.NamedTemporaryFile(suffix=ext, delete=False)
                 try:
-                    for chunk in response.iter_content(chunk_size=8192):
+                    for chunk in response.iter_content(chunk_size=TRANSFER_CHUNK_SIZE):
                         tmp.write(chunk)
                     tmp.close()
                     logger.info(
@@ -379,12 +360,20 @@ def _upload_transcoded_files(
             )
 
             with open(video_path, "rb") as video_file, open(poster_path, "rb") as poster_file:
-                files = {
-                    "video_file": ("video.mp4", video_file, "video/mp4"),
-                    "poster_file": ("poster.jpg", poster_file, "image/jpeg"),
-                }
-
-                response = requests.post(upload_url, files=files, headers=headers, timeout=300)
+                # Stream the multipart body from disk; requests' files= would
+                # build the whole (often hundreds of MB) body in memory first.
+                body = MultipartEncoder(
+                    fields={
+                        "video_file": ("video.mp4", video_file, "video/mp4"),
+                        "poster_file": ("poster.jpg", poster_file, "image/jpeg"),
+                    }
+                )
+                response = requests.post(
+                    upload_url,
+                    data=body,
+                    headers={**headers, "Content-Type": body.content_type},
+                    timeout=300,
+                )
 
             if response.status_code == 200:
                 result = response.json()
@@ -413,42 +402,140 @@ def _upload_transcoded_files(
             _sleep_with_backoff(attempt, max_retries, str(e))
 
 
-def _probe_duration_seconds(input_path: Path) -> int | None:
-    """Return duration in whole seconds using ffprobe."""
-    cmd = [
-        "ffprobe",
-        "-v",
-        "quiet",
-        "-print_format",
-        "json",
-        "-show_entries",
-        "format=duration",
+@lru_cache(maxsize=1)
+def detect_h264_encoder() -> str:
+    """Return the preferred H.264 encoder that works on this host.
+
+    ffmpeg builds often list hardware encoders without the device being
+    present, so each candidate is checked with a one-frame test encode.
+    The result is cached for the life of the process.
+    """
+    for encoder in H264_ENCODER_ARGS:
+        if encoder == SOFTWARE_H264_ENCODER:
+            break
+        cmd = [
+            "ffmpeg",
+            "-hide_banner",
+            "-f",
+            "lavfi",
+            "-i",
+            "color=c=black:s=256x256",
+            "-frames:v",
+            "1",
+            "-c:v",
+            encoder,
+            "-f",
+            "null",
+            "-",
+        ]
+        _check_trusted_binary(cmd)
+        try:
+            subprocess.run(cmd, check=True, capture_output=True, timeout=30)
+        except (subprocess.SubprocessError, OSError):
+            continue
+        logger.info("Using hardware H.264 encoder %s", encoder)
+        return encoder
+    return SOFTWARE_H264_ENCODER
+
+
+def _build_ffmpeg_command(
+    input_path: Path,
+    video_path: str,
+    poster_path: str,
+    encoder: str,
+) -> list[str]:
+    """Build one ffmpeg command that writes both the transcoded MP4 and the poster.
+
+    The input is demuxed and decoded once; ``split`` feeds the same frames to
+    the scaled video output and to the poster branch. The poster branch
+    scales down before ``thumbnail`` so its per-frame histograms run on
+    poster-sized frames rather than full-resolution ones.
+
+    Args:
+        input_path: Source video file.
+        video_path: Output path for the transcoded MP4.
+        poster_path: Output path for the poster JPEG.
+        encoder: H.264 encoder name, a key of ``H264_ENCODER_ARGS``.
+    """
+    scale = (
+        f"scale=min(iw\\,{MAX_VIDEO_DIMENSION}):min(ih\\,{MAX_VIDEO_DIMENSION})"
+        ":force_original_aspect_ratio=decrease"
+    )
+    return [
+        "ffmpeg",
+        "-y",
+        "-i",
         str(input_path),
+        "-filter_complex",
+        f"[0:v]split=2[v][p];[v]{scale}[vout];[p]scale={POSTER_WIDTH}:-2,thumbnail[poster]",
+        # Video output
+        "-map",
+        "[vout]",
+        "-map",
+        "0:a?",
+        "-c:v",
+        encoder,
+        *H264_ENCODER_ARGS[encoder],
+        "-pix_fmt",
+        "yuv420p",
+        "-profile:v",
+        "main",
+        "-c:a",
+        "aac",
+        "-b:a",
+        AUDIO_BITRATE,
+        "-movflags",
+        "+faststart",
+        video_path,
+        # Poster output
+        "-map",
+        "[poster]",
+        "-frames:v",
+        "1",
+        "-q:v",
+        POSTER_JPEG_QSCALE,
+        poster_path,
     ]
-    if cmd[0] not in TRUSTED_BINARIES:
-        return None
-    try:
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-        payload = json.loads(result.stdout or "{}")
-        duration = payload.get("format", {}).get("duration")
-        if duration is None:
-            return None
-        return int(float(duration))
-    except (subprocess.CalledProcessError, json.JSONDecodeError, ValueError, OSError):
+
+
+def _parse_duration_seconds(ffmpeg_stderr: str) -> int | None:
+    """Return the input duration in whole seconds from ffmpeg's stderr banner."""
+    match = _DURATION_RE.search(ffmpeg_stderr)
+    if match is None:
         return None
+    hours, minutes, seconds = match.groups()
+    return int(hours) * 3600 + int(minutes) * 60 + int(float(seconds))
+
+
+class _LoggedCommand:
+    """Defer quoting argv for log messages until a handler actually emits them."""
+
+    __slots__ = ("cmd",)
 
+    def __init__(self, cmd: list[str]):
+        self.cmd = cmd
 
-def _run_ffmpeg(cmd: list[str]) -> None:
-    """Run ffmpeg/ffprobe with basic logging."""
+    def __str__(self) -> str:
+        return shlex.join(self.cmd)
+
+
+def _check_trusted_binary(cmd: list[str]) -> None:
+    """Raise ValueError unless the command runs one of ``TRUSTED_BINARIES``."""
     if cmd[0] not in TRUSTED_BINARIES:
         raise ValueError(f"Untrusted binary: {cmd[0]}")
-    logger.info("Running command: %s", " ".join(cmd))
+
+
+def _run_ffmpeg(cmd: list[str]) -> str:
+    """Run ffmpeg with basic logging and return its stderr output."""
+    _check_trusted_binary(cmd)
+    logger.info("Running command: %s", _LoggedCommand(cmd))
     try:
         result = subprocess.run(cmd, check=True, capture_output=True, text=True)
         if result.stdout:
             logger.debug("FFmpeg stdout: %s", result.stdout)
         if result.stderr:
             logger.debug("FFmpeg stderr: %s", result.stderr)
+        return result.stderr or ""
     except subprocess.CalledProcessError as e:
         logger.error("FFmpeg command failed with exit code %d", e.returncode)
         if e.stdout:
@@ -1,12 +1,11 @@
 """Global activity feed views."""
 
-from django.http import JsonResponse
-from django.template.loader import render_to_string
 from django.views import View
 from django.views.generic import TemplateView
 
 from flipfix.apps.core.feed import PageCursor, get_feed_page
 from flipfix.apps.core.forms import SearchForm
+from flipfix.apps.core.rendering import render_scroll_page
 from flipfix.apps.maintenance.models import ProblemReport
 from flipfix.apps.parts.models import PartRequest
 
@@ -65,19 +64,9 @@ class GlobalActivityFeedPartialView(View):
             search_query=search_query,
         )
 
-        items_html = "".join(
-            render_to_string(
-                "core/partials/global_activity_entry.html",
-                {"entry": entry},
-                request=request,
-            )
-            for entry in page_items
-        )
-
-        return JsonResponse(
-            {
-                "items": items_html,
-                "has_next": has_next,
-                "next_page": page_num + 1 if has_next else None,
-            }
+        return render_scroll_page(
+            "core/partials/global_activity_entry.html",
+            ({"entry": entry} for entry in page_items),
+            request,
+            next_page=page_num + 1 if has_next else None,
         )
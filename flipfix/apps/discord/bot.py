@@ -761,8 +761,8 @@ def _format_media_counts(attachments: list[discord.Attachment]) -> str | None:
     if not attachments:
         return None
 
-    photos = sum(1 for a in attachments if not _is_video(a.filename))
     videos = sum(1 for a in attachments if _is_video(a.filename))
+    photos = len(attachments) - videos
 
     parts = []
     if photos:
@@ -17,7 +17,6 @@ from __future__ import annotations
 import importlib
 import logging
 import pkgutil
-import re
 from datetime import datetime
 from typing import Any
 
@@ -50,7 +49,7 @@ class BotRecordHandler:
     media_model_name: str | None = None  # e.g., "LogEntryMedia"
 
     # --- Context parsing (for recognizing webhook embeds in Discord messages) ---
-    url_pattern: re.Pattern[str] | None = None  # e.g., re.compile(r"/logs/(\d+)$")
+    url_path_prefix: str | None = None  # e.g., "logs" — detail pages live at /logs/<id>/
 
     def create_from_suggestion(
         self,
@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import logging
-import re
 from datetime import datetime
 from typing import TYPE_CHECKING
 
@@ -27,7 +26,7 @@ class LogEntryBotHandler(BotRecordHandler):
     parent_handler_name = "problem_report"
     child_type_name = None
     media_model_name = "LogEntryMedia"
-    url_pattern = re.compile(r"/logs/(\d+)$")
+    url_path_prefix = "logs"
 
     def create_from_suggestion(
         self,
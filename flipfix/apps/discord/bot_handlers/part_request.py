@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import re
 from datetime import datetime
 from typing import TYPE_CHECKING
 
@@ -24,7 +23,7 @@ class PartRequestBotHandler(BotRecordHandler):
     parent_handler_name = None
     child_type_name = "part_request_update"
     media_model_name = "PartRequestMedia"
-    url_pattern = re.compile(r"/parts/(\d+)$")
+    url_path_prefix = "parts"
 
     def create_from_suggestion(
         self,
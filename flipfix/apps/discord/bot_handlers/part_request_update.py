@@ -23,7 +23,7 @@ class PartRequestUpdateBotHandler(BotRecordHandler):
     parent_handler_name = "part_request"
     child_type_name = None
     media_model_name = "PartRequestUpdateMedia"
-    url_pattern = None  # Updates share parent's URL, no distinct pattern
+    url_path_prefix = None  # Updates share parent's URL, no distinct path
 
     def create_from_suggestion(
         self,
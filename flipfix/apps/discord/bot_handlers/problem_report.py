@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import re
 from datetime import datetime
 from typing import TYPE_CHECKING
 
@@ -24,7 +23,7 @@ class ProblemReportBotHandler(BotRecordHandler):
     parent_handler_name = None
     child_type_name = "log_entry"
     media_model_name = "ProblemReportMedia"
-    url_pattern = re.compile(r"/problem-reports/(\d+)$")
+    url_path_prefix = "problem-reports"
 
     def create_from_suggestion(
         self,
@@ -15,7 +15,9 @@ import logging
 import re
 from dataclasses import dataclass, field
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
+from typing import TYPE_CHECKING
 from urllib.parse import urlparse
 
 import discord
@@ -25,6 +27,9 @@ from flipfix.apps.core.media import ALLOWED_MEDIA_EXTENSIONS
 from flipfix.apps.discord.models import DiscordMessageMapping
 from flipfix.apps.discord.types import DiscordUserInfo
 
+if TYPE_CHECKING:
+    from flipfix.apps.discord.bot_handlers import BotRecordHandler
+
 logger = logging.getLogger(__name__)
 
 # Context gathering limits
@@ -733,25 +738,39 @@ def _is_flipfix_url(url: str) -> bool:
 def _parse_flipfix_url(url: str) -> tuple[str, int, str | None] | None:
     """Parse a Flipfix URL to extract record type and ID.
 
-    Iterates over registered bot handlers to match URL patterns.
+    Record detail paths have the shape ``/<prefix>/<id>/``, so the first path
+    segment is looked up directly in the bot handlers' ``url_path_prefix`` index.
     Returns (record_type, record_id, machine_id) or None if no match.
 
     The third element (machine_id) is always None since detail pages don't
     include machine slugs in their URLs.
     """
-    from flipfix.apps.discord.bot_handlers import get_all_bot_handlers
-
     try:
-        parsed = urlparse(url)
-        path = parsed.path.rstrip("/")
-
-        for handler in get_all_bot_handlers():
-            if handler.url_pattern is None:
-                continue
-            match = handler.url_pattern.match(path)
-            if match:
-                return (handler.record_type, int(match.group(1)), None)
+        path = urlparse(url).path
+    except ValueError:
+        return None
 
+    # "/logs/123/" -> ["", "logs", "123"]
+    segments = path.rstrip("/").split("/")
+    if len(segments) != 3 or segments[0] or not segments[2].isdecimal():
         return None
-    except Exception:
+
+    handler = _bot_handlers_by_url_prefix().get(segments[1])
+    if handler is None:
         return None
+    return (handler.record_type, int(segments[2]), None)
+
+
+@lru_cache(maxsize=1)
+def _bot_handlers_by_url_prefix() -> dict[str, BotRecordHandler]:
+    """Index bot handlers by the first path segment of their detail URLs.
+
+    The handler registry is fixed once discovery runs at startup.
+    """
+    from flipfix.apps.discord.bot_handlers import get_all_bot_handlers
+
+    return {
+        handler.url_path_prefix: handler
+        for handler in get_all_bot_handlers()
+        if handler.url_path_prefix is not None
+    }
@@ -22,6 +22,11 @@ if TYPE_CHECKING:
 # Discord's hard ceiling for an embed description.
 DISCORD_POST_DESCRIPTION_MAX_CHARS = 4096
 
+# Discord's per-message ceilings: at most 10 embeds, whose text (titles,
+# descriptions, fields, footers, author names) totals at most 6000 characters.
+DISCORD_MAX_EMBEDS_PER_MESSAGE = 10
+DISCORD_MAX_EMBED_CHARS_PER_MESSAGE = 6000
+
 # Notifications summarise; they are not the record. Cap the body at roughly a
 # couple hundred words so a long entry (e.g. a pasted intake checklist) doesn't
 # fill several screens — the title always links to the full record.
@@ -228,6 +233,16 @@ def _sanitize_link_text(text: str) -> str:
     return flattened or "(no description)"
 
 
+def embed_text_length(embed: dict) -> int:
+    """Count the characters of an embed that Discord's 6000-per-message cap covers."""
+    length = len(embed.get("title", "")) + len(embed.get("description", ""))
+    length += len(embed.get("footer", {}).get("text", ""))
+    length += len(embed.get("author", {}).get("name", ""))
+    for embed_field in embed.get("fields", []):
+        length += len(embed_field.get("name", "")) + len(embed_field.get("value", ""))
+    return length
+
+
 # Discord colour for the combined per-actor digest (blue, matching log entries).
 DIGEST_COLOR = 3447003
 
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 import anthropic
@@ -78,11 +79,15 @@ class AnalysisResult:
         return cls(suggestions=[], error=error)
 
 
-def _get_valid_record_types() -> set[str]:
-    """Return the set of valid record type names from the bot handler registry."""
+@lru_cache(maxsize=1)
+def _get_valid_record_types() -> frozenset[str]:
+    """Return the valid record type names from the bot handler registry.
+
+    The handler registry is fixed once discovery runs at startup.
+    """
     from flipfix.apps.discord.bot_handlers import get_all_bot_handlers
 
-    return {h.name for h in get_all_bot_handlers()}
+    return frozenset(h.name for h in get_all_bot_handlers())
 
 
 def _get_child_type(parent_record_type: str) -> str | None:
@@ -430,9 +435,11 @@ async def _call_anthropic(
 
 @sync_to_async
 def _get_machines_for_prompt() -> list[dict]:
-    """Get list of machines for the LLM prompt."""
-    machines = MachineInstance.objects.all()
-    return [{"slug": m.slug, "name": m.name} for m in machines]
+    """Get list of machines for the LLM prompt.
+
+    Only the two columns the prompt uses are fetched, as plain dicts.
+    """
+    return [dict(row) for row in MachineInstance.objects.values("slug", "name")]
 
 
 def build_yaml_prompt(
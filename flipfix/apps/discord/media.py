@@ -8,6 +8,7 @@ Instead, it downloads from Discord CDN and uploads to the web service's media AP
 from __future__ import annotations
 
 import logging
+from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -64,15 +65,26 @@ def _get_media_model_name(record: Model) -> str:
     Looks up the bot handler for the record type to find the media model name.
     Matches by model class identity rather than naming convention.
     """
+    return _media_model_name_for_class(type(record))
+
+
+@lru_cache(maxsize=16)
+def _media_model_name_for_class(model_class: type[Model]) -> str:
+    """Resolve a record class to its media model name, cached per class.
+
+    The handler registry is fixed once discovery runs at startup, so the
+    answer for a given class never changes. Unknown classes raise and are
+    not cached.
+    """
     from flipfix.apps.discord.bot_handlers import get_all_bot_handlers
 
     for handler in get_all_bot_handlers():
         if not handler.media_model_name:
             continue
-        if isinstance(record, handler.get_model_class()):
+        if issubclass(model_class, handler.get_model_class()):
             return handler.media_model_name
 
-    raise ValueError(f"No media model name configured for: {type(record).__name__}")
+    raise ValueError(f"No media model name configured for: {model_class.__name__}")
 
 
 async def download_and_create_media(
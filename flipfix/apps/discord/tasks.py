@@ -4,13 +4,15 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass
-from datetime import timedelta
+from datetime import datetime, timedelta
 from typing import TYPE_CHECKING
 
 import requests
 from django.db import transaction
 from django.utils import timezone
 from django_q.tasks import async_task
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from flipfix.apps.discord.models import DiscordMessageMapping, PendingNotification
 from flipfix.logging import bind_log_context, current_log_context, reset_log_context
@@ -22,6 +24,20 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# One Session per worker process so successive webhook posts reuse a warm
+# keep-alive TLS connection to discord.com instead of handshaking every time.
+# Only connection failures are retried: the request never reached Discord, so
+# a retry cannot double-post. Read and status errors are left to the caller.
+_session = requests.Session()
+_session.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=16,
+        max_retries=Retry(total=2, connect=2, read=0, status=0, backoff_factor=0.2),
+    ),
+)
+
 
 @dataclass(frozen=True)
 class WebhookDeliveryResult:
@@ -29,7 +45,7 @@ class WebhookDeliveryResult:
 
     status: str  # "success", "error", "skipped"
     reason: str | None = None  # Why skipped or errored
-    status_code: int | None = None  # HTTP status code on success
+    status_code: int | None = None  # HTTP status code, when a response arrived
 
 
 def dispatch_webhook(handler_name: str, object_id: int) -> None:
@@ -141,7 +157,7 @@ def deliver_webhook(
 def _post_json(url: str, payload: dict) -> WebhookDeliveryResult:
     """POST a prepared payload to a Discord webhook URL."""
     try:
-        response = requests.post(
+        response = _session.post(
             url,
             json=payload,
             timeout=10,
@@ -154,7 +170,8 @@ def _post_json(url: str, payload: dict) -> WebhookDeliveryResult:
             "discord_webhook_delivery_failed",
             extra={"error": str(e)},
         )
-        return WebhookDeliveryResult(status="error", reason=str(e))
+        status_code = e.response.status_code if e.response is not None else None
+        return WebhookDeliveryResult(status="error", reason=str(e), status_code=status_code)
 
 
 def _deliver_to_url(
@@ -184,6 +201,13 @@ def flush_pending_notifications() -> WebhookDeliveryResult:
     ``COALESCE_QUIET_PERIOD`` (a true debounce) or the oldest event has waited
     ``COALESCE_MAX_WAIT`` (a latency cap for continuously-active actors).
 
+    Each due actor still gets their own message (embeds), but the run packs
+    those messages into as few webhook POSTs as Discord's per-message embed
+    limits allow, so several maintainers finishing at once cost one round trip
+    rather than one each. If Discord rejects a shared POST with a 4xx, that
+    batch is re-sent one actor per POST, so a single bad message only holds
+    back its own actor's rows.
+
     Delivery is **at-least-once**. Each actor's due rows are selected under a
     short row lock (``select_for_update(skip_locked=True)``) that is released
     before the network call, so the Discord POST never runs inside a database
@@ -200,13 +224,16 @@ def flush_pending_notifications() -> WebhookDeliveryResult:
         return WebhookDeliveryResult(status="skipped", reason="webhooks globally disabled")
 
     now = timezone.now()
+    # Order by the selected column: the model's default ordering would otherwise
+    # join the DISTINCT and repeat an actor once per buffered row.
     actor_ids = list(
         PendingNotification.objects.filter(sent_at__isnull=True)
+        .order_by("actor_id")
         .values_list("actor_id", flat=True)
         .distinct()
     )
 
-    flushed = 0
+    due: list[tuple[list[PendingNotification], list[dict]]] = []
     for actor_id in actor_ids:
         # Select the actor's due rows under a brief lock, then release it — the
         # HTTP POST below must not hold a transaction/connection open.
@@ -221,28 +248,83 @@ def flush_pending_notifications() -> WebhookDeliveryResult:
             quiet = now - rows[-1].buffered_at >= COALESCE_QUIET_PERIOD
             capped = now - rows[0].buffered_at >= COALESCE_MAX_WAIT
             if not (quiet or capped):
-                rows = []
-        if not rows:
+                continue
+
+        payload = _build_pending_payload(rows)
+        if payload is None:
+            # Every referenced record has since vanished; consume the rows
+            # anyway so they don't linger.
+            _mark_sent(rows, now)
             continue
+        due.append((rows, payload["embeds"]))
 
-        result = _deliver_pending(config.DISCORD_WEBHOOK_URL, rows)
-        # "empty" means every referenced record has since vanished; consume the
-        # rows anyway so they don't linger. On a delivery error, leave them
-        # un-sent to retry next run.
-        if result.status in ("success", "empty"):
-            PendingNotification.objects.filter(
-                pk__in=[r.pk for r in rows], sent_at__isnull=True
-            ).update(sent_at=now)
-            flushed += 1
+    flushed = 0
+    for batch in _pack_messages(due):
+        embeds = [embed for _, actor_embeds in batch for embed in actor_embeds]
+        result = _post_json(config.DISCORD_WEBHOOK_URL, {"embeds": embeds})
+        if result.status == "success":
+            _mark_sent([row for rows, _ in batch for row in rows], now)
+            flushed += len(batch)
+            continue
+        # Packing is deterministic, so a rejected message would sink the same
+        # batch every run; retry it per actor to isolate the bad message. Any
+        # other error (timeout, 5xx) leaves the rows un-sent to retry next run.
+        if len(batch) > 1 and _is_client_error(result):
+            for rows, actor_embeds in batch:
+                result = _post_json(config.DISCORD_WEBHOOK_URL, {"embeds": actor_embeds})
+                if result.status == "success":
+                    _mark_sent(rows, now)
+                    flushed += 1
 
     return WebhookDeliveryResult(status="success", reason=f"flushed {flushed} actor(s)")
 
 
-def _deliver_pending(url: str, rows: list[PendingNotification]) -> WebhookDeliveryResult:
-    """Deliver a single actor's buffered rows as one message.
+def _is_client_error(result: WebhookDeliveryResult) -> bool:
+    """Return True if Discord answered the POST with a 4xx (other than rate limiting)."""
+    code = result.status_code
+    return code is not None and 400 <= code < 500 and code != 429
+
+
+def _mark_sent(rows: list[PendingNotification], now: datetime) -> None:
+    """Mark buffered rows delivered, skipping any a concurrent flush already sent."""
+    PendingNotification.objects.filter(pk__in=[r.pk for r in rows], sent_at__isnull=True).update(
+        sent_at=now
+    )
+
+
+def _pack_messages(
+    due: list[tuple[list[PendingNotification], list[dict]]],
+) -> list[list[tuple[list[PendingNotification], list[dict]]]]:
+    """Group per-actor messages into POST-sized batches, keeping each actor's embeds whole."""
+    from flipfix.apps.discord.formatters import (
+        DISCORD_MAX_EMBED_CHARS_PER_MESSAGE,
+        DISCORD_MAX_EMBEDS_PER_MESSAGE,
+        embed_text_length,
+    )
+
+    batches: list[list[tuple[list[PendingNotification], list[dict]]]] = []
+    embed_count = char_count = 0
+    for rows, embeds in due:
+        chars = sum(embed_text_length(embed) for embed in embeds)
+        if (
+            not batches
+            or embed_count + len(embeds) > DISCORD_MAX_EMBEDS_PER_MESSAGE
+            or char_count + chars > DISCORD_MAX_EMBED_CHARS_PER_MESSAGE
+        ):
+            batches.append([])
+            embed_count = char_count = 0
+        batches[-1].append((rows, embeds))
+        embed_count += len(embeds)
+        char_count += chars
+    return batches
+
+
+def _build_pending_payload(rows: list[PendingNotification]) -> dict | None:
+    """Build a single actor's buffered rows into one message payload.
 
     A single surviving event keeps its rich per-record embed (with photos); two
-    or more collapse into a compact per-machine digest.
+    or more collapse into a compact per-machine digest. Returns ``None`` when
+    every referenced record has been deleted.
     """
     from flipfix.apps.discord.webhook_handlers import get_webhook_handler
 
@@ -257,12 +339,12 @@ def _deliver_pending(url: str, rows: list[PendingNotification]) -> WebhookDelive
         deliverables.append((handler, obj))
 
     if not deliverables:
-        return WebhookDeliveryResult(status="empty")
+        return None
     if len(deliverables) == 1:
         handler, obj = deliverables[0]
-        return _deliver_to_url(url, handler, obj)
+        return handler.format_webhook_message(obj)
 
-    return _post_json(url, _build_combined_payload(deliverables))
+    return _build_combined_payload(deliverables)
 
 
 def _build_combined_payload(deliverables: list[tuple[WebhookHandler, Model]]) -> dict:
@@ -330,7 +412,7 @@ def post_daily_maintenance_report() -> WebhookDeliveryResult:
     # Angle brackets suppress Discord's link-preview embed card.
     content = _fit_discord_content(render_markdown(build_report()), f"🔗 Full board: <{board_url}>")
     try:
-        response = requests.post(
+        response = _session.post(
             webhook_url,
             json={"content": content},
             timeout=10,
@@ -359,7 +441,7 @@ def send_test_webhook(event_type: str) -> dict:
 
     try:
         payload = format_test_message(event_type)
-        response = requests.post(
+        response = _session.post(
             webhook_url,
             json=payload,
             timeout=10,
@@ -32,7 +32,8 @@ def _event(fired_at, *, actor="u:1", machine_id=1, event_type="log_entry") -> Ev
 @tag("commands")
 class ClusteringHelperTests(TestCase):
     def setUp(self):
-        self.base = timezone.now()
+        # Hour-aligned so a few minutes of events never straddle a global_peaks bucket edge
+        self.base = timezone.now().replace(minute=0, second=0, microsecond=0)
 
     def test_gap_splits_when_silence_exceeds_threshold(self):
         events = [
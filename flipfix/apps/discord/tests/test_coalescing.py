@@ -126,7 +126,7 @@ class FlushTests(TestCase):
         )
         return pending
 
-    @patch("flipfix.apps.discord.tasks.requests.post")
+    @patch("flipfix.apps.discord.tasks._session.post")
     def test_combines_events_by_machine(self, mock_post):
         mock_post.return_value = _ok_response()
         other = create_machine()
@@ -152,7 +152,7 @@ class FlushTests(TestCase):
         self.assertIn(other.short_display_name, embed["description"])
         self.assertEqual(PendingNotification.objects.filter(sent_at__isnull=True).count(), 0)
 
-    @patch("flipfix.apps.discord.tasks.requests.post")
+    @patch("flipfix.apps.discord.tasks._session.post")
     def test_waits_while_actor_still_active(self, mock_post):
         log = create_log_entry(machine=self.machine, created_by=self.user)
         self._buffer("log_entry", log, minutes_ago=2)  # < 5 min quiet, < 15 min cap
@@ -163,7 +163,7 @@ class FlushTests(TestCase):
         self.assertEqual(result.status, "success")  # ran, but flushed nobody
         self.assertEqual(PendingNotification.objects.filter(sent_at__isnull=True).count(), 1)
 
-    @patch("flipfix.apps.discord.tasks.requests.post")
+    @patch("flipfix.apps.discord.tasks._session.post")
     def test_max_wait_cap_flushes_active_actor(self, mock_post):
         mock_post.return_value = _ok_response()
         old = create_log_entry(machine=self.machine, created_by=self.user, text="first")
@@ -176,7 +176,7 @@ class FlushTests(TestCase):
         mock_post.assert_called_once()
         self.assertEqual(PendingNotification.objects.filter(sent_at__isnull=True).count(), 0)
 
-    @patch("flipfix.apps.discord.tasks.requests.post")
+    @patch("flipfix.apps.discord.tasks._session.post")
     def test_single_event_keeps_rich_embed(self, mock_post):
         mock_post.return_value = _ok_response()
         log = create_log_entry(machine=self.machine, created_by=self.user, text="Solo entry")
@@ -190,8 +190,8 @@ class FlushTests(TestCase):
         self.assertNotIn("update", title.lower())
         self.assertIn(self.machine.short_display_name, title)
 
-    @patch("flipfix.apps.discord.tasks.requests.post")
-    def test_separate_actors_get_separate_messages(self, mock_post):
+    @patch("flipfix.apps.discord.tasks._session.post")
+    def test_separate_actors_share_one_post(self, mock_post):
         mock_post.return_value = _ok_response()
         other_user = create_maintainer_user()
         log_a = create_log_entry(machine=self.machine, created_by=self.user, text="a")
@@ -201,9 +201,41 @@ class FlushTests(TestCase):
 
         flush_pending_notifications()
 
+        # Each actor keeps their own embed, but both ride in one webhook POST.
+        mock_post.assert_called_once()
+        self.assertEqual(len(mock_post.call_args.kwargs["json"]["embeds"]), 2)
+        self.assertEqual(PendingNotification.objects.filter(sent_at__isnull=True).count(), 0)
+
+    @patch("flipfix.apps.discord.tasks._session.post")
+    def test_actors_split_across_posts_at_embed_limit(self, mock_post):
+        mock_post.return_value = _ok_response()
+        for i in range(11):
+            user = create_maintainer_user()
+            log = create_log_entry(machine=self.machine, created_by=user, text=f"entry {i}")
+            self._buffer("log_entry", log, minutes_ago=6, actor=user)
+
+        flush_pending_notifications()
+
+        embed_counts = [len(c.kwargs["json"]["embeds"]) for c in mock_post.call_args_list]
+        self.assertEqual(embed_counts, [10, 1])
+        self.assertEqual(PendingNotification.objects.filter(sent_at__isnull=True).count(), 0)
+
+    @patch("flipfix.apps.discord.formatters.DISCORD_MAX_EMBED_CHARS_PER_MESSAGE", 1)
+    @patch("flipfix.apps.discord.tasks._session.post")
+    def test_actors_split_across_posts_at_text_limit(self, mock_post):
+        mock_post.return_value = _ok_response()
+        other_user = create_maintainer_user()
+        log_a = create_log_entry(machine=self.machine, created_by=self.user, text="a")
+        log_b = create_log_entry(machine=self.machine, created_by=other_user, text="b")
+        self._buffer("log_entry", log_a, minutes_ago=6, actor=self.user)
+        self._buffer("log_entry", log_b, minutes_ago=6, actor=other_user)
+
+        flush_pending_notifications()
+
+        # An actor's message is never split, even when it alone exceeds the cap.
         self.assertEqual(mock_post.call_count, 2)
 
-    @patch("flipfix.apps.discord.tasks.requests.post")
+    @patch("flipfix.apps.discord.tasks._session.post")
     def test_skips_deleted_records_but_delivers_survivors(self, mock_post):
         mock_post.return_value = _ok_response()
         survivor = create_log_entry(machine=self.machine, created_by=self.user, text="stays")
@@ -218,7 +250,7 @@ class FlushTests(TestCase):
         # Both rows are consumed once the group flushes.
         self.assertEqual(PendingNotification.objects.filter(sent_at__isnull=True).count(), 0)
 
-    @patch("flipfix.apps.discord.tasks.requests.post")
+    @patch("flipfix.apps.discord.tasks._session.post")
     def test_consumes_buffer_when_all_records_deleted(self, mock_post):
         log = create_log_entry(machine=self.machine, created_by=self.user)
         self._buffer("log_entry", log, minutes_ago=6)
@@ -230,7 +262,7 @@ class FlushTests(TestCase):
         self.assertEqual(PendingNotification.objects.filter(sent_at__isnull=True).count(), 0)
 
     @override_config(DISCORD_WEBHOOKS_ENABLED=False)
-    @patch("flipfix.apps.discord.tasks.requests.post")
+    @patch("flipfix.apps.discord.tasks._session.post")
     def test_flush_skips_when_webhooks_disabled(self, mock_post):
         log = create_log_entry(machine=self.machine, created_by=self.user)
         self._buffer("log_entry", log, minutes_ago=6)
@@ -241,7 +273,7 @@ class FlushTests(TestCase):
         mock_post.assert_not_called()
         self.assertEqual(PendingNotification.objects.filter(sent_at__isnull=True).count(), 1)
 
-    @patch("flipfix.apps.discord.tasks.requests.post")
+    @patch("flipfix.apps.discord.tasks._session.post")
     def test_delivery_failure_leaves_buffer_for_retry(self, mock_post):
         import requests
 
@@ -254,7 +286,60 @@ class FlushTests(TestCase):
         # Not marked sent → next run retries.
         self.assertEqual(PendingNotification.objects.filter(sent_at__isnull=True).count(), 1)
 
-    @patch("flipfix.apps.discord.tasks.requests.post")
+    @patch("flipfix.apps.discord.tasks._session.post")
+    def test_rejected_batch_falls_back_to_per_actor_posts(self, mock_post):
+        import requests
+
+        bad_user = create_maintainer_user()
+        other_user = create_maintainer_user()
+        log_bad = create_log_entry(machine=self.machine, created_by=bad_user, text="REJECT-ME")
+        log_a = create_log_entry(machine=self.machine, created_by=self.user, text="a")
+        log_b = create_log_entry(machine=self.machine, created_by=other_user, text="b")
+        self._buffer("log_entry", log_bad, minutes_ago=6, actor=bad_user)
+        self._buffer("log_entry", log_a, minutes_ago=6, actor=self.user)
+        self._buffer("log_entry", log_b, minutes_ago=6, actor=other_user)
+
+        def post(url, json, **kwargs):
+            if "REJECT-ME" not in str(json):
+                return _ok_response()
+            response = MagicMock()
+            response.status_code = 400
+            response.raise_for_status.side_effect = requests.HTTPError(
+                "400 Bad Request", response=response
+            )
+            return response
+
+        mock_post.side_effect = post
+
+        flush_pending_notifications()
+
+        # One shared POST, rejected, then one POST per actor.
+        self.assertEqual(mock_post.call_count, 4)
+        unsent = PendingNotification.objects.filter(sent_at__isnull=True)
+        self.assertEqual(list(unsent.values_list("actor_id", flat=True)), [bad_user.pk])
+
+    @patch("flipfix.apps.discord.tasks._session.post")
+    def test_server_error_does_not_fall_back_to_per_actor_posts(self, mock_post):
+        import requests
+
+        response = MagicMock()
+        response.status_code = 503
+        response.raise_for_status.side_effect = requests.HTTPError(
+            "503 Service Unavailable", response=response
+        )
+        mock_post.return_value = response
+        other_user = create_maintainer_user()
+        log_a = create_log_entry(machine=self.machine, created_by=self.user, text="a")
+        log_b = create_log_entry(machine=self.machine, created_by=other_user, text="b")
+        self._buffer("log_entry", log_a, minutes_ago=6, actor=self.user)
+        self._buffer("log_entry", log_b, minutes_ago=6, actor=other_user)
+
+        flush_pending_notifications()
+
+        mock_post.assert_called_once()
+        self.assertEqual(PendingNotification.objects.filter(sent_at__isnull=True).count(), 2)
+
+    @patch("flipfix.apps.discord.tasks._session.post")
     def test_combined_parts_events_render(self, mock_post):
         from flipfix.apps.parts.models import PartRequest
 
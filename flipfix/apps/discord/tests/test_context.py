@@ -1,6 +1,6 @@
 """Tests for Discord context gathering and YAML prompt building."""
 
-from django.test import TestCase, tag
+from django.test import SimpleTestCase, tag
 from django.urls import reverse
 
 from flipfix.apps.discord.context import (
@@ -36,7 +36,7 @@ class MockEmbed:
 
 
 @tag("tasks")
-class ParseFlipfixUrlTests(TestCase):
+class ParseFlipfixUrlTests(SimpleTestCase):
     """Tests for _parse_flipfix_url().
 
     These tests use Django's reverse() to generate URLs, ensuring
@@ -66,6 +66,12 @@ class ParseFlipfixUrlTests(TestCase):
         result = _parse_flipfix_url("https://flipfix.example.com/unknown/path/")
         self.assertIsNone(result)
 
+    def test_returns_none_for_non_detail_paths(self):
+        """Returns None for nested paths and non-numeric IDs under known prefixes."""
+        for path in ["/logs/abc/", "/logs/123/edit/", "/prefix/logs/123/", "/logs/"]:
+            with self.subTest(path=path):
+                self.assertIsNone(_parse_flipfix_url(f"https://flipfix.example.com{path}"))
+
     def test_handles_url_without_trailing_slash(self):
         """Handles URLs without trailing slashes."""
         url = _make_url("log-detail", 123).rstrip("/")
@@ -74,7 +80,7 @@ class ParseFlipfixUrlTests(TestCase):
 
 
 @tag("tasks")
-class ParseWebhookEmbedTests(TestCase):
+class ParseWebhookEmbedTests(SimpleTestCase):
     """Tests for _parse_webhook_embed().
 
     These tests use Django's reverse() to generate URLs, ensuring
@@ -127,7 +133,7 @@ class ParseWebhookEmbedTests(TestCase):
 
 
 @tag("tasks")
-class IsFlipfixUrlTests(TestCase):
+class IsFlipfixUrlTests(SimpleTestCase):
     """Tests for _is_flipfix_url().
 
     URL recognition is based on path patterns, not domain names. This avoids
@@ -164,7 +170,7 @@ class IsFlipfixUrlTests(TestCase):
 
 
 @tag("tasks")
-class EscapeYamlStringTests(TestCase):
+class EscapeYamlStringTests(SimpleTestCase):
     """Tests for _escape_yaml_string()."""
 
     def test_escapes_quotes(self):
@@ -217,7 +223,7 @@ class EscapeYamlStringTests(TestCase):
 
 
 @tag("tasks")
-class BuildYamlPromptTests(TestCase):
+class BuildYamlPromptTests(SimpleTestCase):
     """Tests for build_yaml_prompt()."""
 
     def test_includes_machines_section(self):
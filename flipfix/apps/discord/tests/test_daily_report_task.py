@@ -27,21 +27,21 @@ def _loc(name, zone):
 @tag("tasks")
 class PostDailyReportTests(TestCase):
     @override_config(DISCORD_WEBHOOK_URL="", DISCORD_WEBHOOKS_ENABLED=True)
-    @patch("flipfix.apps.discord.tasks.requests.post")
+    @patch("flipfix.apps.discord.tasks._session.post")
     def test_skips_when_no_webhook_url(self, mock_post):
         result = post_daily_maintenance_report()
         self.assertEqual(result.status, "skipped")
         mock_post.assert_not_called()
 
     @override_config(DISCORD_WEBHOOK_URL=WEBHOOK, DISCORD_WEBHOOKS_ENABLED=False)
-    @patch("flipfix.apps.discord.tasks.requests.post")
+    @patch("flipfix.apps.discord.tasks._session.post")
     def test_skips_when_webhooks_disabled(self, mock_post):
         result = post_daily_maintenance_report()
         self.assertEqual(result.status, "skipped")
         mock_post.assert_not_called()
 
     @override_config(DISCORD_WEBHOOK_URL=WEBHOOK, DISCORD_WEBHOOKS_ENABLED=True)
-    @patch("flipfix.apps.discord.tasks.requests.post")
+    @patch("flipfix.apps.discord.tasks._session.post")
     def test_posts_markdown_content_with_link(self, mock_post):
         mock_post.return_value.status_code = 204
         mock_post.return_value.raise_for_status.return_value = None
@@ -57,7 +57,7 @@ class PostDailyReportTests(TestCase):
         self.assertIn("/logs/daily-report/", payload["content"])
 
     @override_config(DISCORD_WEBHOOK_URL=WEBHOOK, DISCORD_WEBHOOKS_ENABLED=True)
-    @patch("flipfix.apps.discord.tasks.requests.post")
+    @patch("flipfix.apps.discord.tasks._session.post")
     def test_content_stays_within_discord_limit(self, mock_post):
         mock_post.return_value.status_code = 204
         mock_post.return_value.raise_for_status.return_value = None
@@ -1,68 +1,109 @@
 """Tests for webhook delivery logic."""
 
-from unittest.mock import MagicMock, patch
-
 import requests
+import responses
 from constance.test import override_config
+from django.core.files.base import ContentFile
 from django.test import TestCase, tag
 
-from flipfix.apps.core.test_utils import create_machine, create_problem_report
+from flipfix.apps.core.test_utils import (
+    TemporaryMediaMixin,
+    create_machine,
+    create_problem_report,
+)
 from flipfix.apps.discord.tasks import deliver_webhook
+from flipfix.apps.maintenance.models import ProblemReportMedia
+
+# Two constance reads (URL + enabled flag), the report with its select_related
+# joins, and the photo gallery lookup.
+DELIVERY_QUERY_COUNT = 4
+
+WEBHOOK_URL = "https://discord.com/api/webhooks/123/abc"
 
 
 @tag("tasks")
-class WebhookDeliveryTests(TestCase):
+class WebhookDeliveryTests(TemporaryMediaMixin, TestCase):
     """Tests for webhook delivery logic."""
 
-    def setUp(self):
-        self.machine = create_machine()
+    @classmethod
+    def setUpTestData(cls):
+        cls.machine = create_machine()
 
     @override_config(DISCORD_WEBHOOK_URL="")
     def test_skips_when_no_webhook_url(self):
         """Skips delivery when no webhook URL is configured."""
         report = create_problem_report(machine=self.machine)
-        result = deliver_webhook("problem_report", report.pk)
+        # Only the URL setting is read; the report itself is never fetched.
+        with self.assertNumQueries(1):
+            result = deliver_webhook("problem_report", report.pk)
 
         self.assertEqual(result.status, "skipped")
         self.assertIn("no webhook URL", result.reason)
 
     @override_config(
-        DISCORD_WEBHOOK_URL="https://discord.com/api/webhooks/123/abc",
+        DISCORD_WEBHOOK_URL=WEBHOOK_URL,
         DISCORD_WEBHOOKS_ENABLED=False,
     )
     def test_skips_when_webhooks_disabled(self):
         """Skips delivery when webhooks are globally disabled."""
         report = create_problem_report(machine=self.machine)
-        result = deliver_webhook("problem_report", report.pk)
+        # Only the two settings are read; the report itself is never fetched.
+        with self.assertNumQueries(2):
+            result = deliver_webhook("problem_report", report.pk)
 
         self.assertEqual(result.status, "skipped")
         self.assertIn("globally disabled", result.reason)
 
     @override_config(
-        DISCORD_WEBHOOK_URL="https://discord.com/api/webhooks/123/abc",
+        DISCORD_WEBHOOK_URL=WEBHOOK_URL,
         DISCORD_WEBHOOKS_ENABLED=True,
     )
-    @patch("flipfix.apps.discord.tasks.requests.post")
-    def test_successful_delivery(self, mock_post):
+    @responses.activate
+    def test_successful_delivery(self):
         """Successfully delivers webhook."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_post.return_value = mock_response
+        responses.add(responses.POST, WEBHOOK_URL, status=200)
 
         report = create_problem_report(machine=self.machine)
-        result = deliver_webhook("problem_report", report.pk)
+        with self.assertNumQueries(DELIVERY_QUERY_COUNT):
+            result = deliver_webhook("problem_report", report.pk)
+
+        self.assertEqual(result.status, "success")
+        responses.assert_call_count(WEBHOOK_URL, 1)
+
+    @override_config(
+        DISCORD_WEBHOOK_URL=WEBHOOK_URL,
+        DISCORD_WEBHOOKS_ENABLED=True,
+    )
+    @responses.activate
+    def test_delivery_query_count_does_not_grow_with_photos(self):
+        """Attached photos are fetched in one query, not one per photo."""
+        responses.add(responses.POST, WEBHOOK_URL, status=200)
+
+        report = create_problem_report(machine=self.machine)
+        for i in range(3):
+            media = ProblemReportMedia(
+                problem_report=report,
+                media_type=ProblemReportMedia.MediaType.PHOTO,
+                display_order=i,
+            )
+            media.file.save(f"photo{i}.jpg", ContentFile(b"fake"), save=False)
+            media.thumbnail_file.save(f"thumb{i}.jpg", ContentFile(b"fake"), save=True)
+
+        with self.assertNumQueries(DELIVERY_QUERY_COUNT):
+            result = deliver_webhook("problem_report", report.pk)
 
         self.assertEqual(result.status, "success")
-        mock_post.assert_called_once()
 
     @override_config(
-        DISCORD_WEBHOOK_URL="https://discord.com/api/webhooks/123/abc",
+        DISCORD_WEBHOOK_URL=WEBHOOK_URL,
         DISCORD_WEBHOOKS_ENABLED=True,
     )
-    @patch("flipfix.apps.discord.tasks.requests.post")
-    def test_handles_delivery_failure(self, mock_post):
+    @responses.activate
+    def test_handles_delivery_failure(self):
         """Handles webhook delivery failure gracefully."""
-        mock_post.side_effect = requests.RequestException("Connection error")
+        responses.add(
+            responses.POST, WEBHOOK_URL, body=requests.ConnectionError("Connection error")
+        )
 
         report = create_problem_report(machine=self.machine)
         # Capture expected warning log to avoid noise in test output
@@ -2,18 +2,19 @@
 
 from unittest.mock import MagicMock
 
-from django.test import TestCase, tag
+from django.test import SimpleTestCase, tag
 
 from flipfix.apps.discord.llm import (
     ChildSuggestion,
     RecordSuggestion,
+    _get_valid_record_types,
     _parse_tool_response,
     flatten_suggestions,
 )
 
 
 @tag("tasks")
-class ParseToolResponseTests(TestCase):
+class ParseToolResponseTests(SimpleTestCase):
     """Tests for _parse_tool_response()."""
 
     def _make_mock_response(self, suggestions: list[dict]) -> MagicMock:
@@ -604,7 +605,22 @@ class ParseToolResponseTests(TestCase):
 
 
 @tag("tasks")
-class FlattenSuggestionsTests(TestCase):
+class ValidRecordTypesTests(SimpleTestCase):
+    """Tests for _get_valid_record_types()."""
+
+    def test_matches_bot_handler_registry(self):
+        """Valid record types are the registered bot handler names."""
+        from flipfix.apps.discord.bot_handlers import get_all_bot_handlers
+
+        self.assertEqual(
+            _get_valid_record_types(), {handler.name for handler in get_all_bot_handlers()}
+        )
+        self.assertIn("log_entry", _get_valid_record_types())
+        self.assertIn("problem_report", _get_valid_record_types())
+
+
+@tag("tasks")
+class FlattenSuggestionsTests(SimpleTestCase):
     """Tests for flatten_suggestions() function."""
 
     def test_suggestion_without_children_unchanged(self):
@@ -2,8 +2,9 @@
 
 from unittest.mock import AsyncMock, MagicMock, patch
 
-from django.test import TestCase, tag
+from django.test import SimpleTestCase, TestCase, tag
 
+from flipfix.apps.catalog.models import MachineInstance
 from flipfix.apps.core.media import ALLOWED_MEDIA_EXTENSIONS, ALLOWED_VIDEO_EXTENSIONS
 from flipfix.apps.core.test_utils import create_machine, create_maintainer_user
 from flipfix.apps.discord.context import (
@@ -109,7 +110,7 @@ def _mock_failed_upload(
 
 
 @tag("discord")
-class AllowedMediaExtensionsTests(TestCase):
+class AllowedMediaExtensionsTests(SimpleTestCase):
     """Tests for ALLOWED_MEDIA_EXTENSIONS constant."""
 
     def test_includes_common_photo_formats(self):
@@ -134,7 +135,7 @@ class AllowedMediaExtensionsTests(TestCase):
 
 
 @tag("discord")
-class FilterSupportedAttachmentsTests(TestCase):
+class FilterSupportedAttachmentsTests(SimpleTestCase):
     """Tests for _filter_supported_attachments()."""
 
     def test_filters_to_supported_only(self):
@@ -182,7 +183,7 @@ class FilterSupportedAttachmentsTests(TestCase):
 
 
 @tag("discord")
-class IsVideoTests(TestCase):
+class IsVideoTests(SimpleTestCase):
     """Tests for _is_video() helper."""
 
     def test_recognizes_video_extensions(self):
@@ -203,7 +204,7 @@ class IsVideoTests(TestCase):
 
 
 @tag("discord")
-class DedupeByUrlTests(TestCase):
+class DedupeByUrlTests(SimpleTestCase):
     """Tests for _dedupe_by_url() helper."""
 
     def test_removes_duplicate_urls(self):
@@ -247,68 +248,44 @@ class DedupeByUrlTests(TestCase):
 
 
 @tag("discord")
-class GetMediaModelNameTests(TestCase):
-    """Tests for _get_media_model_name() helper."""
+class GetMediaModelNameTests(SimpleTestCase):
+    """Tests for _get_media_model_name() helper.
 
-    def setUp(self):
-        self.machine = create_machine()
-        self.user = create_maintainer_user()
-        self.maintainer = self.user.maintainer
+    The lookup only inspects the record's type, so unsaved instances suffice.
+    """
 
     def test_log_entry(self):
         """Returns correct model name for LogEntry."""
-        log_entry = LogEntry.objects.create(
-            machine=self.machine,
-            text="Test",
-            maintainer_names="Test User",
-        )
-
-        model_name = _get_media_model_name(log_entry)
+        model_name = _get_media_model_name(LogEntry(text="Test"))
 
         self.assertEqual(model_name, "LogEntryMedia")
 
     def test_problem_report(self):
         """Returns correct model name for ProblemReport."""
-        problem_report = ProblemReport.objects.create(
-            machine=self.machine,
-            description="Test",
-            problem_type=ProblemReport.ProblemType.OTHER,
-        )
-
-        model_name = _get_media_model_name(problem_report)
+        model_name = _get_media_model_name(ProblemReport(description="Test"))
 
         self.assertEqual(model_name, "ProblemReportMedia")
 
     def test_part_request(self):
         """Returns correct model name for PartRequest."""
-        part_request = PartRequest.objects.create(
-            text="Test",
-            requested_by=self.maintainer,
-        )
-
-        model_name = _get_media_model_name(part_request)
+        model_name = _get_media_model_name(PartRequest(text="Test"))
 
         self.assertEqual(model_name, "PartRequestMedia")
 
     def test_part_request_update(self):
         """Returns correct model name for PartRequestUpdate."""
-        part_request = PartRequest.objects.create(
-            text="Test",
-            requested_by=self.maintainer,
-        )
-        update = PartRequestUpdate.objects.create(
-            part_request=part_request,
-            text="Update",
-            posted_by=self.maintainer,
-        )
-
-        model_name = _get_media_model_name(update)
+        model_name = _get_media_model_name(PartRequestUpdate(text="Update"))
 
         self.assertEqual(model_name, "PartRequestUpdateMedia")
 
+    def test_unknown_record_type_raises(self):
+        """Raises ValueError for a record type with no media model."""
+        with self.assertRaises(ValueError):
+            _get_media_model_name(MachineInstance(name="Test"))
+
 
 @tag("discord")
-class ContextMessageAttachmentsTests(TestCase):
+class ContextMessageAttachmentsTests(SimpleTestCase):
     """Tests for ContextMessage.attachments field."""
 
     def test_has_attachments_field(self):
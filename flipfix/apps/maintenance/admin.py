@@ -99,13 +99,11 @@ class LogEntryAdmin(SimpleHistoryAdmin):
 
     def get_queryset(self, request):
         qs = super().get_queryset(request)
-        return qs.select_related("machine", "problem_report", "created_by").prefetch_related(
-            "maintainers"
-        )
+        return qs.select_related("machine", "problem_report", "created_by").prefetch_maintainers()
 
     @admin.display(description="Maintainers")
     def maintainer_list(self, obj):
-        names = [m.display_name for m in obj.maintainers.all()]
+        names = [m.display_name for m in obj.maintainers_list]
         if obj.maintainer_names:
             names.append(obj.maintainer_names)
         return ", ".join(names) if names else "-"
@@ -8,14 +8,9 @@ class MaintenanceConfig(AppConfig):
 
     def ready(self):
         """Register HEIF opener so Pillow can read HEIC/HEIF uploads."""
-        try:
-            from pillow_heif import register_heif_opener
+        from flipfix.apps.core.image_processing import register_heif_support
 
-            register_heif_opener()
-        except Exception:  # pragma: no cover - best-effort hook
-            import logging
-
-            logging.getLogger(__name__).warning("HEIF support unavailable; HEIC decode may fail.")
+        register_heif_support()
 
         from flipfix.apps.core.models import register_reference_cleanup
 
@@ -31,29 +26,26 @@ class MaintenanceConfig(AppConfig):
 
     @staticmethod
     def _register_feed_sources():
-        from django.db.models import Prefetch
-
+        from flipfix.apps.accounts.models import user_account_fields
         from flipfix.apps.core.feed import FeedEntrySource, register_feed_source
 
-        from .models import LogEntry, ProblemReport
+        from .models import LogEntry, ProblemReport, latest_log_entry_prefetch
 
         def _log_entry_queryset():
-            return LogEntry.objects.select_related("problem_report").prefetch_related(
-                "maintainers__user", "media"
+            return (
+                LogEntry.objects.select_related("problem_report")
+                .prefetch_maintainers()
+                .prefetch_related("media")
             )
 
         def _problem_report_queryset():
-            latest_log_prefetch = Prefetch(
-                "log_entries",
-                queryset=LogEntry.objects.order_by("-occurred_at"),
-                to_attr="prefetched_log_entries",
-            )
             # status_sort + priority_sort annotations are referenced by
             # FEED_CONFIGS["problems"].source_order_by in core/feed.py.
             # The two declarations must stay in sync.
             return (
                 ProblemReport.objects.select_related("reported_by_user")
-                .prefetch_related(latest_log_prefetch, "media")
+                .defer(*user_account_fields("reported_by_user__"))
+                .prefetch_related(latest_log_entry_prefetch(), "media")
                 .with_status_sort()
                 .with_priority_sort()
             )
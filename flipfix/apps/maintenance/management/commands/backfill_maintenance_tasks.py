@@ -56,6 +56,9 @@ INTAKE_BACKFILL_MARKER = "Intake completed — crediting routine maintenance"
 # inline "[x]" text and markdown links are not miscounted.
 CHECKBOX_RE = re.compile(r"^\s*(?:[-*+]|\d+\.)\s+\[([ xX])\]", re.MULTILINE)
 
+# Rows held in memory at once while scanning whole tables.
+CHUNK_SIZE = 500
+
 
 class Command(BaseCommand):
     help = "Backfill maintenance-task tags from existing log entries and completed intakes."
@@ -105,9 +108,14 @@ class Command(BaseCommand):
 
         self.stdout.write(self.style.MIGRATE_HEADING("Work-log keyword matches:"))
         counts = dict.fromkeys(compiled, 0)
-        for entry in LogEntry.objects.select_related("machine"):
+        entries = (
+            LogEntry.objects.select_related("machine")
+            .prefetch_related("maintenance_tasks")
+            .iterator(chunk_size=CHUNK_SIZE)
+        )
+        for entry in entries:
             text = entry.text or ""
-            existing = set(entry.maintenance_tasks.values_list("slug", flat=True))
+            existing = {t.slug for t in entry.maintenance_tasks.all()}
             for slug, regexes in compiled.items():
                 if slug in existing or not any(r.search(text) for r in regexes):
                     continue
@@ -132,9 +140,12 @@ class Command(BaseCommand):
 
         self.stdout.write(self.style.MIGRATE_HEADING("Completed-intake credits:"))
         credited = skipped = 0
-        for report in ProblemReport.objects.filter(
-            status=ProblemReport.Status.CLOSED
-        ).select_related("machine"):
+        reports = (
+            ProblemReport.objects.filter(status=ProblemReport.Status.CLOSED)
+            .select_related("machine")
+            .iterator(chunk_size=CHUNK_SIZE)
+        )
+        for report in reports:
             desc = report.description or ""
             if not INTAKE_SIGNATURE.search(desc):
                 continue
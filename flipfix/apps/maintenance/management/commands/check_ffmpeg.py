@@ -6,6 +6,8 @@ import subprocess
 
 from django.core.management.base import BaseCommand
 
+from flipfix.apps.core.transcoding import detect_h264_encoder
+
 
 class Command(BaseCommand):
     help = "Check FFmpeg and FFprobe availability"
@@ -13,6 +15,7 @@ class Command(BaseCommand):
     def handle(self, *args, **options):
         self._check_binary("ffmpeg")
         self._check_binary("ffprobe")
+        self.stdout.write(f"H.264 encoder: {detect_h264_encoder()}")
 
     def _check_binary(self, binary: str):
         try:
@@ -8,7 +8,7 @@ from pathlib import Path
 from django.core.files.uploadedfile import SimpleUploadedFile
 from django.core.management.base import BaseCommand, CommandError
 
-from flipfix.apps.core.image_processing import resize_image_file
+from flipfix.apps.core.image_processing import register_heif_support, resize_image_file
 
 
 class Command(BaseCommand):
@@ -38,20 +38,38 @@ class Command(BaseCommand):
             self.stdout.write(self.style.ERROR(f"Could not import Pillow: {exc}"))
             return
 
+        # Photo resizing relies on libjpeg-turbo's SIMD JPEG codec, which the
+        # Pillow wheels bundle. A source build against plain libjpeg is much slower.
+        from PIL import features
+
+        turbo_version = features.version_feature("libjpeg_turbo")
+        if turbo_version:
+            self.stdout.write(f"JPEG codec: libjpeg-turbo {turbo_version}")
+        else:
+            self.stdout.write(
+                self.style.WARNING("JPEG codec is not libjpeg-turbo; photo resizing will be slow.")
+            )
+
         try:
             import pillow_heif
-            from pillow_heif import register_heif_opener
-
-            register_heif_opener()
-            self.stdout.write(f"pillow-heif: {pillow_heif.__version__} (opener registered)")
         except ImportError:
             self.stdout.write(
                 self.style.WARNING("pillow-heif not installed; HEIC/AVIF may fail to decode.")
             )
             return
         except Exception as exc:  # pragma: no cover
-            self.stdout.write(self.style.ERROR(f"pillow-heif import/registration failed: {exc}"))
+            self.stdout.write(self.style.ERROR(f"pillow-heif import failed: {exc}"))
+            return
+
+        # register_heif_support() logs and swallows its own failure.
+        if not register_heif_support():
+            self.stdout.write(
+                self.style.ERROR(
+                    f"pillow-heif: {pillow_heif.__version__} (opener registration failed)"
+                )
+            )
             return
+        self.stdout.write(f"pillow-heif: {pillow_heif.__version__} (opener registered)")
 
         # Smoke-test AVIF encode/decode
         try:
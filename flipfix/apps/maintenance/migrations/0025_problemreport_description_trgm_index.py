@@ -0,0 +1,39 @@
+"""Trigram GIN index for problem report description search (Postgres only).
+
+Search matches ``description__icontains``, which Django compiles to
+``UPPER("description"::text) LIKE UPPER('%q%')`` on Postgres.  A leading
+wildcard can't use a btree, so the index is a ``gin_trgm_ops`` expression
+index on ``UPPER(description)`` — the exact expression the lookup produces —
+letting the planner bitmap-scan instead of reading every row.
+
+SQLite (local dev, tests, PR environments) has no pg_trgm, so both directions
+are no-ops there.  Kept out of ``Meta.indexes`` for the same reason.
+"""
+
+from django.db import migrations
+
+INDEX_NAME = "maint_pr_desc_upper_trgm"
+
+
+def forward(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    schema_editor.execute(
+        f"CREATE INDEX IF NOT EXISTS {INDEX_NAME} ON maintenance_problemreport "
+        "USING gin (UPPER(description) gin_trgm_ops)"
+    )
+
+
+def reverse(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(f"DROP INDEX IF EXISTS {INDEX_NAME}")
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("maintenance", "0024_reconcile_unplayable_machine_status"),
+    ]
+
+    operations = [migrations.RunPython(forward, reverse)]
@@ -0,0 +1,41 @@
+# Generated by Django 5.2.16 on 2026-10-16 00:12
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('maintenance', '0025_problemreport_description_trgm_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='logentry',
+            index=models.Index(fields=['machine', '-occurred_at'], name='maintenance_machine_74ed38_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='logentry',
+            index=models.Index(fields=['problem_report', '-occurred_at'], name='maintenance_problem_d574af_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='problemreport',
+            index=models.Index(fields=['machine', 'status', '-occurred_at'], name='maintenance_machine_6254b4_idx'),
+        ),
+        migrations.AlterField(
+            model_name='logentry',
+            name='machine',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='log_entries', to='catalog.machineinstance'),
+        ),
+        migrations.AlterField(
+            model_name='logentry',
+            name='problem_report',
+            field=models.ForeignKey(blank=True, db_index=False, help_text='Optional link to a problem report this log entry addresses.', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='log_entries', to='maintenance.problemreport'),
+        ),
+        migrations.AlterField(
+            model_name='problemreport',
+            name='machine',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='problem_reports', to='catalog.machineinstance'),
+        ),
+    ]
@@ -16,7 +16,7 @@ from django.utils.text import slugify
 from simple_history.models import HistoricalRecords
 
 from flipfix.apps.accounts.models import Maintainer
-from flipfix.apps.catalog.models import MachineInstance
+from flipfix.apps.catalog.models import MachineInstance, machine_detail_text_fields
 from flipfix.apps.core.models import AbstractMedia, SearchableQuerySetMixin, TimeStampedMixin
 
 
@@ -102,6 +102,14 @@ class ProblemReportQuerySet(SearchableQuerySetMixin, models.QuerySet):
             )
         )
 
+    def for_list_display(self):
+        """Defer columns list and board views never render.
+
+        Drops the reporter's IP and user agent plus the machine's long-form
+        text; callers must select_related ``machine__model``.
+        """
+        return self.defer("device_info", "ip_address", *machine_detail_text_fields("machine__"))
+
     def for_wall_display(self, location_slugs: list[str]):
         """Build the queryset for the wall display board.
 
@@ -115,6 +123,7 @@ class ProblemReportQuerySet(SearchableQuerySetMixin, models.QuerySet):
                 machine__location__slug__in=location_slugs,
             )
             .select_related("machine", "machine__model", "machine__location")
+            .for_list_display()
             .annotate(media_count=Count("media"))
             .with_priority_sort()
             .order_by("priority_sort", "-occurred_at")
@@ -127,15 +136,11 @@ class ProblemReportQuerySet(SearchableQuerySetMixin, models.QuerySet):
         latest log entry prefetched for rich card display.  Ordered by
         priority then newest first (within each location column).
         """
-        latest_log_prefetch = Prefetch(
-            "log_entries",
-            queryset=LogEntry.objects.order_by("-occurred_at"),
-            to_attr="prefetched_log_entries",
-        )
         return (
             self.filter(status=ProblemReport.Status.OPEN)
             .select_related("machine", "machine__model", "machine__location")
-            .prefetch_related(latest_log_prefetch, "media")
+            .for_list_display()
+            .prefetch_related(latest_log_entry_prefetch(), "media")
             .with_priority_sort()
             .order_by("priority_sort", "-occurred_at")
         )
@@ -211,10 +216,12 @@ class ProblemReport(TimeStampedMixin):
             """Return priority choices that maintainers can explicitly set."""
             return [(val, label) for val, label in cls.choices if val != cls.UNTRIAGED]
 
+    # Indexed by the (machine, status, -occurred_at) composite in Meta.indexes
     machine = models.ForeignKey(
         MachineInstance,
         on_delete=models.CASCADE,
         related_name="problem_reports",
+        db_index=False,
     )
     status = models.CharField(
         max_length=20,
@@ -259,6 +266,9 @@ class ProblemReport(TimeStampedMixin):
         indexes = [
             models.Index(fields=["occurred_at"]),
             models.Index(fields=["status"]),
+            # Per-machine report lookups: open reports newest-first on the
+            # machine list, and the machine feed's Problems tab filter.
+            models.Index(fields=["machine", "status", "-occurred_at"]),
         ]
 
     def __str__(self) -> str:
@@ -281,9 +291,43 @@ class ProblemReport(TimeStampedMixin):
         return "Anonymous"
 
 
+def log_entry_maintainers_prefetch() -> Prefetch:
+    """Prefetch ``LogEntry.maintainers`` (users joined in) into ``maintainers_list``.
+
+    A plain list attribute rather than the manager cache: readers index it
+    directly, and one that isn't prefetched fails loudly instead of quietly
+    issuing a query per entry.
+    """
+    return Prefetch(
+        "maintainers",
+        queryset=Maintainer.objects.select_related("user"),
+        to_attr="maintainers_list",
+    )
+
+
+def latest_log_entry_prefetch() -> Prefetch:
+    """Prefetch each report's newest log entry into ``prefetched_log_entries``.
+
+    Cards only render ``prefetched_log_entries.0``, so the prefetch is sliced
+    to one row per report (a ``ROW_NUMBER()`` window filter) and projected to
+    the columns the snippet shows, instead of loading every entry's history.
+    """
+    return Prefetch(
+        "log_entries",
+        queryset=LogEntry.objects.only("problem_report", "text", "occurred_at").order_by(
+            "-occurred_at"
+        )[:1],
+        to_attr="prefetched_log_entries",
+    )
+
+
 class LogEntryQuerySet(SearchableQuerySetMixin, models.QuerySet):
     """Custom queryset for LogEntry with common filters."""
 
+    def prefetch_maintainers(self):
+        """Prefetch maintainers with their users joined into the same query."""
+        return self.prefetch_related(log_entry_maintainers_prefetch())
+
     def create_or_reuse(self, submission_id, **fields):
         """Create a log entry, or reuse the one already made for this token.
 
@@ -427,10 +471,12 @@ class MaintenanceTaskType(models.Model):
 class LogEntry(TimeStampedMixin):
     """Maintainer log entry documenting work on a machine."""
 
+    # Both FKs are indexed by their (fk, -occurred_at) composites in Meta.indexes
     machine = models.ForeignKey(
         MachineInstance,
         on_delete=models.CASCADE,
         related_name="log_entries",
+        db_index=False,
     )
     problem_report = models.ForeignKey(
         ProblemReport,
@@ -439,6 +485,7 @@ class LogEntry(TimeStampedMixin):
         blank=True,
         related_name="log_entries",
         help_text="Optional link to a problem report this log entry addresses.",
+        db_index=False,
     )
     maintainers = models.ManyToManyField(Maintainer, blank=True, related_name="log_entries")
     maintenance_tasks = models.ManyToManyField(
@@ -490,6 +537,10 @@ class LogEntry(TimeStampedMixin):
         ordering = ["-occurred_at"]
         indexes = [
             models.Index(fields=["occurred_at"]),
+            # Newest-first logs per machine (machine feed, latest-entry render)
+            # and per problem report (report detail, latest-log prefetch).
+            models.Index(fields=["machine", "-occurred_at"]),
+            models.Index(fields=["problem_report", "-occurred_at"]),
         ]
         verbose_name = "Log entry"
         verbose_name_plural = "Log entries"
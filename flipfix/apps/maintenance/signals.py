@@ -5,25 +5,40 @@ Uses FieldTracker on MachineInstance to detect changes without extra DB queries.
 RecordReference cleanup is handled by register_reference_cleanup() in apps.py.
 """
 
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
 from django.db.models.signals import post_save
 from django.dispatch import receiver
+from simple_history.utils import bulk_create_with_history
 
 from flipfix.apps.accounts.models import Maintainer
 from flipfix.apps.catalog.models import Location, MachineInstance
 
 from .models import LogEntry
 
+# Machines created inside bulk_context(), waiting for their creation log entries.
+_pending_creations: ContextVar[list[MachineInstance] | None] = ContextVar(
+    "_pending_creations", default=None
+)
+
+# Fields whose changes get an automatic log entry.  ``update_fields`` may name
+# the FK by field or column name, so both spellings of location are listed.
+_AUTO_LOGGED_FIELDS = frozenset({"operational_status", "location", "location_id"})
+
 # =============================================================================
 # Auto log entry signals — create LogEntry records for machine changes
 # =============================================================================
 
 
-@receiver(post_save, sender=MachineInstance)
-def create_auto_log_entries(sender, instance, created, **kwargs):
+@receiver(post_save, sender=MachineInstance, dispatch_uid="maintenance_auto_log_entries")
+def create_auto_log_entries(sender, instance, created, update_fields=None, **kwargs):
     """Create automatic log entries for machine creation and field changes.
 
     Set instance._skip_auto_log = True to prevent auto log entry creation.
-    Change detection uses MachineInstance.tracker (FieldTracker).
+    Change detection uses MachineInstance.tracker (FieldTracker); saves that
+    pass ``update_fields`` without status or location return early.
     """
     # Allow skipping auto-log creation (useful for tests and bulk imports)
     if getattr(instance, "_skip_auto_log", False):
@@ -31,14 +46,22 @@ def create_auto_log_entries(sender, instance, created, **kwargs):
 
     # New machine created
     if created:
+        pending = _pending_creations.get()
+        if pending is not None:
+            pending.append(instance)
+            return
         log_entry = LogEntry.objects.create(
             machine=instance,
-            text=f"New machine added: {instance.name}",
+            text=_creation_text(instance),
             created_by=instance.created_by,
         )
         _add_maintainer_if_exists(log_entry, instance.created_by)
         return
 
+    # A save limited to other fields can't have written a status or location change
+    if update_fields is not None and not _AUTO_LOGGED_FIELDS & update_fields:
+        return
+
     # Check for status change
     if instance.tracker.has_changed("operational_status"):
         previous_status = instance.tracker.previous("operational_status")
@@ -83,6 +106,63 @@ def create_auto_log_entries(sender, instance, created, **kwargs):
             _add_maintainer_if_exists(log_entry, instance.updated_by)
 
 
+@contextmanager
+def bulk_context() -> Iterator[None]:
+    """Batch the creation log entries for machines created inside the block.
+
+    On a clean exit, all "New machine added" entries are written with one
+    maintainer lookup and bulk inserts (history rows included) instead of
+    several queries per machine. Discord webhooks are not sent for them.
+    If the block raises, nothing is written.
+    """
+    pending: list[MachineInstance] = []
+    token = _pending_creations.set(pending)
+    try:
+        yield
+    finally:
+        _pending_creations.reset(token)
+    _bulk_create_creation_log_entries(pending)
+
+
+def _creation_text(machine: MachineInstance) -> str:
+    """Return the text of the automatic log entry for a newly created machine."""
+    return f"New machine added: {machine.name}"
+
+
+def _bulk_create_creation_log_entries(machines: list[MachineInstance]) -> None:
+    """Create creation log entries and their maintainer links for many machines."""
+    if not machines:
+        return
+
+    creator_ids = {machine.created_by_id for machine in machines if machine.created_by_id}
+    maintainers_by_user_id = Maintainer.objects.filter(
+        user_id__in=creator_ids, is_shared_account=False
+    ).in_bulk(field_name="user_id")
+
+    log_entries = bulk_create_with_history(
+        [
+            LogEntry(
+                machine=machine,
+                text=_creation_text(machine),
+                created_by_id=machine.created_by_id,
+            )
+            for machine in machines
+        ],
+        LogEntry,
+    )
+
+    through = LogEntry.maintainers.through
+    through.objects.bulk_create(
+        [
+            through(
+                logentry_id=entry.pk, maintainer_id=maintainers_by_user_id[entry.created_by_id].pk
+            )
+            for entry in log_entries
+            if entry.created_by_id in maintainers_by_user_id
+        ]
+    )
+
+
 def _add_maintainer_if_exists(log_entry, user):
     """Add the user as a maintainer on the log entry if they have a Maintainer profile.
 
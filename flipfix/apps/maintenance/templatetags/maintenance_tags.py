@@ -196,7 +196,10 @@ def log_entry_meta(context, entry):
         return format_html("<strong>{}</strong>", ts)
 
     names = ""
-    maintainers = list(entry.maintainers.all()) if hasattr(entry, "maintainers") else []
+    # List views prefetch maintainers_list; detail pages fall back to the manager.
+    maintainers = getattr(entry, "maintainers_list", None)
+    if maintainers is None:
+        maintainers = list(entry.maintainers.all()) if hasattr(entry, "maintainers") else []
     if maintainers:
         names = ", ".join(str(m) for m in maintainers)
     elif getattr(entry, "maintainer_names", ""):
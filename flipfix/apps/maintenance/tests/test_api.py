@@ -423,6 +423,19 @@ class DeleteMediaTests(TemporaryMediaMixin, TestDataMixin, TestCase):
         self.assertFalse(storage.exists(transcoded_name))
         self.assertFalse(storage.exists(poster_name))
 
+    def test_delete_records_no_intermediate_update(self):
+        """Deleting media doesn't save the row first: history has only create and delete."""
+        media_id = self.media.id
+
+        self.client.post(self.delete_url, {"action": "delete_media", "media_id": media_id})
+
+        history_types = list(
+            LogEntryMedia.history.filter(id=media_id)
+            .order_by("history_id")
+            .values_list("history_type", flat=True)
+        )
+        self.assertEqual(history_types, ["+", "-"])
+
 
 @tag("views")
 class ReceiveMediaViewTests(TemporaryMediaMixin, SuppressRequestLogsMixin, TestDataMixin, TestCase):
@@ -15,16 +15,28 @@ from flipfix.apps.core.test_utils import (
     create_shared_terminal,
 )
 from flipfix.apps.maintenance.models import LogEntry
+from flipfix.apps.maintenance.signals import (
+    _bulk_create_creation_log_entries,
+    bulk_context,
+)
 
 
 @tag("models")
 class MachineCreationSignalTests(TestCase):
     """Tests for automatic log entry creation when machines are created."""
 
-    def setUp(self):
-        """Set up test data."""
-        self.maintainer_user = create_maintainer_user()
-        self.model = create_machine_model(name="Signal Test Model")
+    @classmethod
+    def setUpTestData(cls):
+        cls.maintainer_user = create_maintainer_user()
+        cls.model = create_machine_model(name="Signal Test Model")
+
+    def _creation_log(self, machine):
+        """Fetch the machine's only log entry with its creator and maintainers loaded."""
+        return (
+            LogEntry.objects.select_related("created_by")
+            .prefetch_related("maintainers")
+            .get(machine=machine)
+        )
 
     def test_new_machine_creates_log_entry(self):
         """Creating a new machine should create an automatic log entry."""
@@ -34,8 +46,7 @@ class MachineCreationSignalTests(TestCase):
             created_by=self.maintainer_user,
         )
 
-        log = LogEntry.objects.filter(machine=instance).first()
-        self.assertIsNotNone(log)
+        log = self._creation_log(instance)
         self.assertIn("New machine added", log.text)
         self.assertIn(instance.name, log.text)
 
@@ -47,7 +58,7 @@ class MachineCreationSignalTests(TestCase):
             created_by=self.maintainer_user,
         )
 
-        log = LogEntry.objects.filter(machine=instance).first()
+        log = self._creation_log(instance)
         self.assertEqual(log.created_by, self.maintainer_user)
 
     def test_new_machine_log_entry_adds_maintainer_if_exists(self):
@@ -60,7 +71,7 @@ class MachineCreationSignalTests(TestCase):
             created_by=self.maintainer_user,
         )
 
-        log = LogEntry.objects.filter(machine=instance).first()
+        log = self._creation_log(instance)
         self.assertIn(maintainer, log.maintainers.all())
 
     def test_new_machine_log_entry_no_maintainer_if_not_exists(self):
@@ -74,8 +85,7 @@ class MachineCreationSignalTests(TestCase):
             created_by=self.maintainer_user,
         )
 
-        log = LogEntry.objects.filter(machine=instance).first()
-        self.assertIsNotNone(log)
+        log = self._creation_log(instance)
         self.assertEqual(log.maintainers.count(), 0)
 
     def test_new_machine_log_entry_no_created_by(self):
@@ -86,8 +96,7 @@ class MachineCreationSignalTests(TestCase):
             created_by=None,
         )
 
-        log = LogEntry.objects.filter(machine=instance).first()
-        self.assertIsNotNone(log)
+        log = self._creation_log(instance)
         self.assertIsNone(log.created_by)
         self.assertEqual(log.maintainers.count(), 0)
 
@@ -101,24 +110,78 @@ class MachineCreationSignalTests(TestCase):
             created_by=shared_terminal.user,
         )
 
-        log = LogEntry.objects.filter(machine=instance).first()
-        self.assertIsNotNone(log)
+        log = self._creation_log(instance)
         self.assertEqual(log.created_by, shared_terminal.user)
         # Shared terminal should NOT be added as maintainer
         self.assertEqual(log.maintainers.count(), 0)
 
 
+@tag("models")
+class BulkContextTests(TestCase):
+    """Tests for batching creation log entries with bulk_context()."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.maintainer_user = create_maintainer_user()
+        cls.shared_terminal = create_shared_terminal()
+        cls.model = create_machine_model(name="Bulk Test Model")
+
+    def test_creation_log_entries_written_on_exit(self):
+        """Log entries are deferred until the block exits, then created for every machine."""
+        with bulk_context():
+            first = MachineInstance.objects.create(
+                model=self.model, name="Bulk One", created_by=self.maintainer_user
+            )
+            second = MachineInstance.objects.create(
+                model=self.model, name="Bulk Two", created_by=self.shared_terminal.user
+            )
+            self.assertFalse(LogEntry.objects.filter(machine__in=[first, second]).exists())
+
+        first_log = LogEntry.objects.get(machine=first)
+        self.assertEqual(first_log.text, "New machine added: Bulk One")
+        self.assertEqual(first_log.created_by, self.maintainer_user)
+        self.assertEqual(list(first_log.maintainers.all()), [self.maintainer_user.maintainer])
+        self.assertEqual(first_log.history.count(), 1)
+
+        second_log = LogEntry.objects.get(machine=second)
+        self.assertEqual(second_log.maintainers.count(), 0)
+
+    def test_flush_query_count_is_constant(self):
+        """Writing the batched entries costs the same number of queries for any batch size."""
+        machines = [
+            create_machine(model=self.model, name=f"Bulk {i}", created_by=self.maintainer_user)
+            for i in range(5)
+        ]
+
+        # Maintainer lookup, log entries, history rows, maintainer links
+        with self.assertNumQueries(4):
+            _bulk_create_creation_log_entries(machines)
+
+        self.assertEqual(LogEntry.objects.filter(machine__in=machines).count(), 5)
+
+    def test_nothing_written_when_block_raises(self):
+        """An exception inside the block discards the buffered entries."""
+        with self.assertRaises(RuntimeError), bulk_context():
+            machine = MachineInstance.objects.create(
+                model=self.model, name="Bulk Fail", created_by=self.maintainer_user
+            )
+            raise RuntimeError
+
+        self.assertFalse(LogEntry.objects.filter(machine=machine).exists())
+
+
 @tag("models")
 class StatusChangeSignalTests(TestCase):
     """Tests for automatic log entry creation when operational_status changes."""
 
-    def setUp(self):
-        self.maintainer_user = create_maintainer_user()
-        self.machine = create_machine(operational_status=MachineInstance.OperationalStatus.GOOD)
+    @classmethod
+    def setUpTestData(cls):
+        cls.maintainer_user = create_maintainer_user()
+        cls.machine = create_machine(operational_status=MachineInstance.OperationalStatus.GOOD)
         # create_machine sets _skip_auto_log; clear it so signals fire
-        del self.machine._skip_auto_log  # type: ignore[attr-defined]
+        del cls.machine._skip_auto_log  # type: ignore[attr-defined]
         # Clear any log entries from machine creation
-        LogEntry.objects.filter(machine=self.machine).delete()
+        LogEntry.objects.filter(machine=cls.machine).delete()
 
     def _log_count(self):
         return LogEntry.objects.filter(machine=self.machine).count()
@@ -170,6 +233,22 @@ class StatusChangeSignalTests(TestCase):
 
         self.assertEqual(self._log_count(), 0)
 
+    def test_status_in_update_fields_creates_log(self):
+        """A save limited to operational_status still logs the change."""
+        self.machine.operational_status = MachineInstance.OperationalStatus.BROKEN
+        self.machine.updated_by = self.maintainer_user
+        self.machine.save(update_fields=["operational_status", "updated_by", "updated_at"])
+
+        self.assertEqual(self._log_count(), 1)
+
+    def test_update_fields_without_status_does_not_log(self):
+        """A save that doesn't write operational_status can't log a status change."""
+        self.machine.operational_status = MachineInstance.OperationalStatus.BROKEN
+        self.machine.updated_by = self.maintainer_user
+        self.machine.save(update_fields=["name", "updated_at"])
+
+        self.assertEqual(self._log_count(), 0)
+
     def test_skip_auto_log_suppresses_status_change(self):
         """_skip_auto_log should prevent log creation on status change."""
         self.machine.operational_status = MachineInstance.OperationalStatus.BROKEN
@@ -183,19 +262,20 @@ class StatusChangeSignalTests(TestCase):
 class LocationChangeSignalTests(TestCase):
     """Tests for automatic log entry creation when location changes."""
 
-    def setUp(self):
-        self.maintainer_user = create_maintainer_user()
-        self.floor, _ = Location.objects.get_or_create(
+    @classmethod
+    def setUpTestData(cls):
+        cls.maintainer_user = create_maintainer_user()
+        cls.floor, _ = Location.objects.get_or_create(
             slug="floor", defaults={"name": "Floor", "sort_order": 1}
         )
-        self.workshop, _ = Location.objects.get_or_create(
+        cls.workshop, _ = Location.objects.get_or_create(
             slug="workshop", defaults={"name": "Workshop", "sort_order": 2}
         )
-        self.machine = create_machine(location=self.workshop)
+        cls.machine = create_machine(location=cls.workshop)
         # create_machine sets _skip_auto_log; clear it so signals fire
-        del self.machine._skip_auto_log  # type: ignore[attr-defined]
+        del cls.machine._skip_auto_log  # type: ignore[attr-defined]
         # Clear any log entries from machine creation
-        LogEntry.objects.filter(machine=self.machine).delete()
+        LogEntry.objects.filter(machine=cls.machine).delete()
 
     def _log_count(self):
         return LogEntry.objects.filter(machine=self.machine).count()
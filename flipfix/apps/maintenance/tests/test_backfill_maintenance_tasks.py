@@ -4,7 +4,9 @@ from io import StringIO
 
 from django.core.management import call_command
 from django.core.management.base import CommandError
+from django.db import connection
 from django.test import TestCase, tag
+from django.test.utils import CaptureQueriesContext
 
 from flipfix.apps.core.test_utils import (
     create_log_entry,
@@ -57,6 +59,19 @@ class BackfillWorkLogTests(TestCase):
         run(apply=True)
         self.assertEqual(entry.maintenance_tasks.count(), 0)
 
+    def test_scan_queries_do_not_grow_with_entries(self):
+        """Existing tags come from one prefetch per chunk, not a query per entry."""
+        create_log_entry(machine=self.machine, text="Adjusted the flippers")
+        with CaptureQueriesContext(connection) as one_entry:
+            run()
+
+        for i in range(4):
+            create_log_entry(machine=self.machine, text=f"Adjusted the flippers {i}")
+        with CaptureQueriesContext(connection) as five_entries:
+            run()
+
+        self.assertEqual(len(five_entries), len(one_entry))
+
     def test_invalid_threshold_raises(self):
         with self.assertRaises(CommandError):
             run(intake_threshold=1.5)
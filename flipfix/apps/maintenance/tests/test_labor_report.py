@@ -18,9 +18,10 @@ from flipfix.apps.core.test_utils import (
 class LaborWeeklySummaryViewTests(TestDataMixin, TestCase):
     """Tests for the weekly labor summary page."""
 
-    def setUp(self):
-        super().setUp()
-        self.url = reverse("labor-report-weekly")
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.url = reverse("labor-report-weekly")
 
     def test_requires_authentication(self):
         """Unauthenticated users are redirected to login."""
@@ -82,9 +83,10 @@ class LaborWeeklySummaryViewTests(TestDataMixin, TestCase):
 class LaborDetailViewTests(TestDataMixin, TestCase):
     """Tests for the labor detail drill-down page."""
 
-    def setUp(self):
-        super().setUp()
-        self.url = reverse("labor-report-detail")
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.url = reverse("labor-report-detail")
 
     def test_requires_authentication(self):
         """Unauthenticated users are redirected to login."""
@@ -282,9 +284,10 @@ class LogEntryTimeSpentFormTests(TestCase):
 class LogEntryCreateTimeSpentTests(TestDataMixin, TestCase):
     """Tests for time_spent in log entry creation view."""
 
-    def setUp(self):
-        super().setUp()
-        self.url = reverse("log-create-machine", kwargs={"slug": self.machine.slug})
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.url = reverse("log-create-machine", kwargs={"slug": cls.machine.slug})
 
     def test_create_with_time_spent(self):
         """Creating a log entry with time_spent saves the value."""
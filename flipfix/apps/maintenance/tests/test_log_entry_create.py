@@ -24,9 +24,10 @@ from flipfix.apps.maintenance.models import LogEntry, ProblemReport
 class MachineLogCreateViewOccurredAtTests(TestDataMixin, TestCase):
     """Tests for MachineLogCreateView occurred_at handling."""
 
-    def setUp(self):
-        super().setUp()
-        self.create_url = reverse("log-create-machine", kwargs={"slug": self.machine.slug})
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.create_url = reverse("log-create-machine", kwargs={"slug": cls.machine.slug})
 
     def test_create_log_entry_with_occurred_at(self):
         """Creating a log entry saves the specified occurred_at."""
@@ -106,9 +107,10 @@ class MachineLogCreateViewOccurredAtTests(TestDataMixin, TestCase):
 class LogEntryCreatedByTests(TestDataMixin, TestCase):
     """Tests for LogEntry created_by field via view."""
 
-    def setUp(self):
-        super().setUp()
-        self.create_url = reverse("log-create-machine", kwargs={"slug": self.machine.slug})
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.create_url = reverse("log-create-machine", kwargs={"slug": cls.machine.slug})
 
     def test_created_by_set_when_creating_log_entry(self):
         """Creating a log entry should set the created_by field."""
@@ -502,9 +504,10 @@ class LogEntrySharedAccountTests(
 ):
     """Tests for log entry creation from shared/terminal accounts."""
 
-    def setUp(self):
-        super().setUp()
-        self.create_url = reverse("log-create-machine", kwargs={"slug": self.machine.slug})
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.create_url = reverse("log-create-machine", kwargs={"slug": cls.machine.slug})
 
     def test_shared_account_with_valid_username_uses_maintainer(self):
         """Shared account selecting from chip input saves to M2M."""
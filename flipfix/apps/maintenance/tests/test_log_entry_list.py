@@ -3,12 +3,15 @@
 Machine-scoped log tests are in catalog/tests/test_machine_feed.py.
 """
 
+from datetime import timedelta
+
 from django.test import TestCase, tag
 from django.urls import reverse
+from django.utils import timezone
 
 from flipfix.apps.core.test_utils import (
     TestDataMixin,
-    create_log_entry,
+    create_log_entries,
     create_problem_report,
 )
 
@@ -17,19 +20,18 @@ from flipfix.apps.core.test_utils import (
 class LogListSearchTests(TestDataMixin, TestCase):
     """Tests for global log list search."""
 
-    def setUp(self):
-        super().setUp()
-        self.list_url = reverse("log-list")
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.list_url = reverse("log-list")
 
     def test_search_includes_problem_report_description(self):
         """Search should match attached problem report description."""
         report = create_problem_report(machine=self.machine, description="Coil stop broken")
-        log_with_report = create_log_entry(
-            machine=self.machine,
-            text="Investigated noisy coil",
-            problem_report=report,
+        log_with_report, _ = create_log_entries(
+            {"machine": self.machine, "text": "Investigated noisy coil", "problem_report": report},
+            {"machine": self.machine, "text": "Adjusted flipper alignment"},
         )
-        create_log_entry(machine=self.machine, text="Adjusted flipper alignment")
 
         self.client.force_login(self.maintainer_user)
         response = self.client.get(self.list_url, {"q": "coil stop"})
@@ -41,15 +43,39 @@ class LogListSearchTests(TestDataMixin, TestCase):
 
     def test_search_includes_maintainer_names(self):
         """Search should match free-text maintainer names."""
-        log_with_name = create_log_entry(
-            machine=self.machine,
-            text="Replaced coil",
-            maintainer_names="Wandering Willie",
+        log_with_name, _ = create_log_entries(
+            {
+                "machine": self.machine,
+                "text": "Replaced coil",
+                "maintainer_names": "Wandering Willie",
+            },
+            {"machine": self.machine, "text": "Adjusted flipper alignment"},
         )
-        create_log_entry(machine=self.machine, text="Adjusted flipper alignment")
 
         self.client.force_login(self.maintainer_user)
         response = self.client.get(self.list_url, {"q": "Wandering"})
 
         self.assertContains(response, log_with_name.text)
         self.assertNotContains(response, "Adjusted flipper alignment")
+
+
+@tag("views")
+class LogListStatsTests(TestDataMixin, TestCase):
+    """Tests for the global log list sidebar stats."""
+
+    def test_stats_count_total_and_this_week(self):
+        """Sidebar counts come from one aggregate: all entries and the last 7 days."""
+        create_log_entries(
+            {"machine": self.machine, "text": "Recent"},
+            {
+                "machine": self.machine,
+                "text": "Old",
+                "occurred_at": timezone.now() - timedelta(days=30),
+            },
+        )
+
+        self.client.force_login(self.maintainer_user)
+        response = self.client.get(reverse("log-list"))
+
+        self.assertEqual(response.context["total_count"], 2)
+        self.assertEqual(response.context["this_week_count"], 1)
@@ -21,12 +21,13 @@ from flipfix.apps.maintenance.models import LogEntry, LogEntryMedia
 
 
 @tag("views")
-class LogEntryVideoUploadTests(TestDataMixin, TestCase):
+class LogEntryVideoUploadTests(TemporaryMediaMixin, TestDataMixin, TestCase):
     """Tests for video upload via AJAX on log entry creation."""
 
-    def setUp(self):
-        super().setUp()
-        self.create_url = reverse("log-create-machine", kwargs={"slug": self.machine.slug})
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.create_url = reverse("log-create-machine", kwargs={"slug": cls.machine.slug})
 
     def _create_log_entry_and_get_detail_url(self):
         """Create a log entry via POST and return its detail URL."""
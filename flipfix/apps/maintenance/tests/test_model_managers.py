@@ -1,7 +1,11 @@
 """Tests for model manager methods."""
 
+from datetime import timedelta
+
 from django.test import TestCase, tag
+from django.utils import timezone
 
+from flipfix.apps.accounts.models import Maintainer
 from flipfix.apps.core.test_utils import (
     TestDataMixin,
     create_log_entry,
@@ -664,3 +668,62 @@ class LogEntryLinkedReporterSearchTests(TestDataMixin, TestCase):
 
         self.assertEqual(len(results), 1)
         self.assertEqual(results[0], entry)
+
+
+@tag("models")
+class LogEntryPrefetchMaintainersTests(TestDataMixin, TestCase):
+    """Tests for LogEntry.objects.prefetch_maintainers()."""
+
+    def test_loads_maintainers_and_users_in_one_query(self):
+        """Maintainer users are joined into the maintainer prefetch query."""
+        other = Maintainer.objects.get(user=create_maintainer_user(first_name="Other"))
+        for text in ("First", "Second"):
+            entry = create_log_entry(machine=self.machine, text=text)
+            entry.maintainers.set([self.maintainer, other])
+
+        with self.assertNumQueries(2):
+            entries = list(LogEntry.objects.prefetch_maintainers())
+            names = {m.display_name for e in entries for m in e.maintainers_list}
+
+        self.assertIn("Other", names)
+
+
+@tag("models")
+class ProblemReportListDisplayTests(TestDataMixin, TestCase):
+    """Tests for ProblemReport.objects.for_list_display()."""
+
+    def test_defers_unrendered_columns(self):
+        """Reporter metadata and machine long-form text are not loaded."""
+        create_problem_report(machine=self.machine, description="Stuck ball")
+
+        report = ProblemReport.objects.select_related("machine__model").for_list_display().get()
+
+        self.assertEqual(report.get_deferred_fields(), {"device_info", "ip_address"})
+        self.assertEqual(report.machine.get_deferred_fields(), {"acquisition_notes"})
+        self.assertEqual(
+            report.machine.model.get_deferred_fields(), {"educational_text", "sources_notes"}
+        )
+        with self.assertNumQueries(0):
+            self.assertEqual(report.description, "Stuck ball")
+            self.assertEqual(report.machine.model.name, self.machine.model.name)
+
+
+@tag("models")
+class ProblemReportOpenByLocationTests(TestDataMixin, TestCase):
+    """Tests for ProblemReport.objects.for_open_by_location()."""
+
+    def test_prefetches_only_latest_log_entry(self):
+        """Each report carries just its newest log entry, not its full history."""
+        report = create_problem_report(machine=self.machine)
+        now = timezone.now()
+        for days_ago, text in ((2, "Oldest"), (0, "Newest"), (1, "Middle")):
+            create_log_entry(
+                machine=self.machine,
+                problem_report=report,
+                text=text,
+                occurred_at=now - timedelta(days=days_ago),
+            )
+
+        (loaded,) = ProblemReport.objects.for_open_by_location()
+
+        self.assertEqual([e.text for e in loaded.prefetched_log_entries], ["Newest"])
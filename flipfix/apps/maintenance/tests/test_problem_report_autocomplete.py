@@ -16,22 +16,23 @@ from flipfix.apps.maintenance.models import ProblemReport
 class ProblemReportAutocompleteViewTests(SuppressRequestLogsMixin, TestDataMixin, TestCase):
     """Tests for the problem report autocomplete API."""
 
-    def setUp(self):
-        super().setUp()
-        self.other_machine = create_machine(slug="other-machine")
-        self.report1 = create_problem_report(
-            machine=self.machine,
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.other_machine = create_machine(slug="other-machine")
+        cls.report1 = create_problem_report(
+            machine=cls.machine,
             description="First problem on main machine",
         )
-        self.report2 = create_problem_report(
-            machine=self.machine,
+        cls.report2 = create_problem_report(
+            machine=cls.machine,
             description="Second problem on main machine",
         )
-        self.report3 = create_problem_report(
-            machine=self.other_machine,
+        cls.report3 = create_problem_report(
+            machine=cls.other_machine,
             description="Problem on other machine",
         )
-        self.api_url = reverse("api-problem-report-autocomplete")
+        cls.api_url = reverse("api-problem-report-autocomplete")
 
     def test_requires_authentication(self):
         """Anonymous users should be redirected to login."""
@@ -23,9 +23,10 @@ from flipfix.apps.maintenance.models import ProblemReport
 class ProblemReportCreateViewTests(TestDataMixin, TestCase):
     """Tests for the public problem report submission view."""
 
-    def setUp(self):
-        super().setUp()
-        self.url = reverse("public-problem-report-create", kwargs={"code": self.machine.asset_id})
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.url = reverse("public-problem-report-create", kwargs={"code": cls.machine.asset_id})
 
     def test_create_view_accessible_without_login(self):
         """Problem report form should be accessible to anonymous users."""
@@ -327,9 +328,10 @@ class ProblemReportSharedAccountTests(
 ):
     """Tests for problem report creation from shared/terminal accounts."""
 
-    def setUp(self):
-        super().setUp()
-        self.url = reverse("problem-report-create-machine", kwargs={"slug": self.machine.slug})
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.url = reverse("problem-report-create-machine", kwargs={"slug": cls.machine.slug})
 
     def test_shared_account_with_valid_username_uses_user_fk(self):
         """Shared account selecting from dropdown saves to reported_by_user."""
@@ -1,7 +1,9 @@
 """Tests for problem report detail views and actions."""
 
 from django.contrib.contenttypes.models import ContentType
+from django.db import connection
 from django.test import TestCase, tag
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
 from flipfix.apps.accounts.models import Maintainer
@@ -22,10 +24,11 @@ from flipfix.apps.maintenance.models import LogEntry, ProblemReport
 class ProblemReportDetailViewTests(SuppressRequestLogsMixin, TestDataMixin, TestCase):
     """Tests for the problem report detail view."""
 
-    def setUp(self):
-        super().setUp()
-        self.report = create_problem_report(
-            machine=self.machine,
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.report = create_problem_report(
+            machine=cls.machine,
             problem_type=ProblemReport.ProblemType.STUCK_BALL,
             description="Ball is stuck in the upper playfield",
             reported_by_name="John Doe",
@@ -33,7 +36,7 @@ class ProblemReportDetailViewTests(SuppressRequestLogsMixin, TestDataMixin, Test
             device_info="iPhone 12",
             ip_address="192.168.1.1",
         )
-        self.detail_url = reverse("problem-report-detail", kwargs={"pk": self.report.pk})
+        cls.detail_url = reverse("problem-report-detail", kwargs={"pk": cls.report.pk})
 
     def test_detail_view_requires_authentication(self):
         """Anonymous users should be redirected to login."""
@@ -129,61 +132,48 @@ class ProblemReportDetailViewTests(SuppressRequestLogsMixin, TestDataMixin, Test
         self.report.refresh_from_db()
         self.assertEqual(self.report.status, ProblemReport.Status.OPEN)
 
-    def test_status_toggle_from_open_to_closed(self):
-        """Staff users should be able to close an open report."""
-        self.client.force_login(self.maintainer_user)
-        response = self.client.post(self.detail_url)
-
-        self.assertEqual(response.status_code, 302)
-        self.assertEqual(response.url, self.detail_url)
-
-        self.report.refresh_from_db()
-        self.assertEqual(self.report.status, ProblemReport.Status.CLOSED)
-        log_entry = LogEntry.objects.latest("occurred_at")
-        self.assertEqual(log_entry.text, "Closed problem report")
-        self.assertEqual(log_entry.problem_report, self.report)
-        self.assertEqual(log_entry.machine, self.machine)
-        self.assertEqual(log_entry.created_by, self.maintainer_user)
-        self.assertTrue(log_entry.maintainers.filter(user=self.maintainer_user).exists())
-
-    def test_status_toggle_from_closed_to_open(self):
-        """Staff users should be able to re-open a closed report."""
-        self.report.status = ProblemReport.Status.CLOSED
-        self.report.save()
-
-        self.client.force_login(self.maintainer_user)
-        response = self.client.post(self.detail_url)
-
-        self.assertEqual(response.status_code, 302)
-        self.report.refresh_from_db()
-        self.assertEqual(self.report.status, ProblemReport.Status.OPEN)
-        log_entry = LogEntry.objects.latest("occurred_at")
-        self.assertEqual(log_entry.text, "Re-opened problem report")
-        self.assertEqual(log_entry.problem_report, self.report)
-        self.assertEqual(log_entry.machine, self.machine)
-        self.assertEqual(log_entry.created_by, self.maintainer_user)
-        self.assertTrue(log_entry.maintainers.filter(user=self.maintainer_user).exists())
-
-    def test_status_toggle_shows_close_message(self):
-        """Closing a report should show appropriate success message."""
-        self.client.force_login(self.maintainer_user)
-        response = self.client.post(self.detail_url, follow=True)
-
-        messages = list(response.context["messages"])
-        self.assertEqual(len(messages), 1)
-        self.assertIn("closed", str(messages[0]))
-
-    def test_status_toggle_shows_reopen_message(self):
-        """Re-opening a report should show appropriate success message."""
-        self.report.status = ProblemReport.Status.CLOSED
-        self.report.save()
-
-        self.client.force_login(self.maintainer_user)
-        response = self.client.post(self.detail_url, follow=True)
+    def test_status_toggle(self):
+        """Staff users can close an open report and re-open a closed one.
 
-        messages = list(response.context["messages"])
-        self.assertEqual(len(messages), 1)
-        self.assertIn("re-opened", str(messages[0]))
+        Each toggle redirects back to the detail page, shows a success message,
+        and records a log entry attributed to the acting maintainer.
+        """
+        cases = [
+            (
+                ProblemReport.Status.OPEN,
+                ProblemReport.Status.CLOSED,
+                "Closed problem report",
+                "closed",
+            ),
+            (
+                ProblemReport.Status.CLOSED,
+                ProblemReport.Status.OPEN,
+                "Re-opened problem report",
+                "re-opened",
+            ),
+        ]
+        self.client.force_login(self.maintainer_user)
+
+        for initial, expected, log_text, message in cases:
+            with self.subTest(initial=initial):
+                self.report.status = initial
+                self.report.save(update_fields=["status"])
+
+                response = self.client.post(self.detail_url, follow=True)
+
+                self.assertEqual(response.redirect_chain, [(self.detail_url, 302)])
+                messages = list(response.context["messages"])
+                self.assertEqual(len(messages), 1)
+                self.assertIn(message, str(messages[0]))
+
+                self.report.refresh_from_db()
+                self.assertEqual(self.report.status, expected)
+                log_entry = LogEntry.objects.latest("pk")
+                self.assertEqual(log_entry.text, log_text)
+                self.assertEqual(log_entry.problem_report, self.report)
+                self.assertEqual(log_entry.machine, self.machine)
+                self.assertEqual(log_entry.created_by, self.maintainer_user)
+                self.assertTrue(log_entry.maintainers.filter(user=self.maintainer_user).exists())
 
     def test_unrecognized_action_does_not_toggle_status(self):
         """POST with unrecognized action should NOT toggle status.
@@ -293,13 +283,14 @@ class ProblemReportDetailSearchBarVisibilityTests(
 ):
     """Tests for conditional search bar visibility on problem report detail."""
 
-    def setUp(self):
-        super().setUp()
-        self.report = create_problem_report(
-            machine=self.machine,
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.report = create_problem_report(
+            machine=cls.machine,
             description="Test problem",
         )
-        self.detail_url = reverse("problem-report-detail", kwargs={"pk": self.report.pk})
+        cls.detail_url = reverse("problem-report-detail", kwargs={"pk": cls.report.pk})
 
     def test_search_bar_hidden_when_few_log_entries(self):
         """Search bar should not appear when there are 5 or fewer log entries."""
@@ -335,14 +326,15 @@ class ProblemReportDetailSearchBarVisibilityTests(
 class ProblemReportPriorityUpdateTests(SuppressRequestLogsMixin, TestDataMixin, TestCase):
     """Tests for AJAX priority updates on the problem report detail view."""
 
-    def setUp(self):
-        super().setUp()
-        self.report = create_problem_report(
-            machine=self.machine,
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.report = create_problem_report(
+            machine=cls.machine,
             description="Test problem",
             priority=ProblemReport.Priority.MINOR,
         )
-        self.detail_url = reverse("problem-report-detail", kwargs={"pk": self.report.pk})
+        cls.detail_url = reverse("problem-report-detail", kwargs={"pk": cls.report.pk})
 
     def test_update_priority_success(self):
         """AJAX priority update changes the priority and returns JSON."""
@@ -445,13 +437,14 @@ class ProblemReportPriorityUpdateTests(SuppressRequestLogsMixin, TestDataMixin,
 class ProblemReportStatusUpdateTests(SuppressRequestLogsMixin, TestDataMixin, TestCase):
     """Tests for AJAX status updates on the problem report detail view."""
 
-    def setUp(self):
-        super().setUp()
-        self.report = create_problem_report(
-            machine=self.machine,
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.report = create_problem_report(
+            machine=cls.machine,
             description="Test problem",
         )
-        self.detail_url = reverse("problem-report-detail", kwargs={"pk": self.report.pk})
+        cls.detail_url = reverse("problem-report-detail", kwargs={"pk": cls.report.pk})
 
     def test_update_status_closes_report(self):
         """AJAX status update to closed creates log entry and returns JSON."""
@@ -477,6 +470,22 @@ class ProblemReportStatusUpdateTests(SuppressRequestLogsMixin, TestDataMixin, Te
         self.assertEqual(log_entry.text, "Closed problem report")
         self.assertEqual(log_entry.problem_report, self.report)
 
+    def test_update_status_batches_log_entry_render_lookups(self):
+        """The returned log entry HTML loads maintainers with their users in one query."""
+        self.client.force_login(self.maintainer_user)
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.post(
+                self.detail_url,
+                {"action": "update_status", "status": ProblemReport.Status.CLOSED},
+            )
+
+        self.assertIn(self.maintainer_user.first_name, response.json()["log_entry_html"])
+        sqls = [q["sql"] for q in ctx.captured_queries]
+        link_insert = next(i for i, sql in enumerate(sqls) if "logentry_maintainers" in sql)
+        after_link = sqls[link_insert + 1 :]
+        self.assertFalse([sql for sql in after_link if sql.startswith('SELECT "auth_user"')])
+
     def test_update_status_reopens_report(self):
         """AJAX status update to open creates log entry."""
         self.report.status = ProblemReport.Status.CLOSED
@@ -586,13 +595,14 @@ class ProblemReportStatusUpdateTests(SuppressRequestLogsMixin, TestDataMixin, Te
 class ProblemReportDetailViewTextUpdateTests(SuppressRequestLogsMixin, TestDataMixin, TestCase):
     """Tests for ProblemReportDetailView AJAX text updates."""
 
-    def setUp(self):
-        super().setUp()
-        self.report = create_problem_report(
-            machine=self.machine,
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.report = create_problem_report(
+            machine=cls.machine,
             description="Original description",
         )
-        self.detail_url = reverse("problem-report-detail", kwargs={"pk": self.report.pk})
+        cls.detail_url = reverse("problem-report-detail", kwargs={"pk": cls.report.pk})
 
     def test_update_text_success(self):
         """AJAX endpoint updates description successfully."""
@@ -689,14 +699,15 @@ class ProblemReportDetailViewTextUpdateTests(SuppressRequestLogsMixin, TestDataM
 class ProblemReportMachineUpdateTests(SuppressRequestLogsMixin, TestDataMixin, TestCase):
     """Tests for updating the machine of a problem report via AJAX."""
 
-    def setUp(self):
-        super().setUp()
-        self.report = create_problem_report(
-            machine=self.machine,
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.report = create_problem_report(
+            machine=cls.machine,
             description="Test problem",
         )
-        self.other_machine = create_machine(slug="other-machine")
-        self.detail_url = reverse("problem-report-detail", kwargs={"pk": self.report.pk})
+        cls.other_machine = create_machine(slug="other-machine")
+        cls.detail_url = reverse("problem-report-detail", kwargs={"pk": cls.report.pk})
 
     def test_update_machine_success(self):
         """Successfully update problem report machine."""
@@ -801,14 +812,15 @@ class ProblemReportMachineUpdateTests(SuppressRequestLogsMixin, TestDataMixin, T
 class ProblemReportDetailLogEntriesTests(TestDataMixin, TestCase):
     """Tests for log entries display on problem report detail page."""
 
-    def setUp(self):
-        super().setUp()
-        self.problem_report = create_problem_report(
-            machine=self.machine,
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.problem_report = create_problem_report(
+            machine=cls.machine,
             problem_type=ProblemReport.ProblemType.STUCK_BALL,
             description="Ball stuck",
         )
-        self.detail_url = reverse("problem-report-detail", kwargs={"pk": self.problem_report.pk})
+        cls.detail_url = reverse("problem-report-detail", kwargs={"pk": cls.problem_report.pk})
 
     def test_detail_page_shows_add_log_entry_button(self):
         """Problem report detail should have Add Log button."""
@@ -844,19 +856,20 @@ class ProblemReportDetailLogEntriesTests(TestDataMixin, TestCase):
 class ProblemReportLogEntriesPartialViewTests(SuppressRequestLogsMixin, TestDataMixin, TestCase):
     """Tests for the log entries AJAX endpoint on problem report detail."""
 
-    def setUp(self):
-        super().setUp()
-        self.problem_report = create_problem_report(
-            machine=self.machine,
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.problem_report = create_problem_report(
+            machine=cls.machine,
             problem_type=ProblemReport.ProblemType.STUCK_BALL,
             description="Ball stuck",
         )
-        self.entries_url = reverse(
-            "problem-report-log-entries", kwargs={"pk": self.problem_report.pk}
+        cls.entries_url = reverse(
+            "problem-report-log-entries", kwargs={"pk": cls.problem_report.pk}
         )
 
-    def test_returns_json(self):
-        """AJAX endpoint should return JSON response."""
+    def test_returns_html_fragment(self):
+        """AJAX endpoint should return the rendered entries as HTML."""
         self.client.force_login(self.maintainer_user)
         create_log_entry(
             machine=self.machine,
@@ -866,12 +879,8 @@ class ProblemReportLogEntriesPartialViewTests(SuppressRequestLogsMixin, TestData
 
         response = self.client.get(self.entries_url)
         self.assertEqual(response.status_code, 200)
-        self.assertEqual(response["Content-Type"], "application/json")
-
-        data = response.json()
-        self.assertIn("items", data)
-        self.assertIn("has_next", data)
-        self.assertIn("next_page", data)
+        self.assertEqual(response["Content-Type"], "text/html; charset=utf-8")
+        self.assertContains(response, "Test log entry")
 
     def test_only_returns_linked_log_entries(self):
         """AJAX endpoint should only return log entries linked to this problem report."""
@@ -888,9 +897,8 @@ class ProblemReportLogEntriesPartialViewTests(SuppressRequestLogsMixin, TestData
         self.client.force_login(self.maintainer_user)
         response = self.client.get(self.entries_url)
 
-        data = response.json()
-        self.assertIn("Linked entry", data["items"])
-        self.assertNotIn("Unlinked entry", data["items"])
+        self.assertContains(response, "Linked entry")
+        self.assertNotContains(response, "Unlinked entry")
 
     def test_pagination(self):
         """AJAX endpoint should paginate results."""
@@ -904,15 +912,11 @@ class ProblemReportLogEntriesPartialViewTests(SuppressRequestLogsMixin, TestData
 
         # First page
         response = self.client.get(self.entries_url, {"page": 1})
-        data = response.json()
-        self.assertTrue(data["has_next"])
-        self.assertEqual(data["next_page"], 2)
+        self.assertEqual(response["X-Next-Page"], "2")
 
         # Second page
         response = self.client.get(self.entries_url, {"page": 2})
-        data = response.json()
-        self.assertFalse(data["has_next"])
-        self.assertIsNone(data["next_page"])
+        self.assertNotIn("X-Next-Page", response)
 
     def test_non_maintainer_can_browse_public_route(self):
         """Non-maintainer users can browse public routes (read-only)."""
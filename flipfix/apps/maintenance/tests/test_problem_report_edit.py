@@ -18,10 +18,11 @@ from flipfix.apps.core.test_utils import (
 class ProblemReportEditViewTests(SuppressRequestLogsMixin, TestDataMixin, TestCase):
     """Tests for ProblemReportEditView."""
 
-    def setUp(self):
-        super().setUp()
-        self.problem_report = create_problem_report(machine=self.machine)
-        self.edit_url = reverse("problem-report-edit", kwargs={"pk": self.problem_report.pk})
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.problem_report = create_problem_report(machine=cls.machine)
+        cls.edit_url = reverse("problem-report-edit", kwargs={"pk": cls.problem_report.pk})
 
     def test_edit_view_requires_staff(self):
         """Edit view requires staff permission."""
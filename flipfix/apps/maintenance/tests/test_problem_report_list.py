@@ -35,10 +35,11 @@ def _reports_in_column(column):
 class ProblemReportListViewTests(SuppressRequestLogsMixin, TestDataMixin, TestCase):
     """Tests for the global problem report column board."""
 
-    def setUp(self):
-        super().setUp()
-        self.report = create_problem_report(machine=self.machine, description="Test problem")
-        self.list_url = reverse("problem-report-list")
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.report = create_problem_report(machine=cls.machine, description="Test problem")
+        cls.list_url = reverse("problem-report-list")
 
     def test_requires_authentication(self):
         """Anonymous users should be redirected to login."""
@@ -1,8 +1,14 @@
 """Tests for QR code views."""
 
+import base64
+from io import BytesIO
+from unittest.mock import patch
+
 from django.test import TestCase, tag
 from django.urls import reverse
+from PIL import Image
 
+from flipfix.apps.core.qr import generate_qr_code, generate_qr_code_base64
 from flipfix.apps.core.test_utils import (
     SuppressRequestLogsMixin,
     TestDataMixin,
@@ -17,9 +23,10 @@ class MachineBulkQRCodeViewAccessTests(SuppressRequestLogsMixin, TestDataMixin,
     It requires maintainer portal access (staff or superuser).
     """
 
-    def setUp(self):
-        super().setUp()
-        self.url = reverse("machine-qr-bulk")
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.url = reverse("machine-qr-bulk")
 
     def test_requires_authentication(self):
         """Anonymous users are redirected to login."""
@@ -56,3 +63,37 @@ class MachineBulkQRCodeViewAccessTests(SuppressRequestLogsMixin, TestDataMixin,
         self.assertContains(response, "data-qr-machine-toggle")
         # Each card carries its machine id so JS can toggle print visibility.
         self.assertContains(response, f'data-machine-id="{self.machine.pk}"')
+
+
+@tag("views")
+class MachineQRImageTests(TestDataMixin, TestCase):
+    """Tests for the QR images MachineQRView renders."""
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.url = reverse("machine-qr", kwargs={"slug": cls.machine.slug})
+
+    def setUp(self):
+        super().setUp()
+        generate_qr_code_base64.cache_clear()
+        self.addCleanup(generate_qr_code_base64.cache_clear)
+
+    def test_repeat_views_reuse_cached_qr(self):
+        """The QR image is built once, then served from cache on later views."""
+        self.client.force_login(self.maintainer_user)
+
+        with patch("flipfix.apps.core.qr.generate_qr_code", wraps=generate_qr_code) as mock_gen:
+            first = self.client.get(self.url)
+            second = self.client.get(self.url)
+
+        self.assertEqual(mock_gen.call_count, 1)
+        self.assertEqual(first.context["qr_code_data"], second.context["qr_code_data"])
+
+    def test_qr_png_is_single_channel(self):
+        """The inline PNG is encoded as greyscale, not RGB."""
+        data = generate_qr_code_base64("https://example.com/p/M0001/")
+
+        with Image.open(BytesIO(base64.b64decode(data))) as img:
+            self.assertEqual(img.format, "PNG")
+            self.assertEqual(img.mode, "L")
@@ -1,29 +1,59 @@
 """Tests for maintenance background tasks."""
 
 import logging
+import os
 import secrets
 import subprocess
 import tempfile
 from unittest.mock import Mock, patch
 
-from django.core.files.uploadedfile import SimpleUploadedFile
-from django.test import TestCase, tag
+import requests
+from django.test import SimpleTestCase, TestCase, tag
+from requests_toolbelt import MultipartEncoder
 
 from flipfix.apps.core.test_utils import TemporaryMediaMixin, create_machine
+from flipfix.apps.core.transcoding import (
+    POSTER_JPEG_QSCALE,
+    TransferError,
+    _build_ffmpeg_command,
+    _download_source_file,
+    _get_transcoding_config,
+    _LoggedCommand,
+    _parse_duration_seconds,
+    _run_ffmpeg,
+    _sleep_with_backoff,
+    _upload_transcoded_files,
+    detect_h264_encoder,
+    enqueue_transcode,
+    transcode_video_job,
+)
 from flipfix.apps.maintenance.models import LogEntry, LogEntryMedia
 
 # Generate tokens dynamically to avoid triggering secret scanners
 TEST_TOKEN = secrets.token_hex(16)
 
 
+def configured_transcoding(token=TEST_TOKEN, url="https://example.com"):
+    """Patch the transcoding service token and web service URL with one patcher."""
+    return patch.multiple(
+        "flipfix.apps.core.transcoding",
+        TRANSCODING_UPLOAD_TOKEN=token,
+        DJANGO_WEB_SERVICE_URL=url,
+    )
+
+
+FFMPEG_STDERR = (
+    "Input #0, mov,mp4,m4a,3gp,3g2,mj2, from 'source.mp4':\n"
+    "  Duration: 00:02:00.48, start: 0.000000, bitrate: 1205 kb/s\n"
+)
+
+
 @tag("tasks")
 class GetTranscodingConfigTests(TestCase):
     """Tests for _get_transcoding_config helper."""
 
     def test_returns_values_when_both_configured(self):
         """Returns tuple of (url, token) when both are provided."""
-        from flipfix.apps.core.transcoding import _get_transcoding_config
-
         url, token = _get_transcoding_config(
             web_service_url="https://example.com",
             upload_token=TEST_TOKEN,
@@ -34,8 +64,6 @@ class GetTranscodingConfigTests(TestCase):
     @patch("flipfix.apps.core.transcoding.DJANGO_WEB_SERVICE_URL", None)
     def test_raises_when_url_missing(self):
         """Raises ValueError when web_service_url is not configured."""
-        from flipfix.apps.core.transcoding import _get_transcoding_config
-
         with self.assertRaises(ValueError) as context:
             _get_transcoding_config(web_service_url=None, upload_token="token")
 
@@ -44,19 +72,14 @@ class GetTranscodingConfigTests(TestCase):
     @patch("flipfix.apps.core.transcoding.TRANSCODING_UPLOAD_TOKEN", None)
     def test_raises_when_token_missing(self):
         """Raises ValueError when upload_token is not configured."""
-        from flipfix.apps.core.transcoding import _get_transcoding_config
-
         with self.assertRaises(ValueError) as context:
             _get_transcoding_config(web_service_url="https://example.com", upload_token=None)
 
         self.assertIn("TRANSCODING_UPLOAD_TOKEN", str(context.exception))
 
-    @patch("flipfix.apps.core.transcoding.TRANSCODING_UPLOAD_TOKEN", None)
-    @patch("flipfix.apps.core.transcoding.DJANGO_WEB_SERVICE_URL", None)
+    @configured_transcoding(token=None, url=None)
     def test_raises_when_both_missing(self):
         """Raises ValueError listing both missing vars when neither configured."""
-        from flipfix.apps.core.transcoding import _get_transcoding_config
-
         with self.assertRaises(ValueError) as context:
             _get_transcoding_config(web_service_url=None, upload_token=None)
 
@@ -64,12 +87,9 @@ class GetTranscodingConfigTests(TestCase):
         self.assertIn("DJANGO_WEB_SERVICE_URL", error_msg)
         self.assertIn("TRANSCODING_UPLOAD_TOKEN", error_msg)
 
-    @patch("flipfix.apps.core.transcoding.DJANGO_WEB_SERVICE_URL", "https://env-url.com")
-    @patch("flipfix.apps.core.transcoding.TRANSCODING_UPLOAD_TOKEN", "env-token")
+    @configured_transcoding(token="env-token", url="https://env-url.com")
     def test_falls_back_to_env_vars(self):
         """Uses module-level env vars when parameters are None."""
-        from flipfix.apps.core.transcoding import _get_transcoding_config
-
         url, token = _get_transcoding_config()
         self.assertEqual(url, "https://env-url.com")
         self.assertEqual(token, "env-token")
@@ -82,8 +102,6 @@ class SleepWithBackoffTests(TestCase):
     @patch("flipfix.apps.core.transcoding.time.sleep")
     def test_sleeps_with_exponential_backoff(self, mock_sleep):
         """Sleeps with exponential backoff (2^attempt seconds)."""
-        from flipfix.apps.core.transcoding import _sleep_with_backoff
-
         logging.disable(logging.CRITICAL)
         self.addCleanup(logging.disable, logging.NOTSET)
 
@@ -100,8 +118,6 @@ class SleepWithBackoffTests(TestCase):
 
     def test_raises_when_retries_exhausted(self):
         """Raises exception when attempt equals max_retries."""
-        from flipfix.apps.core.transcoding import _sleep_with_backoff
-
         logging.disable(logging.CRITICAL)
         self.addCleanup(logging.disable, logging.NOTSET)
 
@@ -131,8 +147,6 @@ class UploadTranscodedFilesTests(TestCase):
         self.poster_file.close()
 
     def tearDown(self):
-        import os
-
         for f in (self.video_file, self.poster_file):
             if os.path.exists(f.name):
                 os.unlink(f.name)
@@ -141,8 +155,6 @@ class UploadTranscodedFilesTests(TestCase):
     @patch("flipfix.apps.core.transcoding.requests.post")
     def test_upload_succeeds_on_first_attempt(self, mock_post):
         """Upload succeeds immediately when server returns 200."""
-        from flipfix.apps.core.transcoding import _upload_transcoded_files
-
         mock_response = Mock()
         mock_response.status_code = 200
         mock_response.json.return_value = {"message": "Upload successful"}
@@ -163,13 +175,18 @@ class UploadTranscodedFilesTests(TestCase):
         call_kwargs = call_args[1]
         self.assertEqual(call_kwargs["headers"]["Authorization"], f"Bearer {TEST_TOKEN}")
         self.assertEqual(call_kwargs["timeout"], 300)
+        # Body is streamed from disk rather than built in memory
+        self.assertIsInstance(call_kwargs["data"], MultipartEncoder)
+        self.assertEqual(call_kwargs["headers"]["Content-Type"], call_kwargs["data"].content_type)
+        self.assertEqual(
+            set(call_kwargs["data"].fields),
+            {"video_file", "poster_file"},
+        )
 
     @patch("flipfix.apps.core.transcoding.time.sleep")
     @patch("flipfix.apps.core.transcoding.requests.post")
     def test_upload_retries_on_server_error(self, mock_post, mock_sleep):
         """Upload retries with backoff when server returns 500."""
-        from flipfix.apps.core.transcoding import _upload_transcoded_files
-
         # First two attempts fail with 500, third succeeds
         fail_response = Mock()
         fail_response.status_code = 500
@@ -197,10 +214,6 @@ class UploadTranscodedFilesTests(TestCase):
     @patch("flipfix.apps.core.transcoding.requests.post")
     def test_upload_retries_on_connection_error(self, mock_post, mock_sleep):
         """Upload retries with backoff on connection errors."""
-        import requests
-
-        from flipfix.apps.core.transcoding import _upload_transcoded_files
-
         # First attempt fails with connection error, second succeeds
         success_response = Mock()
         success_response.status_code = 200
@@ -227,8 +240,6 @@ class UploadTranscodedFilesTests(TestCase):
     @patch("flipfix.apps.core.transcoding.requests.post")
     def test_upload_raises_after_max_retries(self, mock_post, mock_sleep):
         """Upload raises TransferError after exhausting all retries."""
-        from flipfix.apps.core.transcoding import TransferError, _upload_transcoded_files
-
         fail_response = Mock()
         fail_response.status_code = 503
         fail_response.text = "Service Unavailable"
@@ -260,10 +271,6 @@ class DownloadSourceFileTests(TestCase):
     @patch("flipfix.apps.core.transcoding.requests.get")
     def test_download_succeeds_on_first_attempt(self, mock_get):
         """Download succeeds immediately when server returns 200."""
-        import os
-
-        from flipfix.apps.core.transcoding import _download_source_file
-
         mock_response = Mock()
         mock_response.status_code = 200
         mock_response.headers = {"Content-Disposition": 'filename="video.mp4"'}
@@ -297,10 +304,6 @@ class DownloadSourceFileTests(TestCase):
     @patch("flipfix.apps.core.transcoding.requests.get")
     def test_download_retries_on_server_error(self, mock_get, mock_sleep):
         """Download retries with backoff when server returns 500."""
-        import os
-
-        from flipfix.apps.core.transcoding import _download_source_file
-
         # First two attempts fail with 500, third succeeds
         fail_response = Mock()
         fail_response.status_code = 500
@@ -334,12 +337,6 @@ class DownloadSourceFileTests(TestCase):
     @patch("flipfix.apps.core.transcoding.requests.get")
     def test_download_retries_on_connection_error(self, mock_get, mock_sleep):
         """Download retries with backoff on connection errors."""
-        import os
-
-        import requests as req
-
-        from flipfix.apps.core.transcoding import _download_source_file
-
         # First attempt fails with connection error, second succeeds
         success_response = Mock()
         success_response.status_code = 200
@@ -347,7 +344,7 @@ class DownloadSourceFileTests(TestCase):
         success_response.iter_content.return_value = [b"video content"]
 
         mock_get.side_effect = [
-            req.exceptions.ConnectionError("Connection refused"),
+            requests.exceptions.ConnectionError("Connection refused"),
             success_response,
         ]
 
@@ -372,8 +369,6 @@ class DownloadSourceFileTests(TestCase):
     @patch("flipfix.apps.core.transcoding.requests.get")
     def test_download_raises_after_max_retries(self, mock_get, mock_sleep):
         """Download raises TransferError after exhausting all retries."""
-        from flipfix.apps.core.transcoding import TransferError, _download_source_file
-
         fail_response = Mock()
         fail_response.status_code = 503
         fail_response.text = "Service Unavailable"
@@ -404,37 +399,43 @@ class VideoMediaTestMixin:
                 # self.media is a LogEntryMedia with TYPE_VIDEO
     """
 
-    def setUp(self):
-        super().setUp()
-        logging.disable(logging.CRITICAL)
-        self.addCleanup(logging.disable, logging.NOTSET)
-        self.machine = create_machine()
-        self.log_entry = LogEntry.objects.create(
-            machine=self.machine,
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.machine = create_machine()
+        cls.log_entry = LogEntry.objects.create(
+            machine=cls.machine,
             text="Test entry with video",
         )
-        video_file = SimpleUploadedFile("test.mp4", b"fake video content", content_type="video/mp4")
-        self.media = LogEntryMedia.objects.create(
-            log_entry=self.log_entry,
+        # A bare name skips the storage write; download/ffmpeg/upload are mocked.
+        cls.media = LogEntryMedia.objects.create(
+            log_entry=cls.log_entry,
             media_type=LogEntryMedia.MediaType.VIDEO,
-            file=video_file,
+            file=f"log_entries/{cls.log_entry.pk}/test.mp4",
             transcode_status=LogEntryMedia.TranscodeStatus.PENDING,
         )
 
+    def setUp(self):
+        super().setUp()
+        logging.disable(logging.CRITICAL)
+        self.addCleanup(logging.disable, logging.NOTSET)
+        # Keep encoder detection from running real ffmpeg test encodes.
+        detect_h264_encoder.cache_clear()
+        self.addCleanup(detect_h264_encoder.cache_clear)
+        patcher = patch("flipfix.apps.core.transcoding.detect_h264_encoder", return_value="libx264")
+        self.mock_detect_encoder = patcher.start()
+        self.addCleanup(patcher.stop)
+
 
 @tag("tasks")
 class TranscodeVideoJobTests(VideoMediaTestMixin, TemporaryMediaMixin, TestCase):
     """Tests for transcode_video_job task."""
 
-    @patch("flipfix.apps.core.transcoding.TRANSCODING_UPLOAD_TOKEN", None)
-    @patch("flipfix.apps.core.transcoding.DJANGO_WEB_SERVICE_URL", None)
+    @configured_transcoding(token=None, url=None)
     def test_transcode_raises_without_required_config(self):
         """Task raises ValueError when DJANGO_WEB_SERVICE_URL is not configured."""
-        from flipfix.apps.core.transcoding import transcode_video_job
-
         download = Mock(return_value=f"{tempfile.gettempdir()}/source.mp4")
-        probe = Mock(return_value=120)
-        run_ffmpeg = Mock()
+        run_ffmpeg = Mock(return_value=FFMPEG_STDERR)
         upload = Mock()
 
         with self.assertRaises(ValueError) as context:
@@ -442,56 +443,46 @@ class TranscodeVideoJobTests(VideoMediaTestMixin, TemporaryMediaMixin, TestCase)
                 self.media.id,
                 "LogEntryMedia",
                 download=download,
-                probe=probe,
                 run_ffmpeg=run_ffmpeg,
                 upload=upload,
             )
 
         self.assertIn("DJANGO_WEB_SERVICE_URL", str(context.exception))
-        self.media.refresh_from_db()
+        self.media.refresh_from_db(fields=["transcode_status"])
         self.assertEqual(self.media.transcode_status, LogEntryMedia.TranscodeStatus.FAILED)
         download.assert_not_called()
-        probe.assert_not_called()
         run_ffmpeg.assert_not_called()
         upload.assert_not_called()
 
     def test_transcode_skips_nonexistent_media(self):
         """Task silently skips non-existent media IDs."""
-        from flipfix.apps.core.transcoding import transcode_video_job
-
         # Should not raise, just log and return
         transcode_video_job(999999, "LogEntryMedia")  # Non-existent ID
 
     def test_transcode_skips_non_video_media(self):
         """Task skips non-video media types without processing."""
-        from flipfix.apps.core.transcoding import transcode_video_job
-
-        # Change media type to photo
-        self.media.media_type = LogEntryMedia.MediaType.PHOTO
-        self.media.save()
+        # Change media type to photo (update() skips the photo resize in save())
+        LogEntryMedia.objects.filter(pk=self.media.pk).update(
+            media_type=LogEntryMedia.MediaType.PHOTO
+        )
 
         # Should not process, just return
         transcode_video_job(self.media.id, "LogEntryMedia")
-        self.media.refresh_from_db()
+        self.media.refresh_from_db(fields=["transcode_status"])
         # Status should remain pending (not changed)
         self.assertEqual(self.media.transcode_status, LogEntryMedia.TranscodeStatus.PENDING)
 
-    @patch("flipfix.apps.core.transcoding.TRANSCODING_UPLOAD_TOKEN", TEST_TOKEN)
-    @patch("flipfix.apps.core.transcoding.DJANGO_WEB_SERVICE_URL", "https://example.com")
+    @configured_transcoding()
     def test_transcode_success_path(self):
-        """Task runs download, probe, ffmpeg, and upload on success."""
-        from flipfix.apps.core.transcoding import transcode_video_job
-
+        """Task runs download, ffmpeg, and upload on success."""
         download = Mock(return_value=f"{tempfile.gettempdir()}/source.mp4")
-        probe = Mock(return_value=120)
-        run_ffmpeg = Mock()
+        run_ffmpeg = Mock(return_value=FFMPEG_STDERR)
         upload = Mock()
 
         transcode_video_job(
             self.media.id,
             "LogEntryMedia",
             download=download,
-            probe=probe,
             run_ffmpeg=run_ffmpeg,
             upload=upload,
         )
@@ -501,11 +492,11 @@ class TranscodeVideoJobTests(VideoMediaTestMixin, TemporaryMediaMixin, TestCase)
             self.media.id, "LogEntryMedia", "https://example.com", TEST_TOKEN
         )
 
-        # Probe called once to get duration
-        probe.assert_called_once()
-
-        # FFmpeg called twice: once for video transcode, once for poster
-        self.assertEqual(run_ffmpeg.call_count, 2)
+        # A single ffmpeg run writes both the video and the poster
+        run_ffmpeg.assert_called_once()
+        self.mock_detect_encoder.assert_called_once()
+        cmd = run_ffmpeg.call_args[0][0]
+        self.assertEqual(cmd[cmd.index("-c:v") + 1], "libx264")
 
         # Upload called with media_id and temp file paths
         upload.assert_called_once()
@@ -519,21 +510,18 @@ class TranscodeVideoJobTests(VideoMediaTestMixin, TemporaryMediaMixin, TestCase)
         self.assertEqual(self.media.duration, 120)
         self.assertEqual(self.media.transcode_status, LogEntryMedia.TranscodeStatus.PROCESSING)
 
-    @patch("flipfix.apps.core.transcoding.TRANSCODING_UPLOAD_TOKEN", TEST_TOKEN)
-    @patch("flipfix.apps.core.transcoding.DJANGO_WEB_SERVICE_URL", "https://example.com")
+    @configured_transcoding()
     def test_transcode_sets_processing_status_before_work(self):
         """Task sets status to PROCESSING before starting transcode."""
-        from flipfix.apps.core.transcoding import transcode_video_job
-
         statuses_during_run = []
 
         def capture_status_on_ffmpeg(*args):
             # Read status from DB during ffmpeg run
-            self.media.refresh_from_db()
+            self.media.refresh_from_db(fields=["transcode_status"])
             statuses_during_run.append(self.media.transcode_status)
+            return FFMPEG_STDERR
 
         download = Mock(return_value=f"{tempfile.gettempdir()}/source.mp4")
-        probe = Mock(return_value=120)
         run_ffmpeg = Mock(side_effect=capture_status_on_ffmpeg)
         upload = Mock()
 
@@ -541,7 +529,6 @@ class TranscodeVideoJobTests(VideoMediaTestMixin, TemporaryMediaMixin, TestCase)
             self.media.id,
             "LogEntryMedia",
             download=download,
-            probe=probe,
             run_ffmpeg=run_ffmpeg,
             upload=upload,
         )
@@ -551,19 +538,15 @@ class TranscodeVideoJobTests(VideoMediaTestMixin, TemporaryMediaMixin, TestCase)
 
 
 @tag("tasks")
+@configured_transcoding()
 class TranscodeVideoErrorHandlingTests(VideoMediaTestMixin, TemporaryMediaMixin, TestCase):
     """Tests for transcode error handling."""
 
-    @patch("flipfix.apps.core.transcoding.TRANSCODING_UPLOAD_TOKEN", TEST_TOKEN)
-    @patch("flipfix.apps.core.transcoding.DJANGO_WEB_SERVICE_URL", "https://example.com")
     def test_transcode_sets_failed_status_when_ffmpeg_errors(self):
         """Task sets status to FAILED when ffmpeg exits with error."""
-        from flipfix.apps.core.transcoding import transcode_video_job
-
         download = Mock(return_value=f"{tempfile.gettempdir()}/source.mp4")
-        probe = Mock(return_value=120)
         upload = Mock()
-        run_ffmpeg = Mock()
+        run_ffmpeg = Mock(return_value=FFMPEG_STDERR)
         # Simulate ffmpeg failing with non-zero exit code
         run_ffmpeg.side_effect = subprocess.CalledProcessError(
             returncode=1,
@@ -576,54 +559,40 @@ class TranscodeVideoErrorHandlingTests(VideoMediaTestMixin, TemporaryMediaMixin,
                 self.media.id,
                 "LogEntryMedia",
                 download=download,
-                probe=probe,
                 run_ffmpeg=run_ffmpeg,
                 upload=upload,
             )
 
-        self.media.refresh_from_db()
+        self.media.refresh_from_db(fields=["transcode_status"])
         self.assertEqual(self.media.transcode_status, LogEntryMedia.TranscodeStatus.FAILED)
         download.assert_called_once()
-        probe.assert_called_once()
         upload.assert_not_called()
 
-    @patch("flipfix.apps.core.transcoding.TRANSCODING_UPLOAD_TOKEN", TEST_TOKEN)
-    @patch("flipfix.apps.core.transcoding.DJANGO_WEB_SERVICE_URL", "https://example.com")
     def test_transcode_fails_when_download_errors(self):
         """Task sets status to FAILED when download raises an exception."""
-        from flipfix.apps.core.transcoding import transcode_video_job
-
         download = Mock(side_effect=RuntimeError("Download failed after 3 attempts"))
-        probe = Mock(return_value=120)
         upload = Mock()
-        run_ffmpeg = Mock()
+        run_ffmpeg = Mock(return_value=FFMPEG_STDERR)
 
         with self.assertRaises(RuntimeError):
             transcode_video_job(
                 self.media.id,
                 "LogEntryMedia",
                 download=download,
-                probe=probe,
                 run_ffmpeg=run_ffmpeg,
                 upload=upload,
             )
 
-        self.media.refresh_from_db()
+        self.media.refresh_from_db(fields=["transcode_status"])
         self.assertEqual(self.media.transcode_status, LogEntryMedia.TranscodeStatus.FAILED)
         download.assert_called_once()
-        probe.assert_not_called()
         run_ffmpeg.assert_not_called()
         upload.assert_not_called()
 
-    @patch("flipfix.apps.core.transcoding.TRANSCODING_UPLOAD_TOKEN", TEST_TOKEN)
-    @patch("flipfix.apps.core.transcoding.DJANGO_WEB_SERVICE_URL", "https://example.com")
     def test_transcode_sets_failed_status_when_upload_errors(self):
         """Task sets status to FAILED when upload raises an exception."""
-        from flipfix.apps.core.transcoding import transcode_video_job
-
         download = Mock(return_value=f"{tempfile.gettempdir()}/source.mp4")
-        probe = Mock(return_value=120)
-        run_ffmpeg = Mock()
+        run_ffmpeg = Mock(return_value=FFMPEG_STDERR)
         upload = Mock(side_effect=RuntimeError("Upload failed after 3 attempts"))
 
         with self.assertRaises(RuntimeError):
@@ -631,27 +600,103 @@ class TranscodeVideoErrorHandlingTests(VideoMediaTestMixin, TemporaryMediaMixin,
                 self.media.id,
                 "LogEntryMedia",
                 download=download,
-                probe=probe,
                 run_ffmpeg=run_ffmpeg,
                 upload=upload,
             )
 
-        self.media.refresh_from_db()
+        self.media.refresh_from_db(fields=["transcode_status"])
         self.assertEqual(self.media.transcode_status, LogEntryMedia.TranscodeStatus.FAILED)
         download.assert_called_once()
-        probe.assert_called_once()
-        self.assertEqual(run_ffmpeg.call_count, 2)
+        run_ffmpeg.assert_called_once()
         upload.assert_called_once()
 
 
+@tag("tasks")
+class FfmpegCommandTests(SimpleTestCase):
+    """Tests for building the ffmpeg command and parsing its output."""
+
+    def test_single_command_writes_video_and_poster(self):
+        """One ffmpeg invocation reads the input once and maps both outputs."""
+        cmd = _build_ffmpeg_command("source.mov", "out.mp4", "out.jpg", encoder="libx264")
+
+        self.assertEqual(cmd[0], "ffmpeg")
+        self.assertEqual(cmd.count("-i"), 1)
+        self.assertIn("split=2", cmd[cmd.index("-filter_complex") + 1])
+        self.assertLess(cmd.index("[vout]"), cmd.index("out.mp4"))
+        self.assertLess(cmd.index("out.mp4"), cmd.index("[poster]"))
+        self.assertEqual(cmd[-1], "out.jpg")
+
+    def test_poster_scales_before_thumbnail_selection(self):
+        """The thumbnail filter analyses poster-sized frames, not full-resolution ones."""
+        cmd = _build_ffmpeg_command("source.mov", "out.mp4", "out.jpg", encoder="libx264")
+
+        self.assertIn("[p]scale=320:-2,thumbnail[poster]", cmd[cmd.index("-filter_complex") + 1])
+
+    def test_poster_written_at_final_quality(self):
+        """ffmpeg encodes the poster at its final JPEG quality, with no re-encode pass."""
+        cmd = _build_ffmpeg_command("source.mov", "out.mp4", "out.jpg", encoder="libx264")
+
+        poster_args = cmd[cmd.index("[poster]") :]
+        self.assertEqual(poster_args[poster_args.index("-q:v") + 1], POSTER_JPEG_QSCALE)
+
+    def test_uses_encoder_specific_arguments(self):
+        """Hardware encoders get their own rate-control flags instead of -crf."""
+        cmd = _build_ffmpeg_command("source.mov", "out.mp4", "out.jpg", encoder="h264_nvenc")
+
+        self.assertEqual(cmd[cmd.index("-c:v") + 1], "h264_nvenc")
+        self.assertIn("-cq", cmd)
+        self.assertEqual(cmd[cmd.index("-b:v") + 1], "0")
+        self.assertNotIn("-crf", cmd)
+
+    def test_detect_falls_back_to_libx264(self):
+        """Software encoding is used when the hardware test encode fails."""
+        detect_h264_encoder.cache_clear()
+        self.addCleanup(detect_h264_encoder.cache_clear)
+        with patch(
+            "flipfix.apps.core.transcoding.subprocess.run",
+            side_effect=subprocess.CalledProcessError(1, ["ffmpeg"]),
+        ):
+            self.assertEqual(detect_h264_encoder(), "libx264")
+
+    def test_detect_prefers_working_hardware_encoder(self):
+        """A hardware encoder is chosen when its test encode succeeds, and cached."""
+        detect_h264_encoder.cache_clear()
+        self.addCleanup(detect_h264_encoder.cache_clear)
+        with patch("flipfix.apps.core.transcoding.subprocess.run") as mock_run:
+            self.assertEqual(detect_h264_encoder(), "h264_nvenc")
+            self.assertEqual(detect_h264_encoder(), "h264_nvenc")
+        mock_run.assert_called_once()
+
+    def test_run_ffmpeg_rejects_untrusted_binary(self):
+        """Commands for binaries outside TRUSTED_BINARIES are refused before running."""
+        with patch("flipfix.apps.core.transcoding.subprocess.run") as mock_run:
+            with self.assertRaisesMessage(ValueError, "Untrusted binary: sh"):
+                _run_ffmpeg(["sh", "-c", "true"])
+        mock_run.assert_not_called()
+
+    def test_logged_command_is_shell_quoted(self):
+        """Logged ffmpeg commands are shell-quoted so they can be copy-pasted."""
+        logged = _LoggedCommand(["ffmpeg", "-i", "my video.mov", "-vf", "scale=320:-2"])
+
+        self.assertEqual(str(logged), "ffmpeg -i 'my video.mov' -vf scale=320:-2")
+
+    def test_parses_duration_from_stderr(self):
+        """Duration is read from ffmpeg's input banner."""
+        self.assertEqual(_parse_duration_seconds(FFMPEG_STDERR), 120)
+        self.assertEqual(_parse_duration_seconds("  Duration: 01:02:03.99, start: 0"), 3723)
+
+    def test_missing_duration_returns_none(self):
+        """Inputs without a parseable duration return None."""
+        self.assertIsNone(_parse_duration_seconds(""))
+        self.assertIsNone(_parse_duration_seconds("  Duration: N/A, bitrate: N/A"))
+
+
 @tag("tasks")
 class EnqueueTranscodeTests(TemporaryMediaMixin, TestCase):
     """Tests for enqueue_transcode helper."""
 
     def test_enqueue_transcode_invokes_async_task_with_media_id(self):
         """enqueue_transcode schedules async task with correct parameters."""
-        from flipfix.apps.core.transcoding import enqueue_transcode
-
         async_runner = Mock()
         enqueue_transcode(123, "LogEntryMedia", async_runner=async_runner)
 
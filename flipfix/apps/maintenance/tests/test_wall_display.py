@@ -18,9 +18,10 @@ from flipfix.apps.maintenance.models import ProblemReport, ProblemReportMedia
 class WallDisplaySetupViewTests(SuppressRequestLogsMixin, TestDataMixin, TestCase):
     """Tests for the wall display setup page (/wall/)."""
 
-    def setUp(self):
-        super().setUp()
-        self.url = reverse("wall-display-setup")
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.url = reverse("wall-display-setup")
 
     @override_config(PUBLIC_ACCESS_ENABLED=True)
     def test_accessible_to_guests_when_public_access_enabled(self):
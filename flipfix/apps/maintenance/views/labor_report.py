@@ -98,7 +98,7 @@ class LaborDetailView(TemplateView):
                 time_spent__gt=0,
             )
             .select_related("machine", "machine__model")
-            .prefetch_related("maintainers__user")
+            .prefetch_maintainers()
             .order_by("-occurred_at")
         )
 
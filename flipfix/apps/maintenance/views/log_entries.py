@@ -10,8 +10,8 @@ from django.conf import settings
 from django.contrib import messages
 from django.contrib.auth.views import redirect_to_login
 from django.core.exceptions import PermissionDenied
-from django.core.paginator import Paginator
 from django.db import transaction
+from django.db.models import Count, Q
 from django.http import JsonResponse
 from django.shortcuts import get_object_or_404, redirect
 from django.urls import reverse
@@ -23,8 +23,9 @@ from django.views.generic import DetailView, FormView, TemplateView, UpdateView
 
 from flipfix.apps.accounts.models import Maintainer
 from flipfix.apps.accounts.permissions import can_access_maintainer_portal
-from flipfix.apps.catalog.models import MachineInstance
+from flipfix.apps.catalog.models import MachineInstance, machine_detail_text_fields
 from flipfix.apps.catalog.view_helpers import resolve_selected_machine
+from flipfix.apps.core.attribution import get_current_maintainer
 from flipfix.apps.core.datetime import (
     apply_and_validate_timezone,
     parse_datetime_with_browser_timezone,
@@ -39,6 +40,7 @@ from flipfix.apps.core.mixins import (
     MediaUploadMixin,
     SharedAccountMixin,
 )
+from flipfix.apps.core.pagination import CountlessPaginator
 from flipfix.apps.maintenance.forms import LogEntryEditForm, LogEntryQuickForm
 from flipfix.apps.maintenance.models import (
     LogEntry,
@@ -57,7 +59,9 @@ def get_log_entry_queryset(search_query: str = ""):
     queryset = (
         LogEntry.objects.all()
         .select_related("machine", "machine__model", "problem_report")
-        .prefetch_related("maintainers__user", "media")
+        .defer(*machine_detail_text_fields("machine__"))
+        .prefetch_maintainers()
+        .prefetch_related("media")
         .search(search_query)
         .order_by("-occurred_at")
     )
@@ -227,7 +231,7 @@ class MachineLogCreateView(FormPrefillMixin, SharedAccountMixin, FormView):
         )
 
         # Handle empty maintainers based on account type
-        current_maintainer = get_object_or_404(Maintainer, user=self.request.user)
+        current_maintainer = get_current_maintainer(self.request)
         if not maintainers and not freetext_names:
             if current_maintainer.is_shared_account:
                 # Shared terminal: require explicit maintainer selection
@@ -336,21 +340,23 @@ class LogListView(TemplateView):
         search_query = self.request.GET.get("q", "").strip()
         logs = get_log_entry_queryset(search_query)
 
-        paginator = Paginator(logs, settings.LIST_PAGE_SIZE)
+        paginator = CountlessPaginator(logs, settings.LIST_PAGE_SIZE)
         page_obj = paginator.get_page(self.request.GET.get("page"))
 
-        # Stats for sidebar
+        # Stats for sidebar (single query with conditional aggregation)
         week_ago = datetime.now(UTC) - timedelta(days=7)
-        this_week_count = LogEntry.objects.filter(occurred_at__gte=week_ago).count()
-        total_count = LogEntry.objects.count()
+        log_counts = LogEntry.objects.aggregate(
+            total=Count("id"),
+            this_week=Count("id", filter=Q(occurred_at__gte=week_ago)),
+        )
 
         context.update(
             {
                 "page_obj": page_obj,
                 "log_entries": page_obj.object_list,
                 "search_form": SearchForm(initial={"q": search_query}),
-                "this_week_count": this_week_count,
-                "total_count": total_count,
+                "this_week_count": log_counts["this_week"],
+                "total_count": log_counts["total"],
                 "meta_description": (
                     "Maintenance logs for pinball machines at The Flip,"
                     " Chicago's playable pinball museum."
@@ -378,8 +384,10 @@ class LogEntryDetailView(InlineTextEditMixin, MediaUploadMixin, DetailView):
     context_object_name = "entry"
 
     def get_queryset(self):
-        return LogEntry.objects.select_related("machine").prefetch_related(
-            "maintainers__user", "media"
+        return (
+            LogEntry.objects.select_related("machine")
+            .prefetch_maintainers()
+            .prefetch_related("media")
         )
 
     def get_media_model(self):
@@ -662,13 +670,13 @@ class LogEntryEditView(UpdateView):
             "machine",
             "machine__model",
             "problem_report",
-        ).prefetch_related("maintainers__user")
+        ).prefetch_maintainers()
 
     def get_initial(self):
         initial = super().get_initial()
         # Pre-fill maintainer_name with current maintainer(s)
-        if self.object.maintainers.exists():
-            initial["maintainer_name"] = ", ".join(str(m) for m in self.object.maintainers.all())
+        if self.object.maintainers_list:
+            initial["maintainer_name"] = ", ".join(str(m) for m in self.object.maintainers_list)
         elif self.object.maintainer_names:
             initial["maintainer_name"] = self.object.maintainer_names
         return initial
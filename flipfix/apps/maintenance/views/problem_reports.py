@@ -9,6 +9,7 @@ from django.conf import settings
 from django.contrib import messages
 from django.core.paginator import Paginator
 from django.db import transaction
+from django.db.models import prefetch_related_objects
 from django.http import Http404, JsonResponse
 from django.shortcuts import get_object_or_404, redirect
 from django.template.loader import render_to_string
@@ -19,10 +20,10 @@ from django.utils.text import Truncator
 from django.views import View
 from django.views.generic import DetailView, FormView, TemplateView, UpdateView
 
-from flipfix.apps.accounts.models import Maintainer
 from flipfix.apps.catalog.models import Location, MachineInstance
 from flipfix.apps.catalog.view_helpers import resolve_selected_machine
 from flipfix.apps.core.attribution import (
+    get_current_maintainer,
     resolve_maintainer_for_create,
     resolve_maintainer_for_edit,
 )
@@ -48,6 +49,7 @@ from flipfix.apps.maintenance.models import (
     LogEntry,
     ProblemReport,
     ProblemReportMedia,
+    log_entry_maintainers_prefetch,
 )
 from flipfix.apps.maintenance.status_rules import (
     enforce_unplayable_breaks_machine,
@@ -92,7 +94,8 @@ class ProblemReportLogEntriesPartialView(InfiniteScrollMixin, View):
             LogEntry.objects.filter(problem_report=problem_report)
             .search_for_problem_report(self.request.GET.get("q", ""))
             .select_related("machine")
-            .prefetch_related("maintainers__user", "media")
+            .prefetch_maintainers()
+            .prefetch_related("media")
             .order_by("-occurred_at")
         )
 
@@ -210,7 +213,7 @@ class ProblemReportCreateView(FormPrefillMixin, SharedAccountMixin, FormView):
                 return self.form_invalid(form)
 
         # Resolve reporter attribution
-        current_maintainer = get_object_or_404(Maintainer, user=self.request.user)
+        current_maintainer = get_current_maintainer(self.request)
         attribution = resolve_maintainer_for_create(
             self.request,
             current_maintainer,
@@ -284,7 +287,8 @@ class ProblemReportDetailView(InlineTextEditMixin, MediaUploadMixin, DetailView)
             LogEntry.objects.filter(problem_report=self.object)
             .search_for_problem_report(search_query)
             .select_related("machine")
-            .prefetch_related("maintainers__user", "media")
+            .prefetch_maintainers()
+            .prefetch_related("media")
             .order_by("-occurred_at")
         )
         paginator = Paginator(log_entries, settings.LIST_PAGE_SIZE)
@@ -418,6 +422,9 @@ class ProblemReportDetailView(InlineTextEditMixin, MediaUploadMixin, DetailView)
             return JsonResponse({"success": True, "status": "noop"})
 
         log_entry = self._change_report_status(new_status, request.user)
+        # Batch the timeline partial's lookups (maintainers with users, media)
+        # instead of letting each lazy-load during render.
+        prefetch_related_objects([log_entry], log_entry_maintainers_prefetch(), "media")
 
         log_entry_html = render_to_string(
             "maintenance/partials/problem_report_log_entry.html",
@@ -491,7 +498,7 @@ class ProblemReportDetailView(InlineTextEditMixin, MediaUploadMixin, DetailView)
                 text=log_text,
                 created_by=user,
             )
-            maintainer = Maintainer.objects.filter(user=user).first()
+            maintainer = getattr(user, "maintainer", None)
             if maintainer:
                 log_entry.maintainers.add(maintainer)
 
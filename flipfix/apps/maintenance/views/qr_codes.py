@@ -5,7 +5,7 @@ from __future__ import annotations
 from django.urls import reverse
 from django.views.generic import DetailView, TemplateView
 
-from flipfix.apps.catalog.models import MachineInstance
+from flipfix.apps.catalog.models import MachineInstance, machine_detail_text_fields
 from flipfix.apps.core.qr import QR_BOX_SIZE_BULK, generate_qr_code_base64
 
 
@@ -39,7 +39,7 @@ class MachineBulkQRCodeView(TemplateView):
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        machines = MachineInstance.objects.visible()
+        machines = MachineInstance.objects.visible().defer(*machine_detail_text_fields())
         qr_entries = []
 
         for machine in machines:
@@ -23,20 +23,16 @@ class PartsConfig(AppConfig):
 
     @staticmethod
     def _register_feed_sources():
-        from django.db.models import Prefetch
-
+        from flipfix.apps.accounts.models import user_account_fields
         from flipfix.apps.core.feed import FeedEntrySource, register_feed_source
 
-        from .models import PartRequest, PartRequestUpdate
+        from .models import PartRequest, PartRequestUpdate, latest_update_prefetch
 
         def _part_request_queryset():
-            latest_update_prefetch = Prefetch(
-                "updates",
-                queryset=PartRequestUpdate.objects.order_by("-occurred_at"),
-                to_attr="prefetched_updates",
-            )
-            return PartRequest.objects.select_related("requested_by__user").prefetch_related(
-                "media", latest_update_prefetch
+            return (
+                PartRequest.objects.select_related("requested_by__user")
+                .defer(*user_account_fields("requested_by__user__"))
+                .prefetch_related("media", latest_update_prefetch())
             )
 
         def _part_request_update_queryset():
@@ -0,0 +1,44 @@
+"""Trigram GIN indexes for part request search (Postgres only).
+
+Part request search matches ``text__icontains`` on requests and their
+updates, which Django compiles to ``UPPER("text"::text) LIKE UPPER('%q%')``
+on Postgres.  A leading wildcard can't use a btree, so each index is a
+``gin_trgm_ops`` expression index on ``UPPER(text)`` — the exact expression
+the lookup produces — letting the planner bitmap-scan instead of reading
+every row.
+
+SQLite (local dev, tests, PR environments) has no pg_trgm, so both directions
+are no-ops there.  Kept out of ``Meta.indexes`` for the same reason.
+"""
+
+from django.db import migrations
+
+INDEXES = {
+    "parts_pr_text_upper_trgm": "parts_partrequest",
+    "parts_pru_text_upper_trgm": "parts_partrequestupdate",
+}
+
+
+def forward(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for name, table in INDEXES.items():
+        schema_editor.execute(
+            f"CREATE INDEX IF NOT EXISTS {name} ON {table} USING gin (UPPER(text) gin_trgm_ops)"
+        )
+
+
+def reverse(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for name in INDEXES:
+        schema_editor.execute(f"DROP INDEX IF EXISTS {name}")
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("parts", "0009_historicalpartrequest_historicalpartrequestupdate"),
+    ]
+
+    operations = [migrations.RunPython(forward, reverse)]
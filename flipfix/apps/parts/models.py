@@ -5,12 +5,13 @@ from __future__ import annotations
 from uuid import uuid4
 
 from django.db import models, transaction
+from django.db.models import Prefetch
 from django.urls import reverse
 from django.utils import timezone
 from simple_history.models import HistoricalRecords
 
-from flipfix.apps.accounts.models import Maintainer
-from flipfix.apps.catalog.models import MachineInstance
+from flipfix.apps.accounts.models import Maintainer, user_account_fields
+from flipfix.apps.catalog.models import MachineInstance, machine_detail_text_fields
 from flipfix.apps.core.models import AbstractMedia, SearchableQuerySetMixin, TimeStampedMixin
 
 
@@ -25,6 +26,18 @@ class PartRequestQuerySet(SearchableQuerySetMixin, models.QuerySet):
         """Return part requests that are requested or ordered (not yet received)."""
         return self.filter(status__in=[PartRequest.Status.REQUESTED, PartRequest.Status.ORDERED])
 
+    def for_list_display(self):
+        """Defer columns list cards never render.
+
+        Drops the requester's account columns and the machine's long-form
+        text; callers must select_related ``requested_by__user`` and
+        ``machine__model``.
+        """
+        return self.defer(
+            *user_account_fields("requested_by__user__"),
+            *machine_detail_text_fields("machine__"),
+        )
+
     def _build_text_and_requester_q(self, query: str):
         """Build Q object for text and requester name search."""
         return (
@@ -37,14 +50,21 @@ class PartRequestQuerySet(SearchableQuerySetMixin, models.QuerySet):
         )
 
     def _build_update_q(self, query: str):
-        """Build Q object for searching linked updates."""
-        return (
-            models.Q(updates__text__icontains=query)
-            | models.Q(updates__posted_by__user__username__icontains=query)
-            | models.Q(updates__posted_by__user__first_name__icontains=query)
-            | models.Q(updates__posted_by__user__last_name__icontains=query)
-            | models.Q(updates__posted_by_name__icontains=query)
+        """Build Q object for searching linked updates.
+
+        An ``EXISTS`` subquery rather than a join through ``updates``: a
+        request with several matching updates still comes back as one row,
+        so searches that use this need no ``DISTINCT``.
+        """
+        matching_updates = PartRequestUpdate.objects.filter(
+            models.Q(text__icontains=query)
+            | models.Q(posted_by__user__username__icontains=query)
+            | models.Q(posted_by__user__first_name__icontains=query)
+            | models.Q(posted_by__user__last_name__icontains=query)
+            | models.Q(posted_by_name__icontains=query),
+            part_request=models.OuterRef("pk"),
         )
+        return models.Q(models.Exists(matching_updates))
 
     def search(self, query: str = ""):
         """
@@ -63,6 +83,7 @@ class PartRequestQuerySet(SearchableQuerySetMixin, models.QuerySet):
             | models.Q(machine__model__name__icontains=query)
             | models.Q(machine__name__icontains=query)
             | self._build_update_q(query),
+            distinct=False,
         )
 
     def search_for_machine(self, query: str = ""):
@@ -80,6 +101,7 @@ class PartRequestQuerySet(SearchableQuerySetMixin, models.QuerySet):
         return self._apply_search(
             query,
             self._build_text_and_requester_q(query) | self._build_update_q(query),
+            distinct=False,
         )
 
 
@@ -186,7 +208,11 @@ class PartRequestMedia(AbstractMedia):
 
 
 class PartRequestUpdateQuerySet(SearchableQuerySetMixin, models.QuerySet):
-    """Custom queryset for PartRequestUpdate model."""
+    """Custom queryset for PartRequestUpdate model.
+
+    Every search here follows forward foreign keys only (poster, parent
+    request, machine), which can't fan out rows, so none needs ``DISTINCT``.
+    """
 
     def _build_text_and_poster_q(self, query: str):
         """Build Q object for text and poster name search."""
@@ -226,6 +252,7 @@ class PartRequestUpdateQuerySet(SearchableQuerySetMixin, models.QuerySet):
         return self._apply_search(
             query,
             self._build_text_and_poster_q(query) | self._build_part_request_q(query),
+            distinct=False,
         )
 
     def search_for_part_request(self, query: str = ""):
@@ -242,6 +269,7 @@ class PartRequestUpdateQuerySet(SearchableQuerySetMixin, models.QuerySet):
         return self._apply_search(
             query,
             self._build_text_and_poster_q(query),
+            distinct=False,
         )
 
     def search(self, query: str = ""):
@@ -260,6 +288,7 @@ class PartRequestUpdateQuerySet(SearchableQuerySetMixin, models.QuerySet):
         return self._apply_search(
             query,
             self._build_text_and_poster_q(query) | self._build_part_request_q(query) | machine_q,
+            distinct=False,
         )
 
 
@@ -333,6 +362,22 @@ class PartRequestUpdate(TimeStampedMixin):
             super().save(*args, **kwargs)
 
 
+def latest_update_prefetch() -> Prefetch:
+    """Prefetch each request's newest update into ``prefetched_updates``.
+
+    Cards only render ``prefetched_updates.0``, so the prefetch is sliced to
+    one row per request (a ``ROW_NUMBER()`` window filter) and projected to
+    the columns the snippet shows, instead of loading every update's history.
+    """
+    return Prefetch(
+        "updates",
+        queryset=PartRequestUpdate.objects.only("part_request", "text", "occurred_at").order_by(
+            "-occurred_at"
+        )[:1],
+        to_attr="prefetched_updates",
+    )
+
+
 def part_request_update_media_upload_to(instance: PartRequestUpdateMedia, filename: str) -> str:
     """Generate upload path for part request update media."""
     return f"part_request_updates/{instance.update_id}/{uuid4()}-{filename}"
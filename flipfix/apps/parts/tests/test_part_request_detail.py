@@ -1,7 +1,9 @@
 """Tests for part request detail view and AJAX endpoints."""
 
 from django.contrib.contenttypes.models import ContentType
+from django.db import connection
 from django.test import TestCase, tag
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
 from flipfix.apps.core.models import RecordReference
@@ -128,6 +130,21 @@ class PartRequestDetailViewTextUpdateTests(SuppressRequestLogsMixin, TestDataMix
         self.part_request.refresh_from_db()
         self.assertEqual(self.part_request.text, "Updated description")
 
+    def test_update_text_skips_display_joins(self):
+        """AJAX actions load the bare row, not the machine joins and media prefetch."""
+        self.client.force_login(self.maintainer_user)
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.post(
+                self.detail_url,
+                {"action": "update_text", "text": "Updated description"},
+            )
+
+        self.assertEqual(response.status_code, 200)
+        sql = [q["sql"] for q in ctx.captured_queries]
+        self.assertFalse([q for q in sql if 'FROM "parts_partrequestmedia"' in q])
+        self.assertFalse([q for q in sql if 'JOIN "catalog_machineinstance"' in q])
+
     def test_update_text_empty(self):
         """AJAX endpoint allows empty text."""
         self.client.force_login(self.maintainer_user)
@@ -1,6 +1,8 @@
 """Tests for part request list view and search functionality."""
 
+from django.db import connection
 from django.test import TestCase, tag
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
 from flipfix.apps.core.test_utils import (
@@ -48,6 +50,41 @@ class PartRequestListViewTests(SuppressRequestLogsMixin, TestDataMixin, TestCase
         response = self.client.get(reverse("part-request-list"))
         self.assertContains(response, "Flipper rubbers")
 
+    def test_list_view_paginates_without_count(self):
+        """Infinite scroll only needs has_next, so the list runs no paginator COUNT(*)."""
+        self.client.force_login(self.maintainer_user)
+        create_part_request(text="Flipper rubbers", machine=self.machine)
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(reverse("part-request-list"))
+
+        self.assertFalse(response.context["page_obj"].has_next())
+        self.assertFalse([q["sql"] for q in ctx.captured_queries if '"__count"' in q["sql"]])
+
+    def test_list_view_defers_unrendered_columns(self):
+        """Cards skip requester account and machine long-form text columns."""
+        self.client.force_login(self.maintainer_user)
+        part_request = create_part_request(
+            text="Flipper rubbers", requested_by=self.maintainer, machine=self.machine
+        )
+        PartRequestUpdate.objects.create(
+            part_request=part_request, posted_by=self.maintainer, text="Ordered from Marco"
+        )
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(reverse("part-request-list"))
+
+        self.assertContains(response, "Ordered from Marco")
+        list_sql = next(
+            q["sql"] for q in ctx.captured_queries if 'FROM "parts_partrequest"' in q["sql"]
+        )
+        self.assertNotIn('"auth_user"."password"', list_sql)
+        self.assertNotIn('"acquisition_notes"', list_sql)
+        update_sql = next(
+            q["sql"] for q in ctx.captured_queries if 'FROM "parts_partrequestupdate"' in q["sql"]
+        )
+        self.assertNotIn('"new_status"', update_sql)
+
 
 @tag("views")
 class PartRequestListFilterTests(SuppressRequestLogsMixin, TestDataMixin, TestCase):
@@ -20,9 +20,10 @@ from flipfix.apps.parts.models import PartRequest, PartRequestMedia
 class PartRequestMediaCreateTests(TemporaryMediaMixin, TestDataMixin, TestCase):
     """Tests for media upload on part request create page."""
 
-    def setUp(self):
-        super().setUp()
-        self.create_url = reverse("part-request-create")
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.create_url = reverse("part-request-create")
 
     def test_create_with_media_upload(self):
         """Maintainer can upload media when creating a part request."""
@@ -13,6 +13,7 @@ from flipfix.apps.core.test_utils import (
 from flipfix.apps.parts.models import (
     PartRequest,
     PartRequestUpdate,
+    latest_update_prefetch,
 )
 
 
@@ -388,3 +389,24 @@ class PartRequestUpdateHistoryTests(TestDataMixin, TestCase):
         # Previous entry should have the old text
         previous = update.history.all()[1]
         self.assertEqual(previous.text, "Original text")
+
+
+@tag("models")
+class LatestUpdatePrefetchTests(TestDataMixin, TestCase):
+    """Tests for latest_update_prefetch()."""
+
+    def test_prefetches_only_latest_update(self):
+        """Each request carries just its newest update, not its full history."""
+        part_request = create_part_request(requested_by=self.maintainer)
+        now = timezone.now()
+        for days_ago, text in ((2, "Oldest"), (0, "Newest"), (1, "Middle")):
+            create_part_request_update(
+                part_request=part_request,
+                posted_by=self.maintainer,
+                text=text,
+                occurred_at=now - timedelta(days=days_ago),
+            )
+
+        (loaded,) = PartRequest.objects.prefetch_related(latest_update_prefetch())
+
+        self.assertEqual([u.text for u in loaded.prefetched_updates], ["Newest"])
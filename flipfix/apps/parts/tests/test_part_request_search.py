@@ -65,6 +65,40 @@ class PartRequestSearchUsernameTests(TestDataMixin, TestCase):
         self.assertEqual(results[0], matching)
 
 
+@tag("models")
+class PartRequestSearchLinkedUpdateTests(TestDataMixin, TestCase):
+    """Tests for matching PartRequest through its updates."""
+
+    def test_request_with_several_matching_updates_returned_once(self):
+        """Updates match via EXISTS, so no DISTINCT is needed to avoid duplicates."""
+        part_request = create_part_request(machine=self.machine, text="Need a coil")
+        for text in ("Ordered from Marco", "Marco says backordered"):
+            create_part_request_update(part_request=part_request, text=text)
+        create_part_request(machine=self.machine, text="Need a bulb")
+
+        for method in ("search", "search_for_machine"):
+            queryset = getattr(PartRequest.objects, method)("marco")
+            with self.subTest(method=method):
+                self.assertFalse(queryset.query.distinct)
+                self.assertEqual(list(queryset), [part_request])
+
+
+@tag("models")
+class PartRequestUpdateSearchDistinctTests(TestDataMixin, TestCase):
+    """Update searches span only forward FKs, so they skip DISTINCT."""
+
+    def test_update_searches_are_not_distinct(self):
+        """Each matching update comes back once without de-duplication."""
+        part_request = create_part_request(machine=self.machine, text="Marco coil")
+        matching = create_part_request_update(part_request=part_request, text="Ordered from Marco")
+
+        for method in ("search", "search_for_machine", "search_for_part_request"):
+            queryset = getattr(PartRequestUpdate.objects, method)("marco")
+            with self.subTest(method=method):
+                self.assertFalse(queryset.query.distinct)
+                self.assertEqual(list(queryset), [matching])
+
+
 @tag("models")
 class PartRequestUpdateSearchUsernameTests(TestDataMixin, TestCase):
     """Tests for username search in PartRequestUpdate.
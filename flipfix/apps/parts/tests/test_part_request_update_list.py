@@ -34,17 +34,15 @@ class PartRequestUpdatesPartialViewTests(SuppressRequestLogsMixin, TestDataMixin
         response = self.client.get(self.partial_url)
         self.assertEqual(response.status_code, 403)
 
-    def test_partial_view_returns_json(self):
-        """Partial view returns JSON with items, has_next, next_page."""
+    def test_partial_view_returns_html(self):
+        """Partial view returns an HTML fragment, with no next page when empty."""
         self.client.force_login(self.maintainer_user)
 
         response = self.client.get(self.partial_url)
 
         self.assertEqual(response.status_code, 200)
-        json_data = response.json()
-        self.assertIn("items", json_data)
-        self.assertIn("has_next", json_data)
-        self.assertIn("next_page", json_data)
+        self.assertEqual(response["Content-Type"], "text/html; charset=utf-8")
+        self.assertNotIn("X-Next-Page", response)
 
     def test_partial_view_items_contain_update_content(self):
         """Items HTML includes update text and poster."""
@@ -57,10 +55,8 @@ class PartRequestUpdatesPartialViewTests(SuppressRequestLogsMixin, TestDataMixin
         self.client.force_login(self.maintainer_user)
         response = self.client.get(self.partial_url)
 
-        self.assertEqual(response.status_code, 200)
-        json_data = response.json()
-        self.assertIn("Unique update content here", json_data["items"])
-        self.assertIn(str(self.maintainer), json_data["items"])
+        self.assertContains(response, "Unique update content here")
+        self.assertContains(response, str(self.maintainer))
 
     def test_partial_view_page_size(self):
         """Returns exactly 10 items per page."""
@@ -76,11 +72,9 @@ class PartRequestUpdatesPartialViewTests(SuppressRequestLogsMixin, TestDataMixin
         response = self.client.get(self.partial_url)
 
         self.assertEqual(response.status_code, 200)
-        json_data = response.json()
 
-        # First page should have has_next=True with 15 total items and page size 10
-        self.assertTrue(json_data["has_next"])
-        self.assertEqual(json_data["next_page"], 2)
+        # First page should point at page 2 with 15 total items and page size 10
+        self.assertEqual(response["X-Next-Page"], "2")
 
     def test_partial_view_paginates(self):
         """Respects page parameter, page 2 gets remaining items."""
@@ -96,11 +90,9 @@ class PartRequestUpdatesPartialViewTests(SuppressRequestLogsMixin, TestDataMixin
         response = self.client.get(self.partial_url, {"page": 2})
 
         self.assertEqual(response.status_code, 200)
-        json_data = response.json()
 
-        # Second page should have has_next=False (5 remaining items)
-        self.assertFalse(json_data["has_next"])
-        self.assertIsNone(json_data["next_page"])
+        # Second page holds the 5 remaining items, so there is no next page
+        self.assertNotIn("X-Next-Page", response)
 
     def test_partial_view_search_filters(self):
         """Search query filters results."""
@@ -118,9 +110,6 @@ class PartRequestUpdatesPartialViewTests(SuppressRequestLogsMixin, TestDataMixin
         self.client.force_login(self.maintainer_user)
         response = self.client.get(self.partial_url, {"q": "Marco"})
 
-        self.assertEqual(response.status_code, 200)
-        json_data = response.json()
-
         # Should only find the Marco update
-        self.assertIn("Marco", json_data["items"])
-        self.assertNotIn("Received shipment", json_data["items"])
+        self.assertContains(response, "Marco")
+        self.assertNotContains(response, "Received shipment")
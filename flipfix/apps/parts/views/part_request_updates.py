@@ -11,8 +11,8 @@ from django.utils.html import format_html
 from django.utils.text import Truncator
 from django.views.generic import DetailView, FormView, UpdateView
 
-from flipfix.apps.accounts.models import Maintainer
 from flipfix.apps.core.attribution import (
+    get_current_maintainer,
     resolve_maintainer_for_create,
     resolve_maintainer_for_edit,
 )
@@ -64,7 +64,7 @@ class PartRequestUpdateCreateView(SharedAccountMixin, FormView):
     @transaction.atomic
     def form_valid(self, form):
         # Resolve poster attribution
-        current_maintainer = get_object_or_404(Maintainer, user=self.request.user)
+        current_maintainer = get_current_maintainer(self.request)
         attribution = resolve_maintainer_for_create(
             self.request,
             current_maintainer,
@@ -148,7 +148,9 @@ class PartRequestUpdateDetailView(InlineTextEditMixin, MediaUploadMixin, DetailV
         return context
 
     def post(self, request, *args, **kwargs):
-        self.object = self.get_object()
+        # AJAX actions only touch the row itself and its media, so skip the
+        # display joins and media prefetch from get_queryset().
+        self.object = self.get_object(PartRequestUpdate.objects.all())
         action = request.POST.get("action")
 
         action_handlers = {
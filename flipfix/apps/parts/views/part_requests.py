@@ -6,7 +6,7 @@ from django.conf import settings
 from django.contrib import messages
 from django.core.paginator import Paginator
 from django.db import transaction
-from django.db.models import Count, Prefetch, Q
+from django.db.models import Count, Q
 from django.http import JsonResponse
 from django.shortcuts import get_object_or_404, redirect
 from django.template.loader import render_to_string
@@ -15,10 +15,11 @@ from django.utils.html import format_html
 from django.utils.text import Truncator
 from django.views.generic import DetailView, FormView, TemplateView, UpdateView, View
 
-from flipfix.apps.accounts.models import Maintainer
+from flipfix.apps.accounts.models import user_account_fields
 from flipfix.apps.catalog.models import MachineInstance
 from flipfix.apps.catalog.view_helpers import resolve_selected_machine
 from flipfix.apps.core.attribution import (
+    get_current_maintainer,
     resolve_maintainer_for_create,
     resolve_maintainer_for_edit,
 )
@@ -33,6 +34,7 @@ from flipfix.apps.core.mixins import (
     MediaUploadMixin,
     SharedAccountMixin,
 )
+from flipfix.apps.core.pagination import CountlessPaginator
 from flipfix.apps.core.url_utils import build_filter_url
 from flipfix.apps.parts.forms import (
     PartRequestEditForm,
@@ -42,18 +44,10 @@ from flipfix.apps.parts.models import (
     PartRequest,
     PartRequestMedia,
     PartRequestUpdate,
+    latest_update_prefetch,
 )
 
 
-def _latest_update_prefetch():
-    """Prefetch for ordering updates by most recent."""
-    return Prefetch(
-        "updates",
-        queryset=PartRequestUpdate.objects.order_by("-occurred_at"),
-        to_attr="prefetched_updates",
-    )
-
-
 class PartRequestListView(TemplateView):
     """List of all part requests. Maintainer-only access."""
 
@@ -68,14 +62,15 @@ class PartRequestListView(TemplateView):
         parts = (
             PartRequest.objects.search(search_query)
             .select_related("requested_by__user", "machine", "machine__model")
-            .prefetch_related("media", _latest_update_prefetch())
+            .for_list_display()
+            .prefetch_related("media", latest_update_prefetch())
             .order_by("-occurred_at")
         )
 
         if status_filter:
             parts = parts.filter(status=status_filter)
 
-        paginator = Paginator(parts, settings.LIST_PAGE_SIZE)
+        paginator = CountlessPaginator(parts, settings.LIST_PAGE_SIZE)
         page_obj = paginator.get_page(self.request.GET.get("page"))
 
         # Stats from unfiltered counts (single query with conditional aggregation)
@@ -147,7 +142,8 @@ class PartRequestListPartialView(InfiniteScrollMixin, View):
         qs = (
             PartRequest.objects.search(search_query)
             .select_related("requested_by__user", "machine", "machine__model")
-            .prefetch_related("media", _latest_update_prefetch())
+            .for_list_display()
+            .prefetch_related("media", latest_update_prefetch())
             .order_by("-occurred_at")
         )
         if status_filter in PartRequest.Status.values:
@@ -193,7 +189,7 @@ class PartRequestCreateView(FormPrefillMixin, SharedAccountMixin, FormView):
                 machine = MachineInstance.objects.filter(slug=slug).first()
 
         # Resolve requester attribution
-        current_maintainer = get_object_or_404(Maintainer, user=self.request.user)
+        current_maintainer = get_current_maintainer(self.request)
         attribution = resolve_maintainer_for_create(
             self.request,
             current_maintainer,
@@ -259,6 +255,7 @@ class PartRequestDetailView(InlineTextEditMixin, MediaUploadMixin, DetailView):
             PartRequestUpdate.objects.filter(part_request=self.object)
             .search_for_part_request(search_query)
             .select_related("posted_by__user")
+            .defer(*user_account_fields("posted_by__user__"))
             .prefetch_related("media")
             .order_by("-occurred_at")
         )
@@ -275,7 +272,9 @@ class PartRequestDetailView(InlineTextEditMixin, MediaUploadMixin, DetailView):
         return context
 
     def post(self, request, *args, **kwargs):
-        self.object = self.get_object()
+        # AJAX actions only touch the row itself and its media, so skip the
+        # display joins and media prefetch from get_queryset().
+        self.object = self.get_object(PartRequest.objects.all())
         action = request.POST.get("action")
 
         action_handlers = {
@@ -359,6 +358,7 @@ class PartRequestUpdatesPartialView(InfiniteScrollMixin, View):
             PartRequestUpdate.objects.filter(part_request=part_request)
             .search_for_part_request(search_query)
             .select_related("posted_by__user")
+            .defer(*user_account_fields("posted_by__user__"))
             .prefetch_related("media")
             .order_by("-occurred_at")
         )
@@ -399,7 +399,7 @@ class PartRequestStatusUpdateView(View):
         new_display = PartRequest.Status(new_status).label
 
         # Get the maintainer for the current user
-        maintainer = get_object_or_404(Maintainer, user=request.user)
+        maintainer = get_current_maintainer(request)
 
         # Create an update that will cascade the status change
         update = PartRequestUpdate.objects.create(
@@ -1,4 +1,5 @@
 import os
+from typing import Any, cast
 
 import dj_database_url
 
@@ -11,12 +12,22 @@ from .base import *  # noqa
 DEBUG = False
 SITE_URL = "http://testserver"
 PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
+TEST_RUNNER = "flipfix.apps.core.test_utils.FlipfixTestRunner"
 
 # Use DATABASE_URL if provided (CI uses Postgres), otherwise SQLite for local dev
 DATABASES["default"] = dj_database_url.config(  # type: ignore[assignment]
     default="sqlite://:memory:",
     conn_max_age=600,
 )
+if DATABASES["default"]["ENGINE"] == "django.db.backends.postgresql":
+    # Don't wait for WAL flushes on commit; durability doesn't matter for a throwaway test DB.
+    # (fsync is server-wide and can't be set per connection.)
+    pg_options = cast(dict[str, Any], DATABASES["default"].setdefault("OPTIONS", {}))
+    pg_options["options"] = "-c synchronous_commit=off"
+elif DATABASES["default"]["ENGINE"] == "django.db.backends.sqlite3":
+    # Same idea for the file-backed --keepdb test DB (a no-op for :memory:).
+    sqlite_options = cast(dict[str, Any], DATABASES["default"].setdefault("OPTIONS", {}))
+    sqlite_options["init_command"] = "PRAGMA synchronous=OFF; PRAGMA journal_mode=MEMORY"
 
 # Suppress noisy Django-Q logging during tests
 Q_CLUSTER["log_level"] = "WARNING"  # type: ignore[name-defined]  # noqa: F405
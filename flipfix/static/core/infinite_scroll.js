@@ -41,11 +41,21 @@ document.addEventListener('DOMContentLoaded', () => {
       headers: { 'X-Requested-With': 'XMLHttpRequest' },
       credentials: 'same-origin',
     })
-      .then((response) => response.json())
-      .then((data) => {
-        if (data.items) {
+      .then((response) => {
+        if (!response.ok) throw new Error(`HTTP ${response.status}`);
+        // fetch follows redirects, so an expired session arrives as the login
+        // page with a 200. Only accept responses marked as scroll fragments.
+        if (response.redirected || !response.headers.has('X-Scroll-Page')) {
+          throw new Error('Response is not a scroll page');
+        }
+        // The body is the rendered items; X-Next-Page is absent on the last page.
+        nextPage = Number(response.headers.get('X-Next-Page') || '0');
+        return response.text();
+      })
+      .then((html) => {
+        if (html.trim()) {
           const fragment = document.createElement('div');
-          fragment.innerHTML = data.items;
+          fragment.innerHTML = html;
           Array.from(fragment.children).forEach((node) => {
             list.appendChild(node);
             const event = new CustomEvent('card:initialize', { detail: node });
@@ -55,10 +65,7 @@ document.addEventListener('DOMContentLoaded', () => {
             applySmartDates(list);
           }
         }
-        if (data.has_next) {
-          nextPage = data.next_page;
-        } else {
-          nextPage = 0;
+        if (nextPage === 0) {
           observer.unobserve(sentinel);
           sentinel.remove();
         }